@@ -0,0 +1,291 @@
+// coverage/core/cmplog.js
+//
+// CmpLog 식 비교 피연산자 수집. 필터가 비교하는 매직 문자열을 변이 사전(mutator.py add_tokens)으로 돌려준다.
+//   정적 : 하네스 소스에서 `===` `!==` `==` `!=` 양쪽과 `case` 뒤의 문자열/숫자 리터럴,
+//          includes/startsWith/endsWith/indexOf/lastIndexOf 의 첫 인자 리터럴,
+//          정규식 리터럴(과 new RegExp('...'))에서 고정된 글자 구간을 모은다 (instrument.js 와 같은 토큰 규칙)
+//   동적 : String.prototype.includes/startsWith/endsWith/indexOf/lastIndexOf 와 RegExp.prototype.test 를 감싸
+//          하네스 함수를 실행하는 동안(armed)만 검색 문자열과 정규식의 고정 구간을 모은다.
+//          node 내부 모듈은 primordials 를 쓰므로 여기에 잡히지 않는다
+// `===` 와 switch 의 동적 피연산자는 소스를 다시 쓰지 않으면 알 수 없어 리터럴만 모은다.
+
+const { isIdentStart, isIdentPart, skipString, scanTemplate, skipRegex, REGEX_KEYWORDS, KEYWORDS } = require('./instrument');
+
+const STRING_METHODS = ['includes', 'startsWith', 'endsWith', 'indexOf', 'lastIndexOf'];
+const COMPARE_OPS = new Set(['===', '!==', '==', '!=']);
+const MAX_OPERAND = 64;
+const MAX_TOKENS = 512;
+const CLASS_SAMPLES = { d: '0', w: 'a', s: ' ' };
+
+// '...' / "..." / `...` 리터럴의 내용을 되살린다 (흔한 escape 만)
+function decodeString(raw) {
+    const body = raw.slice(1, raw.endsWith(raw[0]) && raw.length > 1 ? -1 : undefined);
+    return body.replace(/\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r?\n|[\s\S])/g, (m, e) => {
+        if (e[0] === 'u' || e[0] === 'x') return String.fromCodePoint(parseInt(e.replace(/[ux{}]/g, ''), 16));
+        if (e === '\n' || e === '\r\n') return '';
+        return { n: '\n', r: '\r', t: '\t', b: '\b', f: '\f', v: '\v', 0: '\0' }[e] ?? e;
+    });
+}
+
+// source[i] 의 '[' 로 시작하는 문자 클래스의 ']' 위치
+function classEnd(source, i) {
+    for (i++; i < source.length && source[i] !== ']'; i++) if (source[i] === '\\') i++;
+    return i;
+}
+
+// source[open] 의 '(' 와 짝인 ')' 의 위치 (없으면 끝)
+function groupEnd(source, open) {
+    let depth = 0;
+    for (let i = open; i < source.length; i++) {
+        const ch = source[i];
+        if (ch === '\\') i++;
+        else if (ch === '[') i = classEnd(source, i);
+        else if (ch === '(') depth++;
+        else if (ch === ')' && --depth === 0) return i;
+    }
+    return source.length;
+}
+
+// source[open] 의 '(' 가 선택지(|) 없이 정확히 한 번 나오는 그룹인지
+function plainGroup(source, open) {
+    const end = groupEnd(source, open);
+    if (end >= source.length || /[*?{]/.test(source[end + 1] || '')) return false;
+    for (let i = open + 1; i < end; i++) {
+        const ch = source[i];
+        if (ch === '\\') i++;
+        else if (ch === '[') i = classEnd(source, i);
+        else if (ch === '(') i = groupEnd(source, i);
+        else if (ch === '|') return false;
+    }
+    return true;
+}
+
+// 정규식 본문에서 그대로 나와야 하는 2글자 이상 구간들 (/^(GET|POST) \/api/ -> GET, POST, " /api")
+function regexLiterals(source) {
+    const out = [];
+    // 열린 그룹마다 plainGroup 여부 (아니면 ')' 에서 구간을 끊는다)
+    const groups = [];
+    let run = '';
+    const flush = () => {
+        if (run.length >= 2) out.push(run);
+        run = '';
+    };
+    for (let i = 0; i < source.length; i++) {
+        const ch = source[i];
+        if (ch === '\\') {
+            const next = source[++i] || '';
+            // \d \w \s 는 맞는 글자 하나로 채워 구간을 잇는다 (/^id-\d+$/ -> "id-0")
+            if (CLASS_SAMPLES[next]) run += CLASS_SAMPLES[next];
+            else if (/[DWSbBpPkcux0-9]/.test(next)) flush();
+            else run += { n: '\n', r: '\r', t: '\t', f: '\f', v: '\v' }[next] || next;
+        } else if (ch === '[') {
+            flush();
+            i = classEnd(source, i);
+        } else if (ch === '(') {
+            // 전후방 탐색은 입력을 소비하지 않으므로 통째로 건너뛴다
+            if (/^\?(?:=|!|<=|<!)/.test(source.slice(i + 1, i + 4))) {
+                flush();
+                i = groupEnd(source, i);
+                continue;
+            }
+            const plain = plainGroup(source, i);
+            if (!plain) flush();
+            groups.push(plain);
+            const m = /^\?(?::|<[\w$]+>)/.exec(source.slice(i + 1));
+            if (m) i += m[0].length;
+        } else if (ch === ')') {
+            if (!groups.pop()) flush();
+        } else if (ch === '*' || ch === '?' || ch === '{') {
+            // 바로 앞 글자는 없어도 되므로 구간에서 뺀다
+            run = run.slice(0, -1);
+            flush();
+            if (ch === '{') while (i < source.length && source[i] !== '}') i++;
+        } else if (ch === '.') {
+            run += 'a';
+        } else if (ch === '|' || ch === '^' || ch === '$') {
+            flush();
+        } else if (ch !== '+') {
+            // '+' 는 한 번만 반복한 것으로 둔다
+            run += ch;
+        }
+    }
+    flush();
+    return out;
+}
+
+// 문자열/템플릿/정규식 리터럴을 값으로 풀어 둔 토큰 목록 (start: 원본 오프셋). sink_distance.js 도 쓴다
+function tokenize(source) {
+    const tokens = [];
+    const braceStack = [];
+    let i = 0;
+    const n = source.length;
+    const last = () => tokens[tokens.length - 1];
+    const regexAllowed = () => {
+        const t = last();
+        if (!t) return true;
+        if (t.type === 'keyword') return REGEX_KEYWORDS.has(t.value);
+        if (t.type === 'punct') return t.value !== ')' && t.value !== ']';
+        return false;
+    };
+    // 보간이 없는 템플릿만 문자열 리터럴로 본다 (head: 여는 ` 부터인지, } 뒤의 이어지는 부분인지)
+    const template = (from, head) => {
+        const res = scanTemplate(source, from);
+        if (res.interpolation) braceStack.push(true);
+        if (head && !res.interpolation) tokens.push({ type: 'string', value: decodeString(source.slice(from - 1, res.end)), start: from - 1 });
+        else tokens.push({ type: 'punct', value: '`', start: from - 1 });
+        return res.end;
+    };
+
+    while (i < n) {
+        const ch = source[i];
+        if (ch === ' ' || ch === '\t' || ch === '\n' || ch === '\r') {
+            i++;
+        } else if (ch === '/' && source[i + 1] === '/') {
+            while (i < n && source[i] !== '\n') i++;
+        } else if (ch === '/' && source[i + 1] === '*') {
+            const end = source.indexOf('*/', i + 2);
+            i = end < 0 ? n : end + 2;
+        } else if (ch === '\'' || ch === '"') {
+            const end = skipString(source, i);
+            tokens.push({ type: 'string', value: decodeString(source.slice(i, end)), start: i });
+            i = end;
+        } else if (ch === '`') {
+            i = template(i + 1, true);
+        } else if (ch === '/' && regexAllowed()) {
+            const end = skipRegex(source, i);
+            const body = source.slice(i + 1, end).replace(/\/[\w$]*$/, '');
+            tokens.push({ type: 'regex', value: body, start: i });
+            i = end;
+        } else if (isIdentStart(ch)) {
+            const start = i;
+            while (i < n && isIdentPart(source[i])) i++;
+            const value = source.slice(start, i);
+            tokens.push({ type: KEYWORDS.has(value) ? 'keyword' : 'ident', value, start });
+        } else if (/[0-9]/.test(ch) || (ch === '.' && /[0-9]/.test(source[i + 1] || ''))) {
+            const start = i;
+            while (i < n && (isIdentPart(source[i]) || source[i] === '.')) i++;
+            tokens.push({ type: 'num', value: source.slice(start, i), start });
+        } else if (ch === '{') {
+            braceStack.push(false);
+            tokens.push({ type: 'punct', value: ch, start: i });
+            i++;
+        } else if (ch === '}' && braceStack.pop()) {
+            i = template(i + 1, false);
+        } else {
+            const op = /^(?:===|!==|==|!=|=>)/.exec(source.slice(i, i + 3));
+            const value = op ? op[0] : ch;
+            tokens.push({ type: 'punct', value, start: i });
+            i += value.length;
+        }
+    }
+    return tokens;
+}
+
+// 하네스 소스에서 비교에 쓰이는 리터럴을 모은다
+function harvestLiterals(source) {
+    const tokens = tokenize(source);
+    const out = [];
+    for (let i = 0; i < tokens.length; i++) {
+        const t = tokens[i];
+        if (t.type === 'regex') {
+            out.push(...regexLiterals(t.value));
+            continue;
+        }
+        if (t.type !== 'string' && t.type !== 'num') continue;
+        const prev = tokens[i - 1] || {};
+        const next = tokens[i + 1] || {};
+        const callee = prev.value === '(' ? tokens[i - 2] || {} : {};
+        if (callee.value === 'RegExp' && t.type === 'string') {
+            out.push(...regexLiterals(t.value));
+        } else if (COMPARE_OPS.has(prev.value) || COMPARE_OPS.has(next.value) || prev.value === 'case'
+            || (STRING_METHODS.includes(callee.value) && (tokens[i - 3] || {}).value === '.')) {
+            out.push(t.value);
+        }
+    }
+    return out;
+}
+
+class CmpLog {
+    constructor(maxTokens = MAX_TOKENS) {
+        this.maxTokens = maxTokens;
+        // 하네스 함수를 실행하는 동안만 true (FuzzerCore._execute 가 켠다)
+        this.armed = false;
+        this.seen = new Set();
+        this.regexSeen = new Set();
+        this.fresh = [];
+        this.staticTokens = 0;
+        this.dynamicTokens = 0;
+        this.restore = null;
+    }
+
+    add(value, dynamic = false) {
+        if (typeof value !== 'string' || !value || value.length > MAX_OPERAND) return;
+        if (this.seen.has(value) || this.seen.size >= this.maxTokens) return;
+        this.seen.add(value);
+        this.fresh.push(value);
+        if (dynamic) this.dynamicTokens++;
+        else this.staticTokens++;
+    }
+
+    addRegex(source, dynamic = false) {
+        if (this.regexSeen.has(source)) return;
+        this.regexSeen.add(source);
+        for (const literal of regexLiterals(source)) this.add(literal, dynamic);
+    }
+
+    harvest(source) {
+        for (const literal of harvestLiterals(String(source))) this.add(literal);
+    }
+
+    // String/RegExp 프로토타입 메서드를 감싼다. 되돌리는 함수를 반환한다
+    install() {
+        if (this.restore) return this.restore;
+        const log = this;
+        const originals = [];
+        for (const name of STRING_METHODS) {
+            const original = String.prototype[name];
+            originals.push([String.prototype, name, original]);
+            String.prototype[name] = function (search) {
+                if (log.armed && typeof search === 'string') log.add(search, true);
+                return Reflect.apply(original, this, arguments);
+            };
+        }
+        const originalTest = RegExp.prototype.test;
+        originals.push([RegExp.prototype, 'test', originalTest]);
+        RegExp.prototype.test = function (input) {
+            if (log.armed && typeof this.source === 'string') {
+                // 구간 추출도 RegExp.test 를 쓰므로 그동안은 기록하지 않는다
+                log.armed = false;
+                try {
+                    log.addRegex(this.source, true);
+                } finally {
+                    log.armed = true;
+                }
+            }
+            return Reflect.apply(originalTest, this, arguments);
+        };
+        this.restore = () => {
+            for (const [proto, name, original] of originals) proto[name] = original;
+            this.restore = null;
+        };
+        return this.restore;
+    }
+
+    // 지난번 이후 새로 본 피연산자 (mutator 사전에 보낼 것)
+    drain() {
+        const fresh = this.fresh;
+        this.fresh = [];
+        return fresh;
+    }
+
+    // mutator 서버가 새로 뜨면 지금까지 모은 피연산자를 다시 보낸다
+    resend() {
+        this.fresh = [...this.seen];
+    }
+
+    summary() {
+        return { tokens: this.seen.size, static: this.staticTokens, dynamic: this.dynamicTokens };
+    }
+}
+
+module.exports = { CmpLog, harvestLiterals, regexLiterals, tokenize };
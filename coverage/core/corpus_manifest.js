@@ -0,0 +1,68 @@
+// coverage/core/corpus_manifest.js
+//
+// 코퍼스 디렉터리의 append-only 매니페스트 (manifest.jsonl).
+// 시드/새 경로/크래시 파일을 저장할 때마다 한 줄씩 덧붙이므로, 읽는 쪽(coverage/corpus_index.py)은
+// 디렉터리를 훑지 않고 마지막으로 읽은 바이트 오프셋 이후만 읽으면 된다.
+//   {"id": "...", "harness": "P_x.js", "kind": "new-path", "file": "input_....txt", "signature": "9c1e04aa", "ts": 1700000000000}
+//
+// 코퍼스는 하네스와 실행(run) ID 별 디렉터리로 나눈다: <corpusRoot>/<하네스 이름>/<runId>/
+// 그래서 여러 리포트를 동시에 시뮬레이션해도 서로의 입력/크래시/매니페스트를 건드리지 않는다.
+
+const fs = require('fs');
+const path = require('path');
+const { threadId } = require('worker_threads');
+
+const MANIFEST_NAME = 'manifest.jsonl';
+const DEFAULT_CORPUS_ROOT = path.resolve(__dirname, '../corpus');
+const DEFAULT_RUN_ID = 'default';
+const MAX_MESSAGE_LENGTH = 200;
+
+class CorpusManifest {
+    constructor(corpusDir, harness = '') {
+        this.corpusDir = corpusDir;
+        this.path = path.join(corpusDir, MANIFEST_NAME);
+        this.harness = harness;
+        // 여러 프로세스/워커 스레드가 같은 파일에 쓰므로 id 에 pid 와 threadId 를 넣는다
+        this.idPrefix = `${process.pid.toString(36)}.${threadId.toString(36)}`;
+        this.counter = 0;
+    }
+
+    // kind: 'seed' | 'new-path' | 'crash'. 한 줄을 한 번의 write 로 덧붙인다 (O_APPEND)
+    append(kind, file, extra = {}) {
+        const entry = {
+            id: `${Date.now().toString(36)}-${this.idPrefix}-${(this.counter++).toString(36)}`,
+            harness: this.harness,
+            kind,
+            file: file ? this._relative(file) : null,
+            signature: null,
+            ts: Date.now()
+        };
+        for (const [key, value] of Object.entries(extra)) {
+            if (value === undefined) continue;
+            entry[key] = key === 'message' && typeof value === 'string' ? value.slice(0, MAX_MESSAGE_LENGTH) : value;
+        }
+        try {
+            fs.appendFileSync(this.path, JSON.stringify(entry) + '\n', { encoding: 'utf-8' });
+        } catch (e) {}
+        return entry;
+    }
+
+    // 코퍼스 디렉터리 안의 파일은 상대 경로로, 밖(시드 파일 등)은 절대 경로로 적는다
+    _relative(file) {
+        const rel = path.relative(this.corpusDir, file);
+        return rel.startsWith('..') || path.isAbsolute(rel) ? path.resolve(file) : rel;
+    }
+}
+
+// 디렉터리 이름으로 쓸 수 없는 문자는 '_' 로 바꾼다 (coverage/corpus_index.py 의 _safe_name 과 같은 규칙)
+function safeName(name) {
+    return String(name).replace(/[^A-Za-z0-9._-]/g, '_').replace(/^\.+/, '_');
+}
+
+// 하네스와 실행 ID 로 정해지는 코퍼스 디렉터리. runId 가 없으면 'default' 실행으로 본다
+function corpusNamespace(corpusRoot, targetFilePath, runId = '') {
+    const harness = path.basename(targetFilePath, path.extname(targetFilePath));
+    return path.join(corpusRoot || DEFAULT_CORPUS_ROOT, safeName(harness), safeName(runId || DEFAULT_RUN_ID));
+}
+
+module.exports = { CorpusManifest, MANIFEST_NAME, DEFAULT_CORPUS_ROOT, corpusNamespace };
@@ -0,0 +1,75 @@
+// coverage/core/corpus_min.js
+//
+// afl-cmin / afl-tmin 처럼 동작하는 코퍼스 최소화와 입력 트리밍.
+//   minimizeCorpus : 입력마다 trace 의 (맵 인덱스, 버킷) 튜플을 모으고, 튜플마다 그것을 가진 가장 짧은 입력을 골라
+//                    전체 튜플 합집합을 유지하는 최소 집합만 남긴다 (크래시 입력은 버킷으로 따로 관리하므로 뺀다)
+//   trimInput      : 입력 절반 크기의 블록부터 1글자까지 블록 삭제를 시도하며, 동작(경로 서명 또는 크래시 버킷)이
+//                    그대로인 가장 짧은 입력을 찾는다
+// 둘 다 FuzzerCore.traceInput 으로 실행하므로 통계/virgin 맵/크래시 저장에 영향을 주지 않는다.
+
+const { crashSignature } = require('./crash_buckets');
+
+const DEFAULT_TRIM_EXECS = 256;
+
+async function minimizeCorpus(fuzzer, inputs) {
+    const unique = Array.from(new Set(inputs.map(String)));
+    // 짧은 입력부터 보므로 튜플마다 처음 본 입력이 가장 짧은 입력이다
+    unique.sort((a, b) => a.length - b.length);
+    const traces = [];
+    const best = new Map();
+    let crashed = 0;
+    for (const input of unique) {
+        const run = await fuzzer.traceInput(input);
+        if (run.crashed) {
+            crashed++;
+            continue;
+        }
+        const slot = traces.length;
+        traces.push({ input, tuples: run.tuples });
+        for (const t of run.tuples) {
+            if (!best.has(t)) best.set(t, slot);
+        }
+    }
+    const covered = new Set();
+    const keep = [];
+    for (const [tuple, slot] of best) {
+        if (covered.has(tuple)) continue;
+        keep.push(slot);
+        for (const t of traces[slot].tuples) covered.add(t);
+    }
+    keep.sort((a, b) => a - b);
+    return {
+        kept: keep.map(slot => traces[slot].input),
+        total: inputs.length,
+        duplicates: inputs.length - unique.length,
+        crashed,
+        tuples: best.size
+    };
+}
+
+// 경로 서명(크래시면 크래시 버킷)이 같으면 같은 동작으로 본다
+function behaviorKey(fuzzer, run) {
+    if (run.crashed) return `crash:${crashSignature(run.crashInfo || {}, fuzzer.targetFilePath).key}`;
+    return `path:${run.signature}`;
+}
+
+async function trimInput(fuzzer, input, maxExecs = DEFAULT_TRIM_EXECS) {
+    let current = String(input);
+    const target = behaviorKey(fuzzer, await fuzzer.traceInput(current));
+    let execs = 1;
+    for (let block = Math.max(1, Math.floor(current.length / 2)); block >= 1 && execs < maxExecs; block = Math.floor(block / 2)) {
+        for (let at = 0; at < current.length && execs < maxExecs;) {
+            const candidate = current.slice(0, at) + current.slice(at + block);
+            if (!candidate.length) {
+                at += block;
+                continue;
+            }
+            execs++;
+            if (behaviorKey(fuzzer, await fuzzer.traceInput(candidate)) === target) current = candidate;
+            else at += block;
+        }
+    }
+    return { input: current, original: String(input), execs, behavior: target };
+}
+
+module.exports = { minimizeCorpus, trimInput, behaviorKey };
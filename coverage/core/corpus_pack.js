@@ -0,0 +1,166 @@
+// coverage/core/corpus_pack.js
+//
+// 입력 하나당 파일 하나 대신 쓰는 packed 코퍼스.
+//   <name>.pack : 입력 바이트를 이어 붙인 append-only 데이터 파일
+//   <name>.idx  : 항목마다 24바이트 고정 레코드 (coverage/corpus_pack.py 가 mmap 으로 읽는다)
+//                 offset u64 | length u32 | kind u8 | (3바이트 예약) | signature u32 | ts(초) u32, 모두 little-endian
+// 실행 루프에서는 메모리 큐에 넣기만 하고, 모인 만큼 한 번의 비동기 write 로 내보낸다.
+// 여러 프로세스/워커 스레드가 같은 디렉터리에 쓰므로 파일 쌍은 writer 마다 따로 만든다.
+// 항목의 위치는 "<name>.pack#<번호>" 로 가리키며, 매니페스트 줄은 데이터가 디스크에 쓰인 뒤에 남긴다.
+// 쓰기에 실패한 배치는 일부만 쓰인 바이트를 잘라 내고 버린 뒤 경고하며, 다음 배치는 실제로 쓰인 끝에서 이어 쓴다.
+
+const fs = require('fs');
+const path = require('path');
+const { threadId } = require('worker_threads');
+
+const INDEX_RECORD_SIZE = 24;
+const KIND_CODES = { seed: 0, 'new-path': 1, crash: 2 };
+const FLUSH_BYTES = 64 * 1024;
+const FLUSH_INTERVAL_MS = 200;
+
+function appendAsync(file, data) {
+    return new Promise((resolve, reject) => {
+        fs.appendFile(file, data, (err) => (err ? reject(err) : resolve()));
+    });
+}
+
+class CorpusPackWriter {
+    constructor(corpusDir, manifest = null) {
+        this.corpusDir = corpusDir;
+        this.manifest = manifest;
+        this.name = `corpus-${Date.now().toString(36)}-${process.pid.toString(36)}.${threadId.toString(36)}`;
+        this.packPath = path.join(corpusDir, `${this.name}.pack`);
+        this.indexPath = path.join(corpusDir, `${this.name}.idx`);
+        // append 가 예약한 위치 (돌려준 참조의 번호)
+        this.offset = 0;
+        this.count = 0;
+        // 디스크에 실제로 쓰인 데이터 끝과 레코드 수. flush 는 이 값에서 위치를 다시 정한다
+        this.writtenOffset = 0;
+        this.writtenCount = 0;
+        // 쓰기에 실패해 버린 항목 수와 마지막 오류
+        this.dropped = 0;
+        this.lastError = null;
+        this.pending = [];
+        this.pendingBytes = 0;
+        this.timer = null;
+        // flush 는 순서대로 하나씩 (데이터 -> 인덱스 -> 매니페스트)
+        this.flushing = Promise.resolve();
+    }
+
+    // 항목을 큐에 넣고 바로 위치 문자열을 돌려준다. extra 는 매니페스트 줄에 함께 남길 필드
+    append(kind, data, extra = {}) {
+        const buf = Buffer.isBuffer(data) ? data : Buffer.from(String(data), 'utf-8');
+        const record = Buffer.alloc(INDEX_RECORD_SIZE);
+        record.writeBigUInt64LE(BigInt(this.offset), 0);
+        record.writeUInt32LE(buf.length, 8);
+        record.writeUInt8(KIND_CODES[kind] ?? 0, 12);
+        record.writeUInt32LE(extra.signature ? parseInt(extra.signature, 16) >>> 0 : 0, 16);
+        record.writeUInt32LE(Math.floor(Date.now() / 1000), 20);
+        const ref = path.join(this.corpusDir, `${this.name}.pack#${this.count}`);
+        this.pending.push({ kind, buf, record, ref, extra });
+        this.pendingBytes += buf.length;
+        this.offset += buf.length;
+        this.count++;
+        if (this.pendingBytes >= FLUSH_BYTES) {
+            this.flush();
+        } else if (!this.timer) {
+            this.timer = setTimeout(() => this.flush(), FLUSH_INTERVAL_MS);
+            if (this.timer.unref) this.timer.unref();
+        }
+        return ref;
+    }
+
+    flush() {
+        if (this.timer) {
+            clearTimeout(this.timer);
+            this.timer = null;
+        }
+        if (!this.pending.length) return this.flushing;
+        const batch = this.pending;
+        this.pending = [];
+        this.pendingBytes = 0;
+        this.flushing = this.flushing.then(async () => {
+            // 앞선 flush 가 실패했으면 예약한 위치가 디스크와 어긋나므로 실제로 쓰인 끝에서 다시 정한다
+            let offset = this.writtenOffset;
+            batch.forEach((entry, i) => {
+                entry.record.writeBigUInt64LE(BigInt(offset), 0);
+                offset += entry.buf.length;
+                entry.ref = path.join(this.corpusDir, `${this.name}.pack#${this.writtenCount + i}`);
+            });
+            try {
+                // 인덱스 레코드는 데이터가 쓰인 뒤에만 보이게 한다 (읽는 쪽은 완전한 레코드만 믿는다)
+                await appendAsync(this.packPath, Buffer.concat(batch.map(e => e.buf)));
+                await appendAsync(this.indexPath, Buffer.concat(batch.map(e => e.record)));
+            } catch (e) {
+                this._rollback(batch, e);
+                return;
+            }
+            this.writtenOffset = offset;
+            this.writtenCount += batch.length;
+            if (!this.manifest) return;
+            for (const entry of batch) this.manifest.append(entry.kind, entry.ref, entry.extra);
+        });
+        return this.flushing;
+    }
+
+    // 실패한 배치를 버린다: 일부만 쓰인 바이트를 잘라 내고 예약 위치를 되돌린 뒤 오류를 알린다.
+    // 이 배치에 돌려준 참조는 무효다 (매니페스트에는 남지 않는다)
+    _rollback(batch, err) {
+        try { fs.truncateSync(this.packPath, this.writtenOffset); } catch (e) {}
+        try { fs.truncateSync(this.indexPath, this.writtenCount * INDEX_RECORD_SIZE); } catch (e) {}
+        this.offset -= batch.reduce((sum, entry) => sum + entry.buf.length, 0);
+        this.count -= batch.length;
+        this.dropped += batch.length;
+        this.lastError = err;
+        console.error(`[WARN] - Corpus pack write failed (${path.basename(this.packPath)}): ${err && err.message ? err.message : err}, ` +
+            `${batch.length} entries dropped`);
+    }
+}
+
+const KIND_NAMES = Object.fromEntries(Object.entries(KIND_CODES).map(([name, code]) => [code, name]));
+
+// <name>.pack 하나의 항목들을 읽는다 (데이터 밖을 가리키는 미완성 레코드는 건너뛴다)
+function readPack(packPath) {
+    const indexPath = packPath.replace(/\.pack$/, '.idx');
+    let data;
+    let index;
+    try {
+        data = fs.readFileSync(packPath);
+        index = fs.readFileSync(indexPath);
+    } catch (e) {
+        return [];
+    }
+    const entries = [];
+    for (let i = 0; (i + 1) * INDEX_RECORD_SIZE <= index.length; i++) {
+        const at = i * INDEX_RECORD_SIZE;
+        const offset = Number(index.readBigUInt64LE(at));
+        const length = index.readUInt32LE(at + 8);
+        if (offset + length > data.length) break;
+        entries.push({ kind: KIND_NAMES[index.readUInt8(at + 12)] || 'seed', ref: `${packPath}#${i}`, data: data.subarray(offset, offset + length) });
+    }
+    return entries;
+}
+
+// 코퍼스 디렉터리의 packed 항목과 기존 파일(input_*.txt, crash_*.json)을 모두 읽는다
+function readCorpus(corpusDir) {
+    let names;
+    try {
+        names = fs.readdirSync(corpusDir).sort();
+    } catch (e) {
+        return [];
+    }
+    const entries = [];
+    for (const name of names) {
+        const file = path.join(corpusDir, name);
+        if (name.endsWith('.pack')) {
+            entries.push(...readPack(file));
+        } else if (/^input_.*\.txt$/.test(name) || /^crash_.*\.json$/.test(name)) {
+            try {
+                entries.push({ kind: name.startsWith('crash_') ? 'crash' : 'new-path', ref: file, data: fs.readFileSync(file) });
+            } catch (e) {}
+        }
+    }
+    return entries;
+}
+
+module.exports = { CorpusPackWriter, INDEX_RECORD_SIZE, KIND_CODES, readPack, readCorpus };
@@ -37,4 +37,207 @@ class SignatureManager {
     }
 }
 
-module.exports = { makeSignatureFromCoverage, SignatureManager };
+// AFL 스타일 커버리지 맵
+const MAP_SIZE = 1 << 16;
+
+// FNV-1a 32bit. 같은 스크립트/오프셋이면 스레드가 달라도 같은 인덱스가 나온다
+function hashRange(url, startOffset, endOffset) {
+    let h = 0x811c9dc5;
+    const key = `${url}:${startOffset}:${endOffset}`;
+    for (let i = 0; i < key.length; i++) {
+        h ^= key.charCodeAt(i);
+        h = Math.imul(h, 0x01000193);
+    }
+    return (h >>> 0) & (MAP_SIZE - 1);
+}
+
+// 실행 횟수를 1,2,3,4-7,8-15,16-31,32-127,128+ 버킷 비트로 바꾼다
+function bucketCount(count) {
+    if (count <= 0) return 0;
+    if (count === 1) return 1;
+    if (count === 2) return 2;
+    if (count === 3) return 4;
+    if (count <= 7) return 8;
+    if (count <= 15) return 16;
+    if (count <= 31) return 32;
+    if (count <= 127) return 64;
+    return 128;
+}
+
+class CoverageMap {
+    // buffer 를 넘기면(SharedArrayBuffer) 여러 워커가 같은 virgin 맵을 공유한다
+    constructor(buffer = null) {
+        if (buffer) {
+            this.virgin = new Uint8Array(buffer);
+        } else {
+            this.virgin = new Uint8Array(MAP_SIZE);
+            this.virgin.fill(0xff);
+        }
+    }
+
+    static createShared() {
+        const buffer = new SharedArrayBuffer(MAP_SIZE);
+        new Uint8Array(buffer).fill(0xff);
+        return buffer;
+    }
+
+    // trace 에 처음 보는 버킷 비트가 있으면 true
+    hasNewBits(trace) {
+        let isNew = false;
+        const { touched, bits } = trace;
+        for (let i = 0; i < trace.length; i++) {
+            const idx = touched[i];
+            const b = bits[idx];
+            if (!(this.virgin[idx] & b)) continue;
+            const prev = Atomics.and(this.virgin, idx, ~b & 0xff);
+            if (prev & b) isNew = true;
+        }
+        return isNew;
+    }
+
+    // trace 의 각 인덱스에서 그 버킷 이하의 비트 중 아직 못 본 것이 남았으면 true (virgin 은 바꾸지 않는다).
+    // 여러 입력의 실행 횟수를 합친 trace 라면 입력 하나의 버킷은 합친 버킷을 넘을 수 없으므로,
+    // false 면 그 입력들 중 어느 것도 이 인덱스들에서 새 비트를 내지 못한다
+    hasUnsaturated(trace) {
+        const { touched, bits } = trace;
+        for (let i = 0; i < trace.length; i++) {
+            const idx = touched[i];
+            const below = (2 << (31 - Math.clz32(bits[idx]))) - 1;
+            if (this.virgin[idx] & below) return true;
+        }
+        return false;
+    }
+}
+
+// 한 번 실행의 trace_bits. 건드린 인덱스만 기록해 두고 clear 때 그것만 지운다
+class CoverageTrace {
+    constructor() {
+        this.bits = new Uint8Array(MAP_SIZE);
+        this.touched = new Uint32Array(1024);
+        this.length = 0;
+    }
+
+    add(idx, bucket) {
+        if (!this.bits[idx]) {
+            if (this.length === this.touched.length) {
+                const grown = new Uint32Array(this.touched.length * 2);
+                grown.set(this.touched);
+                this.touched = grown;
+            }
+            this.touched[this.length++] = idx;
+        }
+        this.bits[idx] |= bucket;
+    }
+
+    clear() {
+        for (let i = 0; i < this.length; i++) this.bits[this.touched[i]] = 0;
+        this.length = 0;
+    }
+
+    // 실행 순서와 무관한 경로 서명 (인덱스, 버킷) 쌍의 32비트 FNV-1a, 16진수 8자리
+    signature() {
+        const idx = this.touched.slice(0, this.length).sort();
+        let h = 0x811c9dc5;
+        for (let i = 0; i < idx.length; i++) {
+            const v = idx[i] * 256 + this.bits[idx[i]];
+            for (let s = 0; s < 32; s += 8) {
+                h ^= (v >>> s) & 0xff;
+                h = Math.imul(h, 0x01000193);
+            }
+        }
+        return (h >>> 0).toString(16).padStart(8, '0');
+    }
+}
+
+// (start, end) 를 숫자 하나로 합친다. 오프셋이 2^26 을 넘는 스크립트는 없다고 본다
+const OFFSET_SPAN = 1 << 26;
+
+// 스크립트별 범위를 정수 id 로 한 번만 등록하고, id 마다 맵 인덱스와 실행 여부를 typed array 로 들고 있는다
+class RangeInterner {
+    constructor() {
+        this.scripts = new Map();
+        this.urls = [];
+        this.size = 0;
+        this.executedCount = 0;
+        this._alloc(1024);
+    }
+
+    _alloc(capacity) {
+        const grow = (Type, old) => {
+            const arr = new Type(capacity);
+            if (old) arr.set(old);
+            return arr;
+        };
+        this.scriptOf = grow(Uint32Array, this.scriptOf);
+        this.starts = grow(Uint32Array, this.starts);
+        this.ends = grow(Uint32Array, this.ends);
+        this.mapIndex = grow(Uint16Array, this.mapIndex);
+        this.executed = grow(Uint8Array, this.executed);
+    }
+
+    // url 의 범위 테이블. 호출자가 scriptId 단위로 캐시해 두고 intern 에 넘긴다
+    script(url) {
+        let record = this.scripts.get(url);
+        if (!record) {
+            record = { index: this.urls.length, url, ids: new Map() };
+            this.urls.push(url);
+            this.scripts.set(url, record);
+        }
+        return record;
+    }
+
+    intern(record, startOffset, endOffset) {
+        const key = startOffset * OFFSET_SPAN + endOffset;
+        let id = record.ids.get(key);
+        if (id !== undefined) return id;
+        id = this.size++;
+        if (id >= this.starts.length) this._alloc(this.starts.length * 2);
+        this.scriptOf[id] = record.index;
+        this.starts[id] = startOffset;
+        this.ends[id] = endOffset;
+        this.mapIndex[id] = hashRange(record.url, startOffset, endOffset);
+        record.ids.set(key, id);
+        return id;
+    }
+
+    markExecuted(id) {
+        if (this.executed[id]) return false;
+        this.executed[id] = 1;
+        this.executedCount++;
+        return true;
+    }
+
+    keyOf(id) {
+        return `${this.urls[this.scriptOf[id]]}:${this.starts[id]}:${this.ends[id]}`;
+    }
+
+    // exportState 호환: "url:start:end" 문자열 목록
+    keys(executedOnly = false) {
+        const out = [];
+        for (let id = 0; id < this.size; id++) {
+            if (!executedOnly || this.executed[id]) out.push(this.keyOf(id));
+        }
+        return out;
+    }
+
+    internKey(rangeKey) {
+        const endSep = rangeKey.lastIndexOf(':');
+        const startSep = rangeKey.lastIndexOf(':', endSep - 1);
+        if (startSep <= 0) return -1;
+        const start = parseInt(rangeKey.slice(startSep + 1, endSep));
+        const end = parseInt(rangeKey.slice(endSep + 1));
+        if (!Number.isInteger(start) || !Number.isInteger(end)) return -1;
+        return this.intern(this.script(rangeKey.slice(0, startSep)), start, end);
+    }
+}
+
+module.exports = {
+    makeSignatureFromCoverage,
+    SignatureManager,
+    MAP_SIZE,
+    hashRange,
+    bucketCount,
+    CoverageMap,
+    CoverageTrace,
+    RangeInterner
+};
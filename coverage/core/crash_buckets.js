@@ -0,0 +1,111 @@
+// coverage/core/crash_buckets.js
+//
+// 크래시를 입력 문자열이 아니라 정규화한 스택 서명으로 묶는다.
+//   서명 = 에러 타입(+code) + 하네스 파일 안의 상위 N개 프레임(함수 이름:줄)
+// 하네스 프레임이 없으면(모듈 내부에서 던진 경우) node 내부와 퍼저 자체를 뺀 프레임을, 그것도 없으면
+// 숫자/따옴표 문자열을 지운 메시지를 쓴다. 같은 버그의 변형 입력들은 한 버킷에 모이고,
+// 버킷마다 대표 입력 하나와 히트 수만 남긴다.
+
+const crypto = require('crypto');
+const path = require('path');
+
+const DEFAULT_FRAMES = 5;
+const FRAME_RE = /^\s*at (?:async )?(?:(.*?) \()?(.*?):(\d+):(\d+)\)?$/;
+const FUZZER_DIR = __dirname + path.sep;
+
+function errorType(crashInfo) {
+    let type = crashInfo.type || '';
+    if (!type) {
+        const first = String(crashInfo.stack || '').split('\n', 1)[0];
+        const m = first.match(/^([\w$.]*(?:Error|Exception))\b/);
+        type = m ? m[1] : 'Error';
+    }
+    return crashInfo.code ? `${type}[${crashInfo.code}]` : type;
+}
+
+function parseFrames(stack) {
+    const frames = [];
+    for (const line of String(stack || '').split('\n')) {
+        const m = line.match(FRAME_RE);
+        if (!m) continue;
+        // 'Object.fn [as alias]' 처럼 호출 방식에 따라 달라지는 부분은 지운다
+        const fn = (m[1] || '<anonymous>').replace(/ \[as [^\]]+\]$/, '').replace(/^Object\./, '');
+        frames.push({ fn, file: m[2], line: m[3] });
+    }
+    return frames;
+}
+
+function normalizeMessage(message) {
+    return String(message || '')
+        .replace(/(['"`]).*?\1/g, '$1$1')
+        .replace(/\d+/g, 'N')
+        .slice(0, 200);
+}
+
+// crashInfo: { func, message, stack, type?, code? }
+function crashSignature(crashInfo, targetFilePath, maxFrames = DEFAULT_FRAMES) {
+    const type = errorType(crashInfo);
+    const frames = parseFrames(crashInfo.stack);
+    let top = frames.filter(f => f.file === targetFilePath);
+    if (!top.length) {
+        top = frames.filter(f => !f.file.startsWith('node:') && !f.file.startsWith(FUZZER_DIR));
+    }
+    top = top.slice(0, maxFrames).map(f => `${f.fn}:${f.line}`);
+    const basis = top.length ? top : [`${crashInfo.func || ''}!${normalizeMessage(crashInfo.message)}`];
+    const key = crypto.createHash('sha1').update(`${type}|${basis.join('|')}`).digest('hex').slice(0, 12);
+    return { key, type, frames: top };
+}
+
+class CrashBuckets {
+    constructor(targetFilePath, maxFrames = DEFAULT_FRAMES) {
+        this.targetFilePath = targetFilePath;
+        this.maxFrames = maxFrames;
+        this.buckets = new Map();
+    }
+
+    // 버킷에 크래시 하나를 넣는다. 처음 보는 서명이면 isNew 가 true 이고 이 입력이 대표가 된다
+    record(crashInfo, input) {
+        const sig = crashSignature(crashInfo, this.targetFilePath, this.maxFrames);
+        let bucket = this.buckets.get(sig.key);
+        const isNew = !bucket;
+        if (isNew) {
+            bucket = {
+                key: sig.key,
+                type: sig.type,
+                frames: sig.frames,
+                func: crashInfo.func,
+                message: crashInfo.message,
+                input,
+                crashInfo,
+                hits: 0,
+                firstSeen: Date.now(),
+                lastSeen: 0,
+                file: null
+            };
+            this.buckets.set(sig.key, bucket);
+        }
+        bucket.hits++;
+        bucket.lastSeen = Date.now();
+        return { bucket, isNew };
+    }
+
+    get size() {
+        return this.buckets.size;
+    }
+
+    // 결과 메시지용 요약 (대표 입력, 히트 수, 저장 위치)
+    summary() {
+        return Array.from(this.buckets.values()).map(b => ({
+            key: b.key,
+            type: b.type,
+            func: b.func,
+            message: b.message,
+            frames: b.frames,
+            hits: b.hits,
+            input: b.input,
+            file: b.file
+        }));
+    }
+}
+
+module.exports = { CrashBuckets, crashSignature };
@@ -0,0 +1,172 @@
+// coverage/core/exec_stats.js
+//
+// 실행 루프에서 실행마다 불러도 되는 고정 크기 통계 구조.
+//   LogHistogram : HDR 식 로그-선형 버킷 히스토그램. 값이 32 미만이면 정확히, 그 위는 2의 거듭제곱 구간마다
+//                  32개 버킷으로 나눠(상대 오차 약 3%) 스트리밍으로 센다. 기록은 O(1), 백분위는 가장 큰 값의
+//                  버킷까지 한 번 훑는다. 워커 스냅샷으로 보내고(toJSON) 합칠(merge) 수 있다
+//   RateRing     : 초 단위 슬롯 windowSec 개짜리 링 버퍼. 최근 windowSec 초의 실행 수로 exec/s 를 낸다
+//   StatsFile    : FuzzingStats.toJSON() 을 intervalMs 마다 JSON 한 줄씩 덧붙인다 (coverage/stats_tail.py 가 읽는다)
+
+const fs = require('fs');
+const path = require('path');
+
+const SUB_BITS = 5;
+const SUB_BUCKETS = 1 << SUB_BITS;
+const BUCKETS = SUB_BUCKETS + (32 - SUB_BITS) * SUB_BUCKETS;
+const MAX_VALUE = 0xffffffff;
+const SUMMARY_PERCENTILES = [50, 90, 95, 99];
+
+function bucketOf(value) {
+    const v = value >= MAX_VALUE ? MAX_VALUE : (value > 0 ? Math.floor(value) : 0);
+    if (v < SUB_BUCKETS) return v;
+    const exp = 31 - Math.clz32(v);
+    return SUB_BUCKETS + (exp - SUB_BITS) * SUB_BUCKETS + ((v >>> (exp - SUB_BITS)) - SUB_BUCKETS);
+}
+
+// 버킷의 대표값 (구간의 가운데)
+function bucketValue(index) {
+    if (index < SUB_BUCKETS) return index;
+    const shift = ((index - SUB_BUCKETS) >> SUB_BITS);
+    const low = (SUB_BUCKETS + ((index - SUB_BUCKETS) & (SUB_BUCKETS - 1))) * 2 ** shift;
+    return low + (2 ** shift - 1) / 2;
+}
+
+class LogHistogram {
+    constructor() {
+        this.counts = new Float64Array(BUCKETS);
+        this.count = 0;
+        this.sum = 0;
+        this.max = 0;
+        // 0 이 아닌 가장 높은 버킷 (백분위는 여기까지만 훑는다)
+        this.top = 0;
+    }
+
+    // count 는 같은 값을 여러 번 넣을 때 (배치 하나를 입력 수로 나눈 시간 등)
+    record(value, count = 1) {
+        const idx = bucketOf(value);
+        this.counts[idx] += count;
+        this.count += count;
+        this.sum += value * count;
+        if (value > this.max) this.max = value;
+        if (idx > this.top) this.top = idx;
+    }
+
+    // ps: 오름차순 백분위(0~100) 목록. 한 번 훑어서 모두 구한다
+    percentiles(ps) {
+        const out = new Array(ps.length).fill(0);
+        if (!this.count) return out;
+        let seen = 0;
+        let k = 0;
+        for (let i = 0; i <= this.top && k < ps.length; i++) {
+            seen += this.counts[i];
+            while (k < ps.length && seen >= Math.max(1, Math.ceil((ps[k] / 100) * this.count))) {
+                out[k++] = Math.min(bucketValue(i), this.max);
+            }
+        }
+        while (k < ps.length) out[k++] = this.max;
+        return out;
+    }
+
+    percentile(p) {
+        return this.percentiles([p])[0];
+    }
+
+    mean() {
+        return this.count ? this.sum / this.count : 0;
+    }
+
+    summary() {
+        const [p50, p90, p95, p99] = this.percentiles(SUMMARY_PERCENTILES).map(Math.round);
+        return { count: this.count, mean: Math.round(this.mean()), p50, p90, p95, p99, max: Math.round(this.max) };
+    }
+
+    merge(other) {
+        if (!other) return this;
+        const src = other instanceof LogHistogram ? other : LogHistogram.fromJSON(other);
+        for (let i = 0; i <= src.top; i++) this.counts[i] += src.counts[i];
+        this.count += src.count;
+        this.sum += src.sum;
+        if (src.max > this.max) this.max = src.max;
+        if (src.top > this.top) this.top = src.top;
+        return this;
+    }
+
+    // 0 이 아닌 버킷만 [인덱스, 개수] 로 싣는다 (워커 스냅샷용)
+    toJSON() {
+        const buckets = [];
+        for (let i = 0; i <= this.top; i++) if (this.counts[i]) buckets.push([i, this.counts[i]]);
+        return { count: this.count, sum: this.sum, max: this.max, buckets };
+    }
+
+    static fromJSON(json) {
+        const hist = new LogHistogram();
+        if (!json) return hist;
+        for (const [i, n] of json.buckets || []) {
+            if (i < 0 || i >= BUCKETS) continue;
+            hist.counts[i] = n;
+            if (i > hist.top) hist.top = i;
+        }
+        hist.count = json.count || 0;
+        hist.sum = json.sum || 0;
+        hist.max = json.max || 0;
+        return hist;
+    }
+}
+
+class RateRing {
+    constructor(windowSec = 10) {
+        this.windowSec = windowSec;
+        this.slots = new Uint32Array(windowSec);
+        this.total = 0;
+        this.second = 0;
+    }
+
+    // 지난 슬롯은 건너뛴 초만큼만(최대 windowSec 개) 비운다
+    _advance(now) {
+        const second = Math.floor(now / 1000);
+        if (second === this.second) return;
+        const stale = Math.min(this.windowSec, Math.max(0, second - this.second));
+        for (let i = 1; i <= stale; i++) {
+            const slot = (this.second + i) % this.windowSec;
+            this.total -= this.slots[slot];
+            this.slots[slot] = 0;
+        }
+        this.second = second;
+    }
+
+    tick(now = Date.now(), count = 1) {
+        this._advance(now);
+        this.slots[this.second % this.windowSec] += count;
+        this.total += count;
+    }
+
+    rate(now = Date.now()) {
+        this._advance(now);
+        return this.total / this.windowSec;
+    }
+}
+
+class StatsFile {
+    constructor(file, intervalMs = 1000) {
+        this.file = path.resolve(file);
+        this.intervalMs = intervalMs;
+        this.lastWrite = 0;
+        try {
+            fs.mkdirSync(path.dirname(this.file), { recursive: true });
+        } catch (e) {}
+    }
+
+    // stats: FuzzingStats.toJSON() 결과. 한 줄을 한 번의 write 로 덧붙인다 (O_APPEND)
+    write(stats, now = Date.now()) {
+        this.lastWrite = now;
+        try {
+            fs.appendFileSync(this.file, JSON.stringify(Object.assign({ ts: now }, stats)) + '\n', 'utf-8');
+        } catch (e) {}
+    }
+
+    maybeWrite(stats, now = Date.now()) {
+        if (now - this.lastWrite >= this.intervalMs) this.write(stats, now);
+    }
+}
+
+module.exports = { LogHistogram, RateRing, StatsFile };
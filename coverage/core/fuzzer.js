@@ -1,42 +1,162 @@
 const fs = require('fs');
 const path = require('path');
 const inspector = require('inspector');
+const v8 = require('v8');
 const { spawnSync } = require('child_process');
-const { SignatureManager } = require('./coverage_utils');
+const { CoverageMap, CoverageTrace, RangeInterner, bucketCount } = require('./coverage_utils');
+const { MutatorClient } = require('./mutator_client');
+const { loadInstrumented } = require('./instrument');
+const { CallRecorder, installMocks, createGlobalDb } = require('./sandbox_mocks');
+const { SinkOracle } = require('./sink_oracle');
+const { CorpusManifest, DEFAULT_CORPUS_ROOT, corpusNamespace } = require('./corpus_manifest');
+const { CorpusPackWriter } = require('./corpus_pack');
+const { CrashBuckets } = require('./crash_buckets');
+const { minimizeCorpus, trimInput } = require('./corpus_min');
+const { SeedScheduler } = require('./seed_scheduler');
+const { ExecHeartbeat, FindingCorpus, ExecTimeoutError, withDeadline } = require('./watchdog');
+const { ResourceOracle } = require('./resource_oracle');
+const { LogHistogram, RateRing } = require('./exec_stats');
+const { CmpLog } = require('./cmplog');
+const { SinkDistance, locateSink } = require('./sink_distance');
+
+// 결과 메시지에 싣는 새 코퍼스/크래시 기록의 최대 개수 (그 이후는 stats 의 개수로만 남는다)
+const MAX_RECORDED_FILES = 1000;
+// 크래시 버킷 파일은 실행 루프 밖에서 이 주기로 모아서 쓴다
+const CRASH_FLUSH_INTERVAL_MS = 500;
+// exec/s 를 내는 창 (초)
+const RATE_WINDOW_SEC = 10;
+// 단계별 지연 시간 히스토그램: target(하네스 실행), coverage(커버리지 수집), mutation(변이, 입력 하나 기준)
+const LATENCY_STAGES = ['target', 'coverage', 'mutation'];
+// slowness 목표에서 지금까지 가장 느린 실행보다 이만큼 더 느려야 시드 큐에 넣는다
+const SLOWER_RATIO = 1.1;
+
+function readSeedFile(seedFilePath) {
+    if (seedFilePath && fs.existsSync(seedFilePath)) {
+        const seedRaw = fs.readFileSync(seedFilePath, 'utf-8');
+        const seeds = seedRaw.split(/\r?\n/).map(s => s.trim()).filter(Boolean);
+        if (seeds.length) return seeds;
+    }
+    return ['initial'];
+}
 
 class FuzzingStats {
     constructor() {
         this.startTime = Date.now();
         this.totalExecs = 0;
         this.crashCount = 0;
+        // 크래시 버킷(정규화한 스택 서명) 키. 같은 버그의 변형 입력은 하나로 센다
         this.uniqueCrashes = new Set();
         this.paths = 0;
+        // 데드라인(execTimeoutMs)을 넘긴 실행 수. 크래시와 따로 센다
+        this.hangs = 0;
+        // 기준선보다 훨씬 느리거나 힙을 많이 쓴 실행 수 (resource 발견)
+        this.slowInputs = 0;
+        this.memoryInputs = 0;
         this.currentCoverage = 0;
         this.cumulativeCoverage = 0;
         this.maxCoverage = 0;
         this.execsPerSec = 0;
         this.lastExecTime = Date.now();
-        this.execTimes = [];
+        this.rate = new RateRing(RATE_WINDOW_SEC);
+        // 단계별 지연 시간(µs) 히스토그램. 병렬 모드에서는 워커 스냅샷의 히스토그램을 합친다
+        this.latency = null;
+        this.resetLatency();
         this.lastInput = '';
         this.currentStage = 'initializing';
+        // 반복을 다 돌기 전에 멈춘 이유 (병렬 모드의 respawn-limit 등, 끝까지 돌았으면 null)
+        this.stoppedReason = null;
+        // export 함수별 실행/크래시 수. 진입 함수가 하나일 때는 경로와 커버리지도 그 함수에 귀속된다
+        this.functions = {};
+        // sink 오라클 판정: 도달/익스플로잇 횟수와 처음 익스플로잇한 입력
+        this.sinkReached = 0;
+        this.sinkExploited = 0;
+        this.firstExploit = null;
+        // 처음 sink 에 도달한 실행 (time-to-sink). via: oracle(기록된 sink 호출) 또는 coverage(sink 를 감싼 블록이 모두 실행됨)
+        this.firstReach = null;
+        // 지금까지 sink 에 가장 가까이 간 거리 (sink_distance.js, 하네스에서 sink 를 찾지 못했으면 null)
+        this.closestDistance = null;
+    }
+
+    _functionStats(funcName) {
+        return this.functions[funcName] || (this.functions[funcName] = { execs: 0, crashes: 0, paths: 0, maxCoverage: 0 });
+    }
+
+    recordCall(funcName, crashed) {
+        const f = this._functionStats(funcName);
+        f.execs++;
+        if (crashed) f.crashes++;
+    }
+
+    resetLatency() {
+        this.latency = {};
+        for (const stage of LATENCY_STAGES) this.latency[stage] = new LogHistogram();
+    }
+
+    recordLatency(stage, us, count = 1) {
+        this.latency[stage].record(us, count);
+    }
+
+    // 단계별 p50/p90/p95/p99 와 누적 시간(ms). 누적 시간으로 커버리지 수집과 하네스 실행의 비중을 비교한다
+    latencySummary() {
+        const out = {};
+        for (const stage of LATENCY_STAGES) {
+            const hist = this.latency[stage];
+            out[stage] = Object.assign(hist.summary(), { totalMs: Math.round(hist.sum / 1000) });
+        }
+        return out;
+    }
+
+    latencyJSON() {
+        const out = {};
+        for (const stage of LATENCY_STAGES) out[stage] = this.latency[stage].toJSON();
+        return out;
+    }
+
+    mergeLatency(latency) {
+        for (const stage of LATENCY_STAGES) {
+            if (latency && latency[stage]) this.latency[stage].merge(latency[stage]);
+        }
+    }
+
+    recordVerdict(input, verdict) {
+        if (!verdict || !verdict.reached) return;
+        this.sinkReached++;
+        this.recordReach(input, 'oracle');
+        if (!verdict.exploited) return;
+        this.sinkExploited++;
+        if (this.firstExploit) return;
+        const now = Date.now();
+        this.firstExploit = { input, reason: verdict.reason, execs: this.totalExecs + 1, ms: now - this.startTime, at: now };
+    }
+
+    recordReach(input, via) {
+        if (this.firstReach) return;
+        const now = Date.now();
+        this.firstReach = { input, via, execs: this.totalExecs + 1, ms: now - this.startTime, at: now };
     }
 
-    updateExec(input, currentCoverage, cumulativeCoverage, isCrash = false, isNewPath = false) {
+    recordDistance(distance) {
+        if (typeof distance !== 'number') return;
+        if (this.closestDistance === null || distance < this.closestDistance) this.closestDistance = distance;
+    }
+
+    updateExec(input, currentCoverage, cumulativeCoverage, isCrash = false, isNewPath = false, entry = null) {
         this.totalExecs++;
         this.lastInput = input;
         this.currentCoverage = typeof currentCoverage === 'number' ? currentCoverage : 0;
         this.cumulativeCoverage = typeof cumulativeCoverage === 'number' ? cumulativeCoverage : 0;
         if (this.currentCoverage > this.maxCoverage) this.maxCoverage = this.currentCoverage;
-        if (isCrash) {
-            this.crashCount++;
-            this.uniqueCrashes.add(input);
-        }
+        if (isCrash) this.crashCount++;
         if (isNewPath) this.paths++;
         const now = Date.now();
-        this.execTimes.push(now);
-        while (this.execTimes.length && now - this.execTimes[0] > 10000) this.execTimes.shift();
-        this.execsPerSec = this.execTimes.length / 10;
+        this.rate.tick(now);
+        this.execsPerSec = this.rate.rate(now);
         this.lastExecTime = now;
+        if (entry) {
+            const f = this._functionStats(entry);
+            if (this.currentCoverage > f.maxCoverage) f.maxCoverage = this.currentCoverage;
+            if (isNewPath) f.paths++;
+        }
     }
 
     getRuntime() {
@@ -50,14 +170,27 @@ class FuzzingStats {
     toJSON() {
         return {
             runtime: this.getRuntime(),
+            currentStage: this.currentStage,
+            stoppedReason: this.stoppedReason,
             totalExecs: this.totalExecs,
             crashCount: this.crashCount,
             uniqueCrashes: this.uniqueCrashes.size,
             paths: this.paths,
+            hangs: this.hangs,
+            slowInputs: this.slowInputs,
+            memoryInputs: this.memoryInputs,
             currentCoverage: this.currentCoverage,
             cumulativeCoverage: this.cumulativeCoverage,
             maxCoverage: this.maxCoverage,
             execsPerSec: this.execsPerSec,
+            latency: this.latencySummary(),
+            functions: this.functions,
+            sinkReached: this.sinkReached,
+            sinkExploited: this.sinkExploited,
+            firstExploit: this.firstExploit,
+            firstReach: this.firstReach,
+            timeToSinkMs: this.firstReach ? this.firstReach.ms : null,
+            closestDistance: this.closestDistance,
             lastInputPreview: this.lastInput ? (this.lastInput.length > 200 ? this.lastInput.slice(0,200) + '...' : this.lastInput) : ''
         };
     }
@@ -68,53 +201,152 @@ class FuzzerCore {
         this.stats = new FuzzingStats();
         this.targetModule = null;
         this.session = null;
-        this.sigMgr = new SignatureManager();
-        this.corpusDir = options.corpusDir || path.resolve(__dirname, '../corpus');
-        this.seedInputs = [];
+        // virgin 맵: 병렬 모드에서는 워커들이 SharedArrayBuffer 를 공유한다
+        this.sharedVirginMap = options.sharedVirginMap || null;
+        this.coverageMap = new CoverageMap(this.sharedVirginMap);
+        this.trace = new CoverageTrace();
+        this.onNewSeed = typeof options.onNewSeed === 'function' ? options.onNewSeed : null;
+        this.onCrash = typeof options.onCrash === 'function' ? options.onCrash : null;
+        this.onHang = typeof options.onHang === 'function' ? options.onHang : null;
+        this.onResource = typeof options.onResource === 'function' ? options.onResource : null;
+        // 이번 실행에서 저장한 코퍼스 파일 경로와 크래시 기록 (구조화된 결과로 내보낸다)
+        this.newCorpus = [];
+        this.crashRecords = [];
+        // 저장한 파일마다 manifest.jsonl 에 한 줄씩 남긴다 (init 에서 하네스 이름과 함께 만든다)
+        this.manifest = null;
+        // corpusDir 를 직접 주지 않으면 init 에서 <corpusRoot>/<하네스>/<runId> 로 정한다
+        this.corpusRoot = options.corpusRoot || DEFAULT_CORPUS_ROOT;
+        this.runId = options.runId || '';
+        this.corpusDir = options.corpusDir || '';
+        // 'pack' 이면 입력/크래시를 파일마다 쓰지 않고 packed 코퍼스(.pack + .idx)에 모아서 비동기로 쓴다
+        this.corpusFormat = options.corpusFormat === 'pack' ? 'pack' : 'files';
+        this.pack = null;
+        // 크래시는 스택 서명 버킷으로 묶고, 버킷 파일은 백그라운드 flush 로 쓴다 (init 에서 하네스 경로와 함께 만든다)
+        this.crashBuckets = null;
+        this.dirtyCrashes = new Set();
+        this.persistedCrashes = new Set();
+        this.crashFlushTimer = null;
+        this.crashFlushing = Promise.resolve();
+        // 실행 하나의 데드라인. Promise 를 돌려주는 함수는 여기서 끊고, 동기 무한 루프는 heartbeat 를 읽는
+        // 감시자(ParallelFuzzer)가 워커를 종료한다. 넘긴 입력은 <corpusDir>/hangs 에 저장한다
+        this.execTimeoutMs = options.execTimeoutMs > 0 ? options.execTimeoutMs : 2000;
+        this.heartbeat = options.heartbeat ? new ExecHeartbeat(options.heartbeat) : null;
+        this.hangs = null;
+        // 실행마다 시간/힙 증가량을 히스토그램에 넣고, 기준선보다 훨씬 무거운 입력은 <corpusDir>/resources 에 저장한다
+        this.resources = new ResourceOracle({ slowFactor: options.slowFactor, memoryFactor: options.memoryFactor });
+        this.resourceFindings = null;
+        // 탐색 목표: coverage(기본)는 새 경로만 시드로 삼고, slowness 는 가장 느린 실행을 갱신한 입력도
+        // (파일로 저장하지 않고) 시드 큐에 넣고 느린 시드에 에너지를 더 준다.
+        // sink 는 (directed) sink 에 더 가까이 간 입력도 시드 큐에 넣고 가까운 시드에 에너지를 몰아준다
+        this.objective = ['slowness', 'sink'].includes(options.objective) ? options.objective : 'coverage';
+        this.slowestUs = 0;
+        // sink 까지의 거리: init 에서 하네스의 sink 호출 자리를 찾으면 실행마다 커버리지 범위로 잰다.
+        // sinkLine 은 리포트의 sink.line (호출 자리가 여럿일 때 가장 가까운 것을 고른다)
+        this.sinkLine = options.sinkLine > 0 ? options.sinkLine : 0;
+        this.sinkDistance = null;
+        this.sinkBlocks = null;
+        this.closestDistance = Infinity;
+        // 시드 큐: energy(기본)는 드문 경로/짧고 빠른 입력/최근 성과에 가중치를 둔 추첨, uniform 은 균등 추첨
+        this.scheduler = new SeedScheduler({ schedule: options.schedule, maxSeeds: options.maxSeeds, objective: this.objective });
         this.mutatorPyPath = '';
         this.isRunning = false;
         this.targetFilePath = '';
-        this.allRanges = new Set();
-        this.executedRanges = new Set();
+        // 범위는 정수 id 로 한 번만 등록하고, scriptId 별로 대상 여부와 범위 테이블을 캐시한다
+        this.ranges = new RangeInterner();
+        this.scriptCache = new Map();
         this.takeCoverageLock = false;
         this.pendingCoveragePromises = [];
         this.mutatorMaxBuffer = options.mutatorMaxBuffer || 10 * 1024 * 1024;
         this.mutatorTimeoutMs = options.mutatorTimeoutMs || 5000;
-        this.execDelayMs = typeof options.execDelayMs === 'number' ? options.execDelayMs : 10;
+        this.mutatorBatchSize = options.mutatorBatchSize || 64;
+        this.pythonBin = options.pythonBin || 'python';
+        this.mutatorSeed = Number.isInteger(options.mutatorSeed) ? options.mutatorSeed : null;
+        this.sink = options.sink || '';
+        this.mutatorClient = null;
+        this.mutantQueue = [];
+        // 실행 사이 대기 (배치/헤드리스는 0, 화면을 실행마다 다시 그리는 TUI 만 준다)
+        this.execDelayMs = typeof options.execDelayMs === 'number' ? options.execDelayMs : 0;
+        this.timeBudgetMs = typeof options.timeBudgetMs === 'number' && options.timeBudgetMs > 0 ? options.timeBudgetMs : 0;
         this.saveCrashes = typeof options.saveCrashes === 'boolean' ? options.saveCrashes : true;
-        if (!fs.existsSync(this.corpusDir)) fs.mkdirSync(this.corpusDir, { recursive: true });
+        // tiered: tierBatchSize 개를 실행한 뒤 커버리지를 한 번만 가져오고(cheap),
+        // 그 합집합이 coverageMap 에서 아직 못 본 버킷 비트가 남은 인덱스를 건드렸을 때만
+        // 배치를 하나씩 다시 실행해 입력별 trace 를 coverageMap 과 비교한다(precise)
+        this.coverageMode = options.coverageMode === 'tiered' ? 'tiered' : 'precise';
+        this.tierBatchSize = options.tierBatchSize || 16;
+        this.tierBatch = [];
+        this.tierCounts = { cheap: 0, precise: 0 };
+        this.lastCoverage = { coverage: 0, cumulativeCoverage: 0 };
+        // 시드가 cminThreshold 개를 넘고 지난 최소화 때의 두 배가 되면 튜플 합집합을 유지하는 최소 집합으로 줄인다 (0 이면 끔)
+        this.cminThreshold = Number.isInteger(options.cminThreshold) ? options.cminThreshold : 256;
+        this.cminLog = [];
+        // trimSeeds: 새 경로 입력을 저장하기 전에 같은 경로 서명을 유지하는 가장 짧은 입력으로 줄인다
+        this.trimSeeds = options.trimSeeds === true;
+        this.trimExecs = options.trimExecs || 64;
+        // instrument: inspector 대신 로드 시 계측한 블록 카운터를 동기적으로 읽는다
+        this.coverageBackend = options.coverageBackend === 'instrument' ? 'instrument' : 'inspector';
+        this.counters = null;
+        this.blockIds = null;
+        this.callPlans = null;
+        // 진입 함수: 지정되면 그 export 하나만 실행한다 (없으면 경고용 플래그만 세우고 전부 실행)
+        this.entry = options.entry || '';
+        this.entryMissing = false;
+        // 부작용 모듈(child_process, fs 쓰기, net/http, DB)은 호출만 기록하는 가짜로 바꿔 로드한다
+        this.useMocks = options.mocks !== false;
+        this.recorder = new CallRecorder();
+        this.restoreMocks = null;
+        // 기록된 sink 호출로 실행마다 도달/익스플로잇을 판정한다 (mocks 가 꺼져 있으면 판정 없음)
+        this.oracle = new SinkOracle(this.sink);
+        // CmpLog: 하네스의 비교 리터럴과 실행 중 includes/startsWith/RegExp.test 피연산자를 변이 사전으로 보낸다
+        this.cmplog = options.cmplog === false ? null : new CmpLog();
+        this.restoreCmpLog = null;
     }
 
     async init(targetJSPath, mutatorPyPath, seedFilePath) {
         this.targetFilePath = path.resolve(targetJSPath);
         delete require.cache[require.resolve(this.targetFilePath)];
-        if (typeof global.db === 'undefined') {
-            global.db = {
-                all(query, params, cb) {
-                    if (typeof params === 'function') {
-                        cb = params;
-                        params = [];
-                    }
-                    if (typeof cb === 'function') {
-                        cb(null, []);
-                    }
-                }
-            };
+        if (typeof global.db === 'undefined') global.db = createGlobalDb(this.recorder);
+        if (this.useMocks && !this.restoreMocks) {
+            this.restoreMocks = installMocks({ targetPath: this.targetFilePath, recorder: this.recorder });
         }
-        this.targetModule = require(this.targetFilePath);
         this.mutatorPyPath = mutatorPyPath || '';
-        this.session = new inspector.Session();
-        this.session.connect();
-        await this._post('Profiler.enable');
-        await this._post('Profiler.startPreciseCoverage', { detailed: true, callCount: true, allowSampled: false });
-        if (seedFilePath && fs.existsSync(seedFilePath)) {
-            const seedRaw = fs.readFileSync(seedFilePath, 'utf-8');
-            const seeds = seedRaw.split(/\r?\n/).map(s => s.trim()).filter(Boolean);
-            if (seeds.length) this.seedInputs.push(...seeds);
-            else this.seedInputs.push('initial');
+        if (!this.corpusDir) this.corpusDir = corpusNamespace(this.corpusRoot, this.targetFilePath, this.runId);
+        if (!fs.existsSync(this.corpusDir)) fs.mkdirSync(this.corpusDir, { recursive: true });
+        this.manifest = new CorpusManifest(this.corpusDir, path.basename(this.targetFilePath));
+        if (this.corpusFormat === 'pack') this.pack = new CorpusPackWriter(this.corpusDir, this.manifest);
+        this.crashBuckets = new CrashBuckets(this.targetFilePath);
+        this.hangs = new FindingCorpus(this.corpusDir, this.manifest, 'hang');
+        this.resourceFindings = new FindingCorpus(this.corpusDir, this.manifest, 'resource');
+        if (this.coverageBackend === 'instrument') {
+            const loaded = loadInstrumented(this.targetFilePath);
+            this.targetModule = loaded.exports;
+            this.counters = loaded.counters;
+            const record = this.ranges.script(`file://${this.targetFilePath}`);
+            this.blockIds = Uint32Array.from(loaded.blocks, b => this.ranges.intern(record, b.start, b.end));
+            this._locateSink();
+            if (this.sinkDistance) {
+                this.sinkBlocks = [];
+                loaded.blocks.forEach((b, i) => { if (this.sinkDistance.contains(b.start, b.end)) this.sinkBlocks.push(i); });
+            }
         } else {
-            this.seedInputs.push('initial');
+            this.targetModule = require(this.targetFilePath);
+            this._locateSink();
+            this.session = new inspector.Session();
+            this.session.connect();
+            await this._post('Profiler.enable');
+            await this._post('Profiler.startPreciseCoverage', { detailed: true, callCount: true, allowSampled: false });
         }
+        this.callPlans = this._buildCallPlans();
+        try {
+            this.oracle.learnHarness(fs.readFileSync(this.targetFilePath, 'utf-8'));
+        } catch (e) {}
+        if (this.cmplog) {
+            try {
+                this.cmplog.harvest(fs.readFileSync(this.targetFilePath, 'utf-8'));
+            } catch (e) {}
+            if (!this.restoreCmpLog) this.restoreCmpLog = this.cmplog.install();
+        }
+        for (const seed of readSeedFile(seedFilePath)) this.scheduler.add(seed);
+        if (seedFilePath && fs.existsSync(seedFilePath)) this.manifest.append('seed', seedFilePath, { count: this.scheduler.size });
         this.stats.currentStage = 'ready';
     }
 
@@ -134,7 +366,7 @@ class FuzzerCore {
     _safeMutate(input) {
         if (!this.mutatorPyPath) return input;
         try {
-            const res = spawnSync('python', [this.mutatorPyPath], {
+            const res = spawnSync(this.pythonBin, [this.mutatorPyPath, ...this._mutatorArgs()], {
                 input: input,
                 encoding: 'utf-8',
                 maxBuffer: this.mutatorMaxBuffer,
@@ -152,6 +384,80 @@ class FuzzerCore {
         return this._safeMutate(String(input));
     }
 
+    _mutatorArgs() {
+        const args = [];
+        if (this.mutatorSeed !== null) args.push('--seed', String(this.mutatorSeed));
+        if (this.sink) args.push('--sink', this.sink);
+        // mutator 는 slowness 에서만 연산 비중을 바꾼다 (sink 는 시드 선택만 다르다)
+        if (this.objective === 'slowness') args.push('--objective', this.objective);
+        return args;
+    }
+
+    // init 뒤 퍼징 전에 mutator 서버를 미리 띄운다 (병렬 모드의 예비 워커가 start 를 기다리는 동안)
+    warmUp() {
+        this._startMutatorServer();
+    }
+
+    // 캠페인 동안 유지되는 mutator 서버 (반복마다 python을 새로 띄우지 않음)
+    _startMutatorServer() {
+        if (!this.mutatorPyPath || this.mutatorClient) return;
+        this.mutatorClient = new MutatorClient(this.mutatorPyPath, {
+            pythonBin: this.pythonBin,
+            timeoutMs: this.mutatorTimeoutMs,
+            extraArgs: this._mutatorArgs()
+        });
+        try {
+            this.mutatorClient.start();
+            if (this.cmplog) this.cmplog.resend();
+        } catch (e) {
+            this.mutatorClient = null;
+        }
+    }
+
+    _stopMutatorServer() {
+        if (!this.mutatorClient) return;
+        try { this.mutatorClient.close(); } catch (e) {}
+        this.mutatorClient = null;
+        this.mutantQueue = [];
+    }
+
+    // 시드 큐의 입력 목록 (대입하면 큐를 그 입력들로 바꾼다)
+    get seedInputs() {
+        return this.scheduler.inputs();
+    }
+
+    set seedInputs(seeds) {
+        this.scheduler.reset(seeds);
+    }
+
+    async _refillMutants() {
+        const entries = this.scheduler.pickBatch(this.mutatorBatchSize);
+        const seeds = entries.map(e => e.input);
+        const started = process.hrtime.bigint();
+        let mutants = seeds;
+        if (this.mutatorClient) {
+            try {
+                const tokens = this.cmplog ? this.cmplog.drain() : [];
+                if (tokens.length) await this.mutatorClient.addTokens(tokens);
+                mutants = await this.mutatorClient.mutateBatch(seeds);
+            } catch (e) {
+                // 서버가 죽었으면 한 번 재시작하고, 이번 배치는 원본 시드로 진행
+                this._stopMutatorServer();
+                this._startMutatorServer();
+                mutants = seeds;
+            }
+        } else if (this.mutatorPyPath) {
+            mutants = seeds.map(seed => this._safeMutate(seed));
+        }
+        if (seeds.length) this.stats.recordLatency('mutation', Number(process.hrtime.bigint() - started) / 1000 / seeds.length, seeds.length);
+        for (let i = 0; i < seeds.length; i++) this.mutantQueue.push({ seed: entries[i], input: mutants[i] });
+    }
+
+    async _nextTestInput() {
+        if (!this.mutantQueue.length) await this._refillMutants();
+        return this.mutantQueue.shift();
+    }
+
     async _takePreciseCoverage() {
         if (!this.session) return { result: [] };
 
@@ -170,36 +476,97 @@ class FuzzerCore {
         const scripts = result && result.result ? result.result : (result || []);
         let snapshotTotalRanges = 0;
         let snapshotExecutedRanges = 0;
+        const ranges = this.ranges;
+        const distance = this.sinkDistance;
+        this.trace.clear();
+        if (distance) distance.begin();
         for (const script of scripts) {
-            const url = script.url || (`<anon:${script.scriptId}>`);
-            if (!this._isTargetUrl(url)) continue;
+            const entry = this._scriptEntry(script);
+            if (!entry) continue;
             const funcs = script.functions || [];
             for (const func of funcs) {
-                const ranges = func.ranges || [];
-                for (const r of ranges) {
-                    const rangeKey = `${url}:${r.startOffset}:${r.endOffset}`;
-                    this.allRanges.add(rangeKey);
+                const funcRanges = func.ranges || [];
+                for (const r of funcRanges) {
+                    if (distance) distance.observe(r.startOffset, r.endOffset, r.count);
+                    const id = ranges.intern(entry, r.startOffset, r.endOffset);
                     snapshotTotalRanges++;
                     if (r.count && r.count > 0) {
-                        this.executedRanges.add(rangeKey);
+                        ranges.markExecuted(id);
                         snapshotExecutedRanges++;
+                        this.trace.add(ranges.mapIndex[id], bucketCount(r.count));
                     }
                 }
             }
         }
-        const totalRangesSeen = this.allRanges.size;
         const currentCoveragePercent = snapshotTotalRanges > 0 ? (snapshotExecutedRanges / snapshotTotalRanges) * 100 : 0;
-        const cumulativeCoveragePercent = totalRangesSeen > 0 ? (this.executedRanges.size / totalRangesSeen) * 100 : 0;
         return {
             coverage: currentCoveragePercent,
-            cumulativeCoverage: cumulativeCoveragePercent,
+            cumulativeCoverage: this._cumulativeCoverage(),
             totalRanges: snapshotTotalRanges,
             executedRanges: snapshotExecutedRanges,
-            cumulativeRanges: this.executedRanges.size,
-            allRangesCount: totalRangesSeen
+            cumulativeRanges: ranges.executedCount,
+            allRangesCount: ranges.size,
+            sinkDistance: distance ? distance.finish() : null
         };
     }
 
+    // instrument 백엔드: 카운터를 읽어 trace 를 채우고 다음 실행을 위해 0 으로 되돌린다
+    _readCounters() {
+        const counters = this.counters;
+        const ids = this.blockIds;
+        const ranges = this.ranges;
+        let executed = 0;
+        this.trace.clear();
+        for (let i = 0; i < ids.length; i++) {
+            const count = counters[i];
+            if (!count) continue;
+            executed++;
+            ranges.markExecuted(ids[i]);
+            this.trace.add(ranges.mapIndex[ids[i]], bucketCount(count));
+        }
+        const distance = this.sinkBlocks ? this.sinkDistance : null;
+        if (distance) {
+            distance.begin();
+            for (const i of this.sinkBlocks) distance.observe(ranges.starts[ids[i]], ranges.ends[ids[i]], counters[i]);
+        }
+        counters.fill(0);
+        return {
+            coverage: ids.length > 0 ? (executed / ids.length) * 100 : 0,
+            cumulativeCoverage: this._cumulativeCoverage(),
+            totalRanges: ids.length,
+            executedRanges: executed,
+            cumulativeRanges: ranges.executedCount,
+            allRangesCount: ranges.size,
+            sinkDistance: distance ? distance.finish() : null
+        };
+    }
+
+    async _collectCoverage() {
+        const started = process.hrtime.bigint();
+        const cov = this.counters ? this._readCounters() : this._extractCoverage(await this._takePreciseCoverage());
+        this.stats.recordLatency('coverage', Number(process.hrtime.bigint() - started) / 1000);
+        return cov;
+    }
+
+    // 대상 스크립트면 범위 테이블을, 아니면 null 을 돌려준다 (scriptId 단위 캐시)
+    _scriptEntry(script) {
+        const cached = this.scriptCache.get(script.scriptId);
+        if (cached !== undefined) return cached;
+        const url = script.url || (`<anon:${script.scriptId}>`);
+        const entry = this._isTargetUrl(url) ? this.ranges.script(url) : null;
+        this.scriptCache.set(script.scriptId, entry);
+        return entry;
+    }
+
+    _cumulativeCoverage() {
+        return this.ranges.size > 0 ? (this.ranges.executedCount / this.ranges.size) * 100 : 0;
+    }
+
+    // 마지막 runInput 의 trace 를 virgin 맵과 비교한다
+    checkNewCoverage() {
+        return this.coverageMap.hasNewBits(this.trace);
+    }
+
     _isTargetUrl(url) {
         try {
             // 파일 URL, 절대경로, 혹은 파일명 포함 여부로 판단
@@ -213,45 +580,232 @@ class FuzzerCore {
         }
     }
 
-    async runInput(input, timeoutMs = 2000) {
-        const exportedFuncs = Object.keys(this.targetModule).filter(k => typeof this.targetModule[k] === 'function');
+    async runInput(input, timeoutMs = this.execTimeoutMs) {
+        const outcome = await this._execute(input, timeoutMs);
+        this.tierCounts.precise++;
+        const started = process.hrtime.bigint();
+        let coverageData = null;
+        let cov;
+        if (this.counters) {
+            cov = this._readCounters();
+        } else {
+            coverageData = await this._takePreciseCoverage();
+            cov = this._extractCoverage(coverageData);
+        }
+        this.stats.recordLatency('coverage', Number(process.hrtime.bigint() - started) / 1000);
+        return Object.assign({ coverageData }, outcome, cov);
+    }
+
+    // tiered 모드 한 번 실행. 배치가 차면 newSeeds 에 이번 배치에서 새 경로를 연 입력들(_newSeed 형식)이 담긴다
+    async _runTiered(input, timeoutMs = this.execTimeoutMs, parent = null) {
+        const outcome = await this._execute(input, timeoutMs);
+        this.tierBatch.push({ input, parent });
+        this.trace.clear();
+        let newSeeds = [];
+        if (this.tierBatch.length >= this.tierBatchSize) newSeeds = await this._flushTierBatch(timeoutMs);
+        return Object.assign({ coverageData: null, newSeeds }, outcome, this.lastCoverage);
+    }
+
+    async _flushTierBatch(timeoutMs = this.execTimeoutMs) {
+        const batch = this.tierBatch;
+        this.tierBatch = [];
+        if (!batch.length) return [];
+        // 배치 전체의 실행 횟수가 합쳐진 커버리지. 입력 하나의 버킷은 합친 버킷 이하이므로
+        // 건드린 인덱스 중 그 아래 버킷 비트가 coverageMap 에 하나라도 남아 있으면 입력마다 다시 실행한다
+        const cov = await this._collectCoverage();
+        this.tierCounts.cheap += batch.length;
+        this.lastCoverage = { coverage: cov.coverage, cumulativeCoverage: cov.cumulativeCoverage };
+        this.scheduler.observe(this.trace, batch.length);
+        const replay = this.coverageMap.hasUnsaturated(this.trace);
+        this.trace.clear();
+        if (!replay) return [];
+        const newSeeds = [];
+        for (const { input, parent } of batch) {
+            const outcome = await this._execute(input, timeoutMs, false);
+            // 실행 중 예약된 콜백(nextTick, setImmediate)이 돌 틈을 줘야 그 범위가 이 입력의 trace 에 들어간다
+            await new Promise(r => setImmediate(r));
+            const distance = this._distanceOf(outcome, await this._collectCoverage());
+            if (distance === 0) this.stats.recordReach(input, 'coverage');
+            this.stats.recordDistance(distance);
+            this.tierCounts.precise++;
+            if (this.checkNewCoverage()) newSeeds.push(this._newSeed(input, parent, outcome.execUs, distance));
+        }
+        this.trace.clear();
+        return newSeeds;
+    }
+
+    // replay 는 primary=false 로 불러 크래시 저장과 함수별 통계에서 뺀다
+    async _execute(input, timeoutMs, primary = true) {
+        if (!this.callPlans) this.callPlans = this._buildCallPlans();
         let crashed = false;
         let crashInfo = null;
-        for (const funcName of exportedFuncs) {
+        let crashRecord = null;
+        let hungFunc = null;
+        const heapBefore = v8.getHeapStatistics().used_heap_size;
+        const started = process.hrtime.bigint();
+        if (this.heartbeat) this.heartbeat.begin(input);
+        // 이전 실행의 늦은 비동기 호출은 버린다
+        this.recorder.drain();
+        this.recorder.armed = true;
+        const argLists = [];
+        for (const plan of this.callPlans) {
+            const funcName = plan.funcName;
+            let callCrashed = false;
             try {
-                const targetFn = this.targetModule[funcName];
-                const paramNames = this._extractParamNames(targetFn);
-                const expectedArgs = Math.max(1, paramNames.length || (typeof targetFn.length === 'number' ? targetFn.length : 0));
-                const preparedArgs = this._prepareArguments(input, expectedArgs, paramNames);
-                const coercedArgs = this._coerceArguments(funcName, preparedArgs, expectedArgs, paramNames);
-
-                const res = targetFn(...coercedArgs);
-                if (res && typeof res.then === 'function') {
-                    await Promise.race([res, new Promise((_, rej) => setTimeout(() => rej(new Error('function timeout')), timeoutMs))]).catch(e => { throw e; });
-                }
+                const args = plan.decode(input);
+                argLists.push(args);
+                if (this.cmplog) this.cmplog.armed = true;
+                const res = plan.fn(...args);
+                if (res && typeof res.then === 'function') await withDeadline(res, timeoutMs);
             } catch (e) {
+                // 데드라인을 넘긴 Promise 는 크래시가 아니라 hang 으로 따로 남긴다
+                if (e instanceof ExecTimeoutError) {
+                    hungFunc = funcName;
+                    if (primary) this.stats.recordCall(funcName, false);
+                    continue;
+                }
                 crashed = true;
-                crashInfo = { func: funcName, message: e && e.message ? e.message : String(e), stack: e && e.stack ? e.stack : '' };
-                if (this.saveCrashes) {
-                    try {
-                        const fname = `crash_${Date.now()}_${process.hrtime.bigint().toString()}_${funcName}.json`;
-                        const fpath = path.join(this.corpusDir, fname);
-                        fs.writeFileSync(fpath, JSON.stringify({ input, crashInfo }, null, 2), { encoding: 'utf-8' });
-                    } catch (we) {}
+                callCrashed = true;
+                crashInfo = {
+                    func: funcName,
+                    message: e && e.message ? e.message : String(e),
+                    stack: e && e.stack ? e.stack : '',
+                    type: e && e.name ? e.name : typeof e,
+                    code: e && e.code ? String(e.code) : undefined
+                };
+                if (primary) {
+                    const { bucket, isNew } = this.crashBuckets.record(crashInfo, input);
+                    this.stats.uniqueCrashes.add(bucket.key);
+                    if (this.saveCrashes) {
+                        try {
+                            if (isNew) this._saveCrash(bucket);
+                            else if (!this.pack) this._markCrashDirty(bucket);
+                        } catch (we) {}
+                    }
+                    crashRecord = { file: bucket.file, func: funcName, message: crashInfo.message, input, bucket: bucket.key, hits: bucket.hits };
+                    if (isNew && this.crashRecords.length < MAX_RECORDED_FILES) this.crashRecords.push(crashRecord);
                 }
+            } finally {
+                if (this.cmplog) this.cmplog.armed = false;
             }
+            if (primary) this.stats.recordCall(funcName, callCrashed);
+        }
+        this.recorder.armed = false;
+        const execUs = Number(process.hrtime.bigint() - started) / 1000;
+        const heapDelta = v8.getHeapStatistics().used_heap_size - heapBefore;
+        if (this.heartbeat) this.heartbeat.end(primary);
+        if (primary) this.stats.recordLatency('target', execUs);
+        if (hungFunc && primary) this._recordHang(input, { func: hungFunc, timeoutMs, cause: 'async' });
+        // hang 은 시간이 데드라인으로 잘렸으므로 히스토그램에 넣지 않는다
+        const resource = primary && !hungFunc ? this._checkResources(input, execUs, heapDelta) : null;
+        const sinkCalls = this.recorder.drain();
+        const verdict = this.useMocks ? this.oracle.evaluate(sinkCalls, argLists) : null;
+        if (primary) this.stats.recordVerdict(input, verdict);
+        return { crashed, crashInfo, crashRecord, sinkCalls, verdict, execUs, heapDelta, resource, hung: Boolean(hungFunc) };
+    }
+
+    _checkResources(input, execUs, heapDelta) {
+        const finding = this.resources.observe(execUs, heapDelta);
+        if (!finding) return null;
+        if (finding.cause === 'slow') this.stats.slowInputs++;
+        else this.stats.memoryInputs++;
+        if (!finding.worst) return finding;
+        const { record, isNew } = this.resourceFindings.record(input,
+            { cause: finding.cause, value: finding.value, baseline: finding.baseline, ratio: finding.ratio });
+        if (isNew && this.onResource) {
+            try { this.onResource(input, record); } catch (e) {}
+        }
+        return finding;
+    }
+
+    // slowness 목표: 워밍업 뒤 가장 느린 실행을 갱신한 입력을 시드 큐에 넣는다 (새 경로가 아니면 파일로는 남기지 않는다)
+    _keepSlowSeed(input, parent, execUs) {
+        if (this.objective !== 'slowness' || this.resources.execUs.count < this.resources.warmup) return;
+        if (execUs < this.slowestUs * SLOWER_RATIO) return;
+        this.slowestUs = execUs;
+        this.scheduler.add(input, { execUs });
+        this.scheduler.reward(parent);
+    }
+
+    // sink 오라클이 도달을 판정했으면 0, 아니면 커버리지 범위로 잰 거리 (모르면 null)
+    _distanceOf(outcome, cov) {
+        if (outcome && outcome.verdict && outcome.verdict.reached) return 0;
+        return cov && typeof cov.sinkDistance === 'number' ? cov.sinkDistance : null;
+    }
+
+    // sink 목표: 지금까지보다 sink 에 가까이 간 입력을 (새 경로가 아니어도) 시드 큐에 넣는다
+    _keepCloserSeed(input, parent, distance, execUs, isNewPath) {
+        if (typeof distance !== 'number' || distance >= this.closestDistance) return;
+        this.closestDistance = distance;
+        if (this.objective !== 'sink' || isNewPath) return;
+        this.scheduler.add(input, { indices: this.trace.touched.slice(0, this.trace.length), execUs, distance });
+        this.scheduler.reward(parent);
+    }
+
+    // 하네스에서 리포트 sink 의 호출 자리를 찾는다 (sink 이름이 없거나 못 찾으면 거리를 재지 않는다)
+    _locateSink() {
+        if (!this.sink) return;
+        try {
+            const source = fs.readFileSync(this.targetFilePath, 'utf-8');
+            const target = locateSink(source, this.sink, this.sinkLine);
+            if (target) this.sinkDistance = new SinkDistance(source, target);
+        } catch (e) {}
+    }
+
+    _recordHang(input, extra) {
+        this.stats.hangs++;
+        const { record, isNew } = this.hangs.record(input, extra);
+        if (isNew && this.onHang) {
+            try { this.onHang(input, record); } catch (e) {}
+        }
+    }
+
+    // VulnerabilityContext.function_name 처럼 'obj.method' 나 'fn()' 형태로 와도 export 이름으로 맞춘다
+    _resolveEntry(name) {
+        if (!name || !this.targetModule) return null;
+        const exported = Object.keys(this.targetModule).filter(k => typeof this.targetModule[k] === 'function');
+        const bare = String(name).trim().replace(/\(.*\)$/, '').split(/[.:#]/).pop();
+        if (exported.includes(bare)) return bare;
+        const lower = bare.toLowerCase();
+        return exported.find(k => k.toLowerCase() === lower) || null;
+    }
+
+    // 진입 함수가 하나로 정해졌을 때만 경로/커버리지를 함수 단위로 귀속한다
+    _attributedEntry() {
+        return this.callPlans && this.callPlans.length === 1 ? this.callPlans[0].funcName : null;
+    }
+
+    // export 별 호출 계획: 파라미터 이름/개수/배열 위치는 하네스를 로드할 때 한 번만 구한다
+    _buildCallPlans() {
+        const plans = [];
+        const entry = this._resolveEntry(this.entry);
+        this.entryMissing = Boolean(this.entry) && !entry;
+        for (const funcName of Object.keys(this.targetModule)) {
+            if (entry && funcName !== entry) continue;
+            const fn = this.targetModule[funcName];
+            if (typeof fn !== 'function') continue;
+            const paramNames = this._extractParamNames(fn);
+            const expectedArgs = Math.max(1, paramNames.length || (typeof fn.length === 'number' ? fn.length : 0));
+            const arrayParams = [];
+            for (let i = 0; i < expectedArgs; i++) arrayParams.push(this._isArrayParam(paramNames[i]));
+            plans.push({
+                funcName,
+                fn,
+                paramNames,
+                expectedArgs,
+                arrayParams,
+                decode: input => this._coerceArguments(this._prepareArguments(input, expectedArgs, arrayParams), expectedArgs, arrayParams)
+            });
         }
-        const covResult = await this._takePreciseCoverage();
-        const cov = this._extractCoverage(covResult);
-        return Object.assign({ crashed, crashInfo, coverageData: covResult }, cov);
+        return plans;
     }
 
-    _prepareArguments(rawInput, expectedArgs, paramNames = []) {
+    _prepareArguments(rawInput, expectedArgs, arrayParams = []) {
         const args = [];
         const input = rawInput ?? '';
 
         if (expectedArgs <= 1) {
-            return [this._coerceToken(input, paramNames[0])];
+            return [this._coerceToken(input, arrayParams[0])];
         }
 
         if (typeof input === 'string') {
@@ -289,10 +843,10 @@ class FuzzerCore {
         }
 
         const limited = args.slice(0, expectedArgs);
-        return limited.map((value, idx) => this._coerceToken(value, paramNames[idx]));
+        return limited.map((value, idx) => this._coerceToken(value, arrayParams[idx]));
     }
 
-    _coerceArguments(funcName, preparedArgs, expectedArgs, paramNames = []) {
+    _coerceArguments(preparedArgs, expectedArgs, arrayParams = []) {
         const normalized = Array.isArray(preparedArgs)
             ? preparedArgs.slice(0, expectedArgs)
             : [preparedArgs];
@@ -302,8 +856,7 @@ class FuzzerCore {
         }
 
         for (let i = 0; i < expectedArgs; i++) {
-            const name = paramNames[i] || '';
-            if (this._isArrayParam(name)) {
+            if (arrayParams[i]) {
                 if (!Array.isArray(normalized[i])) {
                     if (typeof normalized[i] === 'string') {
                         const parts = normalized[i].split(',').map(v => v.trim()).filter(Boolean);
@@ -327,12 +880,12 @@ class FuzzerCore {
         return normalized;
     }
 
-    _coerceToken(value, paramName = '') {
+    _coerceToken(value, isArray = false) {
         if (value === undefined || value === null) return value;
         if (typeof value !== 'string') return value;
         const trimmed = value.trim();
         if (!trimmed.length) return trimmed;
-        if (this._isArrayParam(paramName)) {
+        if (isArray) {
             if (trimmed.startsWith('[') && trimmed.endsWith(']')) {
                 try {
                     const parsed = JSON.parse(trimmed);
@@ -373,43 +926,77 @@ class FuzzerCore {
         return /(args?|list|array|items|values|options|commands|parameters)/i.test(name);
     }
 
-    async startFuzzing(maxIterations = 1000, updateCallback = () => {}) {
+    // updateCallback 이 없으면 실행마다 stats.toJSON() (지연 시간 백분위 계산)을 만들지 않는다
+    async startFuzzing(maxIterations = 1000, updateCallback = null) {
         this.isRunning = true;
         this.stats.currentStage = 'fuzzing';
-        for (let i = 0; i < maxIterations && this.isRunning; i++) {
-            const seed = this.seedInputs[Math.floor(Math.random() * this.seedInputs.length)];
-            const testInput = this._safeMutate(seed);
+        this._startMutatorServer();
+        const tiered = this.coverageMode === 'tiered';
+        const deadline = this.timeBudgetMs ? Date.now() + this.timeBudgetMs : Infinity;
+        for (let i = 0; i < maxIterations && this.isRunning && Date.now() < deadline; i++) {
+            const { input: testInput, seed: parent } = await this._nextTestInput();
+            // tiered 도 첫 실행은 precise 로 돌린다. coverageMap 이 비어 있어 어차피 다시 실행할 배치이고,
+            // 모듈 로드 때 실행된 범위가 배치 합집합에만 남고 입력별 trace 에서 빠지는 일을 막는다
+            const cheap = tiered && this.tierCounts.precise > 0;
             let result;
             try {
-                result = await this.runInput(testInput);
+                result = cheap ? await this._runTiered(testInput, this.execTimeoutMs, parent) : await this.runInput(testInput);
             } catch (e) {
-                result = { coverage: 0, cumulativeCoverage: (this.executedRanges.size / Math.max(1, this.allRanges.size)) * 100, crashed: false, coverageData: null };
+                result = { coverage: 0, cumulativeCoverage: this._cumulativeCoverage(), crashed: false, coverageData: null };
             }
-            let isNewPath = false;
-            try {
-                const coveragePayload = result.coverageData;
-                if (this.sigMgr && typeof this.sigMgr.checkNewCoverage === 'function') {
-                    isNewPath = this.sigMgr.checkNewCoverage(coveragePayload, { filter: url => this._isTargetUrl(url) });
-                } else {
-                    if (result.cumulativeRanges > (this.stats.paths + 0)) isNewPath = true;
+            let newSeeds = [];
+            // tiered 의 한 번 실행은 배치 합집합 커버리지만 보므로 거리는 재실행한 새 경로 입력에만 붙는다
+            const distance = cheap ? null : this._distanceOf(result, result);
+            if (distance === 0) this.stats.recordReach(testInput, 'coverage');
+            this.stats.recordDistance(distance);
+            if (cheap) {
+                newSeeds = result.newSeeds || [];
+            } else {
+                try {
+                    this.scheduler.observe(this.trace);
+                    if (this.checkNewCoverage()) newSeeds = [this._newSeed(testInput, parent, result.execUs, distance)];
+                } catch (e) {
+                    newSeeds = [];
                 }
-            } catch (e) {
-                isNewPath = false;
             }
-            if (isNewPath) {
-                try {
-                    const fname = `input_${Date.now()}_${process.hrtime.bigint().toString()}.txt`;
-                    fs.writeFileSync(path.join(this.corpusDir, fname), testInput, { encoding: 'utf-8' });
-                    this.seedInputs.push(testInput);
-                } catch (e) {}
+            for (const seed of newSeeds) {
+                this.scheduler.reward(seed.parent);
+                await this._keepNewSeed(seed);
             }
-            this.stats.updateExec(testInput, result.coverage, result.cumulativeCoverage, result.crashed, isNewPath);
-            try { updateCallback(this.stats.toJSON()); } catch (e) {}
-            await new Promise(r => setTimeout(r, this.execDelayMs));
+            if (!newSeeds.length && !result.hung && result.execUs) this._keepSlowSeed(testInput, parent, result.execUs);
+            if (!result.hung) this._keepCloserSeed(testInput, parent, distance, result.execUs, newSeeds.length > 0);
+            if (newSeeds.length && !(tiered && this.tierBatch.length)) await this._maybeMinimizeSeeds();
+            if (result.crashed && this.onCrash) {
+                try { this.onCrash(testInput, result.crashInfo, result.crashRecord); } catch (e) {}
+            }
+            this.stats.updateExec(testInput, result.coverage, result.cumulativeCoverage, result.crashed, newSeeds.length > 0,
+                this._attributedEntry());
+            // tiered 모드에서는 배치 하나가 여러 경로를 한꺼번에 찾을 수 있다
+            if (newSeeds.length > 1) this.stats.paths += newSeeds.length - 1;
+            if (updateCallback) {
+                try { updateCallback(this.stats.toJSON()); } catch (e) {}
+            }
+            // 대기가 없어도 한 번은 이벤트 루프에 양보한다 (SIGINT, stop 메시지, 타이머)
+            await new Promise(r => (this.execDelayMs > 0 ? setTimeout(r, this.execDelayMs) : setImmediate(r)));
+        }
+        if (tiered) {
+            try {
+                const newSeeds = await this._flushTierBatch();
+                for (const seed of newSeeds) {
+                    this.scheduler.reward(seed.parent);
+                    await this._keepNewSeed(seed);
+                }
+                this.stats.paths += newSeeds.length;
+            } catch (e) {}
         }
         this.isRunning = false;
+        this._stopMutatorServer();
+        await this.flushCrashes();
+        if (this.pack) await this.pack.flush();
         this.stats.currentStage = 'completed';
-        try { updateCallback(this.stats.toJSON()); } catch (e) {}
+        if (updateCallback) {
+            try { updateCallback(this.stats.toJSON()); } catch (e) {}
+        }
         try {
             await this._post('Profiler.stopPreciseCoverage');
             await this._post('Profiler.disable');
@@ -417,9 +1004,122 @@ class FuzzerCore {
         try { this.session.disconnect(); } catch (e) {}
     }
 
+    // 통계/virgin 맵/크래시 저장에 영향 없이 입력 하나를 실행하고 trace 의 (맵 인덱스 * 256 + 버킷) 튜플을 돌려준다
+    async traceInput(input, timeoutMs = this.execTimeoutMs) {
+        const outcome = await this._execute(input, timeoutMs, false);
+        await this._collectCoverage();
+        const { touched, bits } = this.trace;
+        const tuples = new Array(this.trace.length);
+        for (let i = 0; i < this.trace.length; i++) tuples[i] = touched[i] * 256 + bits[touched[i]];
+        const signature = this.trace.signature();
+        this.trace.clear();
+        return { crashed: outcome.crashed, crashInfo: outcome.crashInfo, tuples, signature };
+    }
+
+    // 방금 수집한 trace 로 새 시드 기록을 만든다. parent 는 이 입력을 낳은 시드 큐 항목
+    _newSeed(input, parent, execUs, distance = null) {
+        const trace = this.trace;
+        return { input, parent, execUs, distance, signature: trace.signature(), indices: trace.touched.slice(0, trace.length) };
+    }
+
+    async _keepNewSeed(seed) {
+        let input = seed.input;
+        if (this.trimSeeds) {
+            try {
+                input = (await trimInput(this, input, this.trimExecs)).input;
+            } catch (e) {}
+        }
+        this._saveNewSeed(input, seed.signature, { indices: seed.indices, execUs: seed.execUs, distance: seed.distance });
+    }
+
+    async _maybeMinimizeSeeds() {
+        // cmin 은 튜플마다 가장 짧은 입력만 남기므로 slowness 목표의 느린 시드를 지운다
+        if (!this.cminThreshold || this.objective === 'slowness') return;
+        const last = this.cminLog.length ? this.cminLog[this.cminLog.length - 1].kept : 0;
+        if (this.scheduler.size < Math.max(this.cminThreshold, last * 2)) return;
+        const result = await minimizeCorpus(this, this.seedInputs);
+        if (!result.kept.length) return;
+        this.scheduler.retain(result.kept);
+        this.cminLog.push({ total: result.total, kept: result.kept.length, tuples: result.tuples, execs: this.stats.totalExecs });
+    }
+
+    _crashDocument(bucket) {
+        return {
+            input: bucket.input,
+            crashInfo: bucket.crashInfo,
+            bucket: { key: bucket.key, type: bucket.type, frames: bucket.frames, hits: bucket.hits, firstSeen: bucket.firstSeen, lastSeen: bucket.lastSeen }
+        };
+    }
+
+    // 새 버킷의 저장 위치를 정한다. pack 이면 대표 입력을 pack 큐에 넣고, 아니면 crash_<버킷>.json 을 flush 때 쓴다
+    _saveCrash(bucket) {
+        if (this.pack) {
+            bucket.file = this.pack.append('crash', JSON.stringify(this._crashDocument(bucket)),
+                { func: bucket.func, message: bucket.message, bucket: bucket.key });
+            return;
+        }
+        bucket.file = path.join(this.corpusDir, `crash_${bucket.key}_${bucket.func}.json`);
+        this._markCrashDirty(bucket);
+    }
+
+    _markCrashDirty(bucket) {
+        this.dirtyCrashes.add(bucket);
+        if (this.crashFlushTimer) return;
+        this.crashFlushTimer = setTimeout(() => this.flushCrashes(), CRASH_FLUSH_INTERVAL_MS);
+        if (this.crashFlushTimer.unref) this.crashFlushTimer.unref();
+    }
+
+    // 바뀐 버킷 파일(대표 입력 + 히트 수)을 비동기로 쓴다. 처음 쓰는 버킷만 매니페스트에 남긴다
+    flushCrashes() {
+        if (this.crashFlushTimer) {
+            clearTimeout(this.crashFlushTimer);
+            this.crashFlushTimer = null;
+        }
+        if (!this.dirtyCrashes.size) return this.crashFlushing;
+        const batch = Array.from(this.dirtyCrashes);
+        this.dirtyCrashes.clear();
+        this.crashFlushing = this.crashFlushing.then(async () => {
+            for (const bucket of batch) {
+                try {
+                    await fs.promises.writeFile(bucket.file, JSON.stringify(this._crashDocument(bucket), null, 2), { encoding: 'utf-8' });
+                } catch (e) {
+                    continue;
+                }
+                if (this.persistedCrashes.has(bucket.key)) continue;
+                this.persistedCrashes.add(bucket.key);
+                if (this.manifest) this.manifest.append('crash', bucket.file, { func: bucket.func, message: bucket.message, bucket: bucket.key });
+            }
+        });
+        return this.crashFlushing;
+    }
+
+    // signature 는 이 입력의 경로 서명. 생략하면 방금 수집한 trace 로 계산한다. meta 는 시드 큐에 넘길 { indices, execUs }
+    _saveNewSeed(input, signature = this.trace.signature(), meta = {}) {
+        let fpath = null;
+        try {
+            if (this.pack) {
+                fpath = this.pack.append('new-path', input, { signature });
+            } else {
+                const fname = `input_${Date.now()}_${process.hrtime.bigint().toString()}.txt`;
+                fpath = path.join(this.corpusDir, fname);
+                fs.writeFileSync(fpath, input, { encoding: 'utf-8' });
+                if (this.manifest) this.manifest.append('new-path', fpath, { signature });
+            }
+            if (this.newCorpus.length < MAX_RECORDED_FILES) this.newCorpus.push(fpath);
+            this.scheduler.add(input, meta);
+        } catch (e) {
+            fpath = null;
+        }
+        if (this.onNewSeed) {
+            try { this.onNewSeed(input, fpath); } catch (e) {}
+        }
+        return fpath;
+    }
+
     stop() {
         this.isRunning = false;
         this.stats.currentStage = 'stopping';
+        this._stopMutatorServer();
         try { this._post('Profiler.stopPreciseCoverage').catch(()=>{}); } catch {}
         try { this._post('Profiler.disable').catch(()=>{}); } catch {}
         try { this.session.disconnect(); } catch {}
@@ -427,12 +1127,13 @@ class FuzzerCore {
 
     addSeed(seed) {
         if (!seed) return;
-        this.seedInputs.push(String(seed));
+        this.scheduler.add(seed);
     }
 
     resetCoverage() {
-        this.allRanges = new Set();
-        this.executedRanges = new Set();
+        this.ranges = new RangeInterner();
+        this.scriptCache = new Map();
+        if (!this.sharedVirginMap) this.coverageMap = new CoverageMap();
     }
 
     exportState(dir) {
@@ -440,8 +1141,8 @@ class FuzzerCore {
             if (!fs.existsSync(dir)) fs.mkdirSync(dir, { recursive: true });
             const state = {
                 stats: this.stats.toJSON(),
-                allRanges: Array.from(this.allRanges),
-                executedRanges: Array.from(this.executedRanges),
+                allRanges: this.ranges.keys(),
+                executedRanges: this.ranges.keys(true),
                 seeds: this.seedInputs.slice()
             };
             const fname = path.join(dir, `fuzzer_state_${Date.now()}.json`);
@@ -458,8 +1159,15 @@ class FuzzerCore {
             const raw = fs.readFileSync(file, 'utf-8');
             const st = JSON.parse(raw);
             if (st.seeds && Array.isArray(st.seeds)) this.seedInputs = st.seeds;
-            if (st.allRanges && Array.isArray(st.allRanges)) this.allRanges = new Set(st.allRanges);
-            if (st.executedRanges && Array.isArray(st.executedRanges)) this.executedRanges = new Set(st.executedRanges);
+            if (st.allRanges && Array.isArray(st.allRanges)) {
+                for (const key of st.allRanges) this.ranges.internKey(String(key));
+            }
+            if (st.executedRanges && Array.isArray(st.executedRanges)) {
+                for (const key of st.executedRanges) {
+                    const id = this.ranges.internKey(String(key));
+                    if (id >= 0) this.ranges.markExecuted(id);
+                }
+            }
             return true;
         } catch (e) {
             return false;
@@ -467,4 +1175,4 @@ class FuzzerCore {
     }
 }
 
-module.exports = { FuzzerCore, FuzzingStats };
+module.exports = { FuzzerCore, FuzzingStats, readSeedFile, MAX_RECORDED_FILES };
@@ -1,5 +1,9 @@
 const path = require('path');
 const { FuzzerCore } = require('./fuzzer');
+const { ParallelFuzzer } = require('./parallel_fuzzer');
+const { minimizeCorpus, trimInput } = require('./corpus_min');
+const { readCorpus, readPack } = require('./corpus_pack');
+const { StatsFile } = require('./exec_stats');
 
 class FuzzerUI {
     constructor(fuzzer) {
@@ -125,6 +129,19 @@ class FuzzerUI {
         const trend = stats.currentCoverage >= stats.maxCoverage * 0.95 ? '↗' : 
                      stats.currentCoverage >= stats.maxCoverage * 0.8 ? '→' : '↘';
         this.writeAt(rightBoxStart, 7, `Trend          : ${trend}`, 'cyan');
+        const target = stats.latency.target;
+        if (target.count) {
+            const [p50, p99] = target.percentiles([50, 99]);
+            const coverageMs = stats.latency.coverage.sum / 1000;
+            this.writeAt(rightBoxStart, 8, `Exec p50/p99   : ${(p50 / 1000).toFixed(2)}/${(p99 / 1000).toFixed(2)} ms   `, 'yellow');
+            this.writeAt(rightBoxStart, 9, `Cov/exec time  : ${(coverageMs / Math.max(1, target.sum / 1000)).toFixed(2)}x   `);
+        }
+        if (stats.firstReach) {
+            this.writeAt(rightBoxStart, 10, `Time to sink   : ${(stats.firstReach.ms / 1000).toFixed(1)}s (${stats.firstReach.execs} execs)   `, 'red');
+        }
+        if (stats.closestDistance !== null) {
+            this.writeAt(rightBoxStart, 11, `Sink distance  : ${stats.closestDistance}   `, 'magenta');
+        }
 
         if (this.isInteractiveMode) {
             const userInputText = `Your Input: "${this.inputBuffer}"`;
@@ -252,41 +269,42 @@ class FuzzerUI {
         process.exit(0);
     }
 
-    async sendInputToFuzzer(input) {
+    async sendInputToFuzzer(input, mutate = true) {
         try {
-            const mutatedInput = this.fuzzer.mutateInput(input);
+            const mutatedInput = mutate ? this.fuzzer.mutateInput(input) : input;
             
+            const started = process.hrtime.bigint();
             const result = await this.fuzzer.runInput(mutatedInput);
 
             let isNewPath = false;
             try {
-                if (this.fuzzer.sigMgr && typeof this.fuzzer.sigMgr.checkNewCoverage === 'function') {
-                    isNewPath = this.fuzzer.sigMgr.checkNewCoverage(result.coverageData, { filter: url => url.endsWith('.js') });
-                } else {
-                    isNewPath = result.cumulativeRanges > this.fuzzer.stats.paths;
-                }
+                isNewPath = this.fuzzer.checkNewCoverage();
             } catch (e) {
                 isNewPath = false;
             }
 
-            this.fuzzer.stats.updateExec(mutatedInput, result.coverage, result.cumulativeCoverage, result.crashed, isNewPath);
+            this.fuzzer.stats.updateExec(mutatedInput, result.coverage, result.cumulativeCoverage, result.crashed, isNewPath,
+                this.fuzzer._attributedEntry());
+            this.lastRun = { input: mutatedInput, result, isNewPath, execMs: Number(process.hrtime.bigint() - started) / 1e6 };
             
-            if (isNewPath || result.crashed) {
+            // 크래시는 _execute 가 스택 서명 버킷으로 묶어 따로 저장한다
+            if (isNewPath && !result.crashed) {
                 const timestamp = Date.now();
-                const filename = result.crashed ? 
-                    `crash_${timestamp}.txt` : 
-                    `input_${timestamp}.txt`;
+                const filename = `input_${timestamp}.txt`;
                 
                 const fs = require('fs');
+                const filePath = path.join(this.fuzzer.corpusDir, filename);
                 fs.writeFileSync(
-                    path.join(this.fuzzer.corpusDir, filename), 
+                    filePath, 
                     mutatedInput
                 );
                 
-                if (isNewPath) {
-                    this.fuzzer.seedInputs.push(mutatedInput);
+                if (this.fuzzer.manifest) {
+                    this.fuzzer.manifest.append('new-path', filePath, { signature: this.fuzzer.trace.signature() });
                 }
+                this.fuzzer.newCorpus.push(filePath);
             }
+            if (isNewPath) this.fuzzer.addSeed(mutatedInput);
             
         } catch (error) {
             console.error('Error in interactive fuzzing:', error);
@@ -301,6 +319,39 @@ Usage: node fuzzer_interface.js <target_js> <mutator_py> [options] [seed_file]
 Options:
     --batch [iterations]    Batch mode (default: 1000 iterations)
     --interactive          Interactive mode with real-time input
+    --cmin                 Minimize the harness corpus (seed file + corpus namespace) to a set keeping the same coverage
+    --tmin <file>          Trim one input (input_*.txt, crash_*.json or <name>.pack#<n>) keeping its path or crash bucket
+    --out <path>           cmin: output directory (default: <corpus>/cmin), tmin: output file (default: <file>.min)
+    --trim-seeds           Batch mode: trim new-path inputs before saving them
+    --cmin-threshold <n>   Batch mode: minimize in-memory seeds once they exceed n (default 256, 0 disables)
+    --schedule <s>         Seed scheduling: energy (default, favors rare paths, short/fast and recently productive seeds) or uniform
+    --max-seeds <n>        Seed queue bound for the energy schedule (default 1024); favored seeds are always kept
+    --objective <o>        coverage (default), slowness (also queue inputs that set a new slowest execution,
+                           give slow seeds more energy and favor growth mutations) or sink (directed: also queue
+                           inputs that get closer to the --sink call site and give close seeds more energy)
+    --slow-factor <x>      Report inputs slower than x times the median execution time (default 10) to <corpus>/resources
+    --no-cmplog            Do not feed comparison operands (harness literals compared with ===/case/includes/startsWith,
+                           regex literals, strings searched at run time) into the mutation dictionary
+    --mutator-seed <n>     RNG seed for reproducible mutations
+    --sink <name>          Sink name from the report (selects mutation dictionary; its call site in the harness
+                           is the target of the sink distance and time-to-sink metrics)
+    --sink-line <n>        Report sink.line, picks the nearest call site when the harness calls the sink more than once
+    --workers <n>          Batch mode: fuzz with n worker threads sharing one coverage map
+    --time-budget <sec>    Stop fuzzing after this many seconds
+    --exec-timeout <ms>    Per-execution deadline (default 2000); inputs that exceed it are saved to <corpus>/hangs
+    --no-watchdog          Batch mode: run the harness in-process instead of in a watchdog-supervised worker
+                           (a synchronous hang then stalls the whole run)
+    --coverage-mode <m>    precise (default) or tiered (one coverage snapshot per batch, per-input replay on novelty)
+    --coverage-backend <b> inspector (default) or instrument (load-time block counters, no inspector)
+    --entry <function>     Only call this exported function (e.g. the report's flow function)
+    --no-mocks             Load real child_process/fs/net/http/DB modules instead of recording mocks
+    --corpus-root <dir>    Corpus root (default: coverage/corpus); files go to <dir>/<harness>/<run-id>/
+    --run-id <id>          Corpus namespace for this run (default: "default"), keeps concurrent runs apart
+    --corpus-format <f>    files (default: one file per input/crash) or pack (batched .pack + .idx)
+    --stats-file <path>    Batch mode: append the stats (exec/s, p50/p95/p99 target, coverage and mutation latency)
+                           as one JSON line per second; read it with python -m coverage.stats_tail <path>
+    --json                 No TUI, print one JSON result line when done (batch: run summary,
+                           interactive: the piped payload's coverage, verdict, new corpus and crashes)
     --help                 Show this help
 
 Examples:
@@ -323,7 +374,32 @@ function parseArgs() {
         mutatorPy: args[1],
         mode: 'batch',
         iterations: 1000,
-        seedFile: null
+        seedFile: null,
+        mutatorSeed: null,
+        sink: '',
+        sinkLine: 0,
+        workers: 1,
+        timeBudgetSec: 0,
+        execTimeoutMs: 0,
+        watchdog: true,
+        coverageMode: 'precise',
+        coverageBackend: 'inspector',
+        entry: '',
+        mocks: true,
+        corpusRoot: '',
+        runId: '',
+        corpusFormat: 'files',
+        tminFile: '',
+        out: '',
+        trimSeeds: false,
+        cminThreshold: undefined,
+        schedule: 'energy',
+        maxSeeds: 0,
+        objective: 'coverage',
+        slowFactor: 0,
+        cmplog: true,
+        statsFile: '',
+        json: false
     };
 
     for (let i = 2; i < args.length; i++) {
@@ -337,6 +413,79 @@ function parseArgs() {
             }
         } else if (arg === '--interactive') {
             config.mode = 'interactive';
+        } else if (arg === '--cmin') {
+            config.mode = 'cmin';
+        } else if (arg === '--tmin' && i + 1 < args.length) {
+            config.mode = 'tmin';
+            config.tminFile = args[i + 1];
+            i++;
+        } else if (arg === '--out' && i + 1 < args.length) {
+            config.out = args[i + 1];
+            i++;
+        } else if (arg === '--trim-seeds') {
+            config.trimSeeds = true;
+        } else if (arg === '--cmin-threshold' && i + 1 < args.length) {
+            config.cminThreshold = Math.max(0, parseInt(args[i + 1]) || 0);
+            i++;
+        } else if (arg === '--schedule' && i + 1 < args.length) {
+            config.schedule = args[i + 1];
+            i++;
+        } else if (arg === '--max-seeds' && i + 1 < args.length) {
+            config.maxSeeds = Math.max(0, parseInt(args[i + 1]) || 0);
+            i++;
+        } else if (arg === '--objective' && i + 1 < args.length) {
+            config.objective = args[i + 1];
+            i++;
+        } else if (arg === '--slow-factor' && i + 1 < args.length) {
+            config.slowFactor = Math.max(0, parseFloat(args[i + 1]) || 0);
+            i++;
+        } else if (arg === '--mutator-seed' && i + 1 < args.length) {
+            config.mutatorSeed = parseInt(args[i + 1]);
+            i++;
+        } else if (arg === '--coverage-mode' && i + 1 < args.length) {
+            config.coverageMode = args[i + 1];
+            i++;
+        } else if (arg === '--coverage-backend' && i + 1 < args.length) {
+            config.coverageBackend = args[i + 1];
+            i++;
+        } else if (arg === '--entry' && i + 1 < args.length) {
+            config.entry = args[i + 1];
+            i++;
+        } else if (arg === '--no-mocks') {
+            config.mocks = false;
+        } else if (arg === '--corpus-root' && i + 1 < args.length) {
+            config.corpusRoot = path.resolve(args[i + 1]);
+            i++;
+        } else if (arg === '--run-id' && i + 1 < args.length) {
+            config.runId = args[i + 1];
+            i++;
+        } else if (arg === '--corpus-format' && i + 1 < args.length) {
+            config.corpusFormat = args[i + 1];
+            i++;
+        } else if (arg === '--stats-file' && i + 1 < args.length) {
+            config.statsFile = path.resolve(args[i + 1]);
+            i++;
+        } else if (arg === '--json') {
+            config.json = true;
+        } else if (arg === '--exec-timeout' && i + 1 < args.length) {
+            config.execTimeoutMs = Math.max(0, parseInt(args[i + 1]) || 0);
+            i++;
+        } else if (arg === '--no-watchdog') {
+            config.watchdog = false;
+        } else if (arg === '--no-cmplog') {
+            config.cmplog = false;
+        } else if (arg === '--time-budget' && i + 1 < args.length) {
+            config.timeBudgetSec = Math.max(0, parseFloat(args[i + 1]) || 0);
+            i++;
+        } else if (arg === '--workers' && i + 1 < args.length) {
+            config.workers = Math.max(1, parseInt(args[i + 1]) || 1);
+            i++;
+        } else if (arg === '--sink-line' && i + 1 < args.length) {
+            config.sinkLine = Math.max(0, parseInt(args[i + 1]) || 0);
+            i++;
+        } else if (arg === '--sink' && i + 1 < args.length) {
+            config.sink = args[i + 1];
+            i++;
         } else if (!arg.startsWith('--')) {
             config.seedFile = arg;
         }
@@ -345,19 +494,229 @@ function parseArgs() {
     return config;
 }
 
-async function runBatchMode(fuzzer, ui, iterations) {
+// --json: TUI 없이 실행하고 끝나면 결과를 JSON 한 줄로 출력한다 (fuzzer_runner 가 수집)
+const protocolWrite = process.stdout.write.bind(process.stdout);
+// --no-watchdog 배치 TUI 의 실행 사이 대기 (화면 갱신 비용 때문)
+const UI_EXEC_DELAY_MS = 10;
+
+function printJsonResult(fuzzer, startedAt, asyncErrors) {
+    const result = {
+        type: 'result',
+        mode: 'batch',
+        target: fuzzer.targetFilePath,
+        elapsedMs: Date.now() - startedAt,
+        // 워커에서 돌면 워커들이 센 비동기 예외도 더한다
+        asyncErrors: asyncErrors + (fuzzer.asyncErrors || 0),
+        stats: fuzzer.stats.toJSON(),
+        newCorpus: fuzzer.newCorpus,
+        crashes: fuzzer.crashRecords,
+        crashBuckets: fuzzer.crashBuckets ? fuzzer.crashBuckets.summary() : [],
+        hangs: fuzzer.hangs ? fuzzer.hangs.records : [],
+        resources: Object.assign(fuzzer.resources.summary(),
+            { findings: fuzzer.resourceFindings ? fuzzer.resourceFindings.records : [] })
+    };
+    if (fuzzer.tierCounts) result.coverageTiers = fuzzer.tierCounts;
+    if (fuzzer.cminLog && fuzzer.cminLog.length) result.cmin = fuzzer.cminLog;
+    const scheduler = fuzzer.scheduler ? fuzzer.scheduler.summary() : fuzzer.schedulerSummary;
+    if (scheduler) result.scheduler = scheduler;
+    const cmplog = fuzzer.cmplog ? fuzzer.cmplog.summary() : fuzzer.cmplogSummary;
+    if (cmplog) result.cmplog = cmplog;
+    const sinkTarget = fuzzer.sinkDistance ? fuzzer.sinkDistance.summary() : fuzzer.sinkTarget;
+    if (sinkTarget) result.sinkTarget = sinkTarget;
+    // 반복을 다 돌지 못하고 멈췄으면 (재시작 제한 등) 그 이유
+    if (fuzzer.stats.stoppedReason) result.stoppedReason = fuzzer.stats.stoppedReason;
+    protocolWrite(JSON.stringify(result) + '\n');
+}
+
+// cmin/tmin 결과: --json 이면 결과 한 줄, 아니면 사람용 요약
+function printToolResult(config, result) {
+    if (config.json) {
+        protocolWrite(JSON.stringify(Object.assign({ type: 'result' }, result)) + '\n');
+    } else if (result.mode === 'cmin') {
+        console.log(`Corpus minimized: ${result.kept}/${result.total} inputs kept (${result.tuples} coverage tuples, ` +
+            `${result.duplicates} duplicates, ${result.crashed} crashing inputs skipped) -> ${result.out}`);
+    } else {
+        console.log(`Input trimmed: ${result.originalLength} -> ${result.length} chars in ${result.execs} execs ` +
+            `(${result.behavior}) -> ${result.out}`);
+    }
+}
+
+// 시드 파일과 하네스 코퍼스 네임스페이스의 입력(크래시 제외)을 최소 집합으로 줄여 out 디렉터리에 쓴다
+async function runCminMode(fuzzer, config) {
+    const fs = require('fs');
+    const corpus = readCorpus(fuzzer.corpusDir).filter(e => e.kind !== 'crash').map(e => e.data.toString('utf-8'));
+    const result = await minimizeCorpus(fuzzer, fuzzer.seedInputs.concat(corpus));
+    const outDir = path.resolve(config.out || path.join(fuzzer.corpusDir, 'cmin'));
+    fs.mkdirSync(outDir, { recursive: true });
+    const width = String(result.kept.length).length;
+    result.kept.forEach((input, i) => {
+        fs.writeFileSync(path.join(outDir, `input_${String(i).padStart(width, '0')}.txt`), input, { encoding: 'utf-8' });
+    });
+    printToolResult(config, {
+        mode: 'cmin', ok: true, target: fuzzer.targetFilePath, total: result.total, kept: result.kept.length,
+        duplicates: result.duplicates, crashed: result.crashed, tuples: result.tuples, out: outDir
+    });
+    process.exit(0);
+}
+
+// 입력 하나를 읽는다. crash_*.json 이면 input 필드를, "<name>.pack#<n>" 이면 pack 항목을 쓴다
+function readToolInput(file) {
+    const fs = require('fs');
+    const hash = file.lastIndexOf('#');
+    if (hash > 0 && file.slice(0, hash).endsWith('.pack')) {
+        const entry = readPack(file.slice(0, hash))[parseInt(file.slice(hash + 1))];
+        if (!entry) throw new Error(`pack entry not found: ${file}`);
+        return entry.kind === 'crash' ? JSON.parse(entry.data.toString('utf-8')).input : entry.data.toString('utf-8');
+    }
+    const raw = fs.readFileSync(file, 'utf-8');
+    if (file.endsWith('.json')) {
+        try {
+            const parsed = JSON.parse(raw);
+            if (parsed && typeof parsed.input === 'string') return parsed.input;
+        } catch (e) {}
+    }
+    return raw;
+}
+
+async function runTminMode(fuzzer, config) {
+    const fs = require('fs');
+    const input = readToolInput(config.tminFile);
+    const result = await trimInput(fuzzer, input);
+    const out = path.resolve(config.out || `${config.tminFile.replace(/#/g, '_')}.min`);
+    fs.writeFileSync(out, result.input, { encoding: 'utf-8' });
+    printToolResult(config, {
+        mode: 'tmin', ok: true, target: fuzzer.targetFilePath, behavior: result.behavior, execs: result.execs,
+        originalLength: result.original.length, length: result.input.length, input: result.input, out
+    });
+    process.exit(0);
+}
+
+// --json 대화형 모드에서 하네스 출력이 결과 줄을 오염시키지 않도록 버퍼에 모은다
+function captureConsole() {
+    const util = require('util');
+    const captured = { stdout: [], stderr: [] };
+    const writer = stream => (...args) => {
+        captured[stream].push(args.map(a => (typeof a === 'string' ? a : util.inspect(a, { depth: 3 }))).join(' '));
+    };
+    console.log = writer('stdout');
+    console.info = writer('stdout');
+    console.debug = writer('stdout');
+    console.warn = writer('stderr');
+    console.error = writer('stderr');
+    process.stdout.write = (chunk) => {
+        captured.stdout.push(String(chunk));
+        return true;
+    };
+    return captured;
+}
+
+// 배치(cmin/tmin 포함) --json 모드: stdout 은 결과 줄 전용이다. 실행이 길어 버퍼에 모으지 않고
+// 하네스 출력(워커 스레드에서 넘어오는 것 포함)을 stderr 로 돌린다 (하네스가 찍은 JSON 줄이 결과로 읽히지 않도록)
+function redirectConsoleToStderr() {
+    const toStderr = (...args) => console.error(...args);
+    console.log = toStderr;
+    console.info = toStderr;
+    console.debug = toStderr;
+    process.stdout.write = (chunk, encoding, callback) => process.stderr.write(chunk, encoding, callback);
+}
+
+// 파이프로 받은 페이로드를 한 번 실행하고 harness_worker 응답과 같은 필드의 결과 한 줄을 출력한다
+function runInteractiveJsonMode(fuzzer, ui, captured) {
+    const startedAt = Date.now();
+    let asyncErrors = 0;
+    const onAsyncError = (err) => {
+        asyncErrors++;
+        captured.stderr.push(`Uncaught ${err && err.stack ? err.stack : String(err)}`);
+    };
+    process.on('uncaughtException', onAsyncError);
+    process.on('unhandledRejection', onAsyncError);
+    let input = '';
+    process.stdin.on('data', (chunk) => {
+        input += chunk;
+    });
+    process.stdin.on('end', async () => {
+        await ui.sendInputToFuzzer(input.trim(), false);
+        // 비동기 콜백 출력이 결과에 잡히도록 한 틱 양보한다
+        await new Promise(r => setImmediate(r));
+        // 결과에 실린 크래시 파일이 실제로 있도록 버킷 flush 를 기다린다
+        await fuzzer.flushCrashes();
+        const run = ui.lastRun;
+        const result = {
+            type: 'result',
+            mode: 'interactive',
+            ok: Boolean(run),
+            target: fuzzer.targetFilePath,
+            elapsedMs: Date.now() - startedAt,
+            asyncErrors,
+            newCorpus: fuzzer.newCorpus,
+            crashes: fuzzer.crashRecords,
+            totalExecs: fuzzer.stats.totalExecs,
+            uniqueCrashes: fuzzer.stats.uniqueCrashes.size,
+            coverageMax: fuzzer.stats.maxCoverage,
+            stdout: captured.stdout.join('\n'),
+            stderr: captured.stderr.join('\n')
+        };
+        if (run) {
+            Object.assign(result, {
+                input: run.input,
+                coverage: run.result.coverage,
+                cumulativeCoverage: run.result.cumulativeCoverage,
+                crashed: run.result.crashed,
+                hung: run.result.hung,
+                heapDelta: run.result.heapDelta,
+                crashInfo: run.result.crashInfo,
+                isNewPath: run.isNewPath,
+                entry: fuzzer._attributedEntry(),
+                verdict: run.result.verdict,
+                sinkCalls: run.result.sinkCalls,
+                execMs: run.execMs
+            });
+        } else {
+            result.error = 'input execution failed';
+        }
+        protocolWrite(JSON.stringify(result) + '\n');
+        process.exit(0);
+    });
+}
+
+// --stats-file: 통계를 초마다 한 줄씩 남기고 끝나면 마지막 통계를 한 줄 더 남긴다
+function statsFileCallback(statsFile, callback = undefined) {
+    if (!statsFile) return callback;
+    return (stats) => {
+        statsFile.maybeWrite(stats);
+        if (callback) callback(stats);
+    };
+}
+
+async function runBatchJsonMode(fuzzer, iterations, statsFile = null) {
+    const startedAt = Date.now();
+    // 하네스가 비동기로 던진 예외(spawn ENOENT 등) 때문에 결과 없이 죽지 않도록 세기만 한다
+    let asyncErrors = 0;
+    process.on('uncaughtException', () => { asyncErrors++; });
+    process.on('unhandledRejection', () => { asyncErrors++; });
+    await fuzzer.startFuzzing(iterations, statsFileCallback(statsFile));
+    if (statsFile) statsFile.write(fuzzer.stats.toJSON());
+    printJsonResult(fuzzer, startedAt, asyncErrors);
+    process.exit(0);
+}
+
+async function runBatchMode(fuzzer, ui, iterations, statsFile = null) {
     ui.drawInterface();
     
-    await fuzzer.startFuzzing(iterations, () => {
+    await fuzzer.startFuzzing(iterations, statsFileCallback(statsFile, () => {
         ui.updateDisplay();
-    });
+    }));
+    if (statsFile) statsFile.write(fuzzer.stats.toJSON());
 
     setTimeout(() => {
         ui.clearScreen();
         console.log('Fuzzing completed!');
+        if (fuzzer.stats.stoppedReason) console.log(`Stopped early: ${fuzzer.stats.stoppedReason}`);
         console.log(`Total executions: ${fuzzer.stats.totalExecs}`);
         console.log(`Unique crashes: ${fuzzer.stats.uniqueCrashes.size}`);
         console.log(`Max coverage: ${fuzzer.stats.maxCoverage.toFixed(2)}%`);
+        const reach = fuzzer.stats.firstReach;
+        if (reach) console.log(`Time to sink: ${(reach.ms / 1000).toFixed(1)}s (${reach.execs} execs, ${reach.via})`);
         process.exit(0);
     }, 1000);
 }
@@ -372,13 +731,16 @@ async function runInteractiveMode(fuzzer, ui) {
             input += chunk;
         });
         process.stdin.on('end', async () => {
-            await ui.sendInputToFuzzer(input.trim());
+            // 파이프로 받은 페이로드는 변형하지 않고 그대로 실행한다
+            await ui.sendInputToFuzzer(input.trim(), false);
             // Fuzzing and analysis is done, now print results and exit.
             console.log('\nFuzzing completed!');
             console.log(`Total executions: ${fuzzer.stats.totalExecs}`);
             console.log(`Unique crashes: ${fuzzer.stats.uniqueCrashes.size}`);
             console.log(`Current cov    : ${fuzzer.stats.currentCoverage.toFixed(2)}%`);
             console.log(`Max coverage   : ${fuzzer.stats.maxCoverage.toFixed(2)}%`);
+            const verdict = ui.lastRun && ui.lastRun.result.verdict;
+            if (verdict) console.log(`Sink verdict   : ${JSON.stringify(verdict)}`);
             process.exit(0);
         });
         return;
@@ -414,6 +776,7 @@ async function runInteractiveMode(fuzzer, ui) {
 }
 
 async function main() {
+    let captured = null;
     try {
         const config = parseArgs();
         
@@ -428,16 +791,57 @@ async function main() {
             process.exit(1);
         }
 
-        const fuzzer = new FuzzerCore();
+        const fuzzerOptions = {
+            mutatorSeed: Number.isInteger(config.mutatorSeed) ? config.mutatorSeed : undefined,
+            sink: config.sink,
+            sinkLine: config.sinkLine,
+            timeBudgetMs: config.timeBudgetSec * 1000,
+            execTimeoutMs: config.execTimeoutMs,
+            coverageMode: config.coverageMode,
+            coverageBackend: config.coverageBackend,
+            entry: config.entry,
+            mocks: config.mocks,
+            corpusRoot: config.corpusRoot,
+            runId: config.runId,
+            corpusFormat: config.corpusFormat,
+            trimSeeds: config.trimSeeds,
+            cminThreshold: config.cminThreshold,
+            schedule: config.schedule,
+            maxSeeds: config.maxSeeds,
+            objective: config.objective,
+            slowFactor: config.slowFactor,
+            cmplog: config.cmplog
+        };
+        // 배치 모드는 기본으로 감시받는 워커 스레드에서 하네스를 돌린다 (동기 hang 은 실행 하나의 데드라인만 잃는다)
+        const parallel = config.mode === 'batch' && (config.workers > 1 || config.watchdog);
+        // 같은 스레드에서 실행마다 TUI 를 다시 그릴 때만 실행 사이에 쉰다 (병렬 모드의 화면은 워커 stats 주기로 갱신된다)
+        if (config.mode === 'batch' && !config.json && !parallel) fuzzerOptions.execDelayMs = UI_EXEC_DELAY_MS;
+        const fuzzer = parallel
+            ? new ParallelFuzzer(Object.assign({ workers: config.workers }, fuzzerOptions))
+            : new FuzzerCore(fuzzerOptions);
         const ui = new FuzzerUI(fuzzer);
+        const statsFile = config.statsFile ? new StatsFile(config.statsFile) : null;
+        // 로드 시점의 하네스 출력부터 모아야 하므로 init 전에 가로챈다
+        captured = config.mode === 'interactive' && config.json ? captureConsole() : null;
+        if (config.json && config.mode !== 'interactive') redirectConsoleToStderr();
         
         await fuzzer.init(
             path.resolve(config.targetJs), 
             config.mutatorPy, 
             config.seedFile
         );
+        if (fuzzer.entryMissing) {
+            console.error(`[WARN] - Entry function '${config.entry}' is not exported by the harness, calling all exports`);
+        }
 
-        if (config.mode === 'batch') {
+        if (config.mode === 'cmin') {
+            await runCminMode(fuzzer, config);
+        } else if (config.mode === 'tmin') {
+            await runTminMode(fuzzer, config);
+        } else if (config.mode === 'batch' && config.json) {
+            process.on('SIGINT', () => fuzzer.stop());
+            await runBatchJsonMode(fuzzer, config.iterations, statsFile);
+        } else if (config.mode === 'batch') {
             process.on('SIGINT', () => {
                 fuzzer.stop();
                 ui.clearScreen();
@@ -445,12 +849,19 @@ async function main() {
                 process.exit(0);
             });
             
-            await runBatchMode(fuzzer, ui, config.iterations);
+            await runBatchMode(fuzzer, ui, config.iterations, statsFile);
+        } else if (config.mode === 'interactive' && captured) {
+            runInteractiveJsonMode(fuzzer, ui, captured);
         } else if (config.mode === 'interactive') {
             await runInteractiveMode(fuzzer, ui);
         }
 
     } catch (error) {
+        if (captured) {
+            protocolWrite(JSON.stringify({ type: 'result', mode: 'interactive', ok: false, error: `Failed to initialize fuzzer: ${error && error.message ? error.message : String(error)}`,
+                stdout: captured.stdout.join('\n'), stderr: captured.stderr.join('\n') }) + '\n');
+            process.exit(1);
+        }
         console.error('Failed to initialize fuzzer:', error);
         process.exit(1);
     }
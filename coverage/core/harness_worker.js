@@ -0,0 +1,179 @@
+// coverage/core/harness_worker.js
+//
+// 하네스를 한 번만 require 하고 inspector 세션을 유지한 채 페이로드를 반복 실행하는 워커.
+// stdin/stdout 으로 JSON lines 를 주고받는다.
+//   -> {"ready": true, "target": "..."}                  (초기화 완료)
+//   <- {"id": 1, "input": "payload"}
+//   -> {"id": 1, "ok": true, "coverage": 66.6, ...}
+
+const path = require('path');
+const readline = require('readline');
+const { FuzzerCore } = require('./fuzzer');
+
+const protocolWrite = process.stdout.write.bind(process.stdout);
+
+// 하네스 출력이 프로토콜 채널을 오염시키지 않도록 요청 단위로 가로챈다
+const capture = { active: false, stdout: [], stderr: [] };
+
+function captureWriter(stream) {
+    return (...args) => {
+        if (!capture.active) return;
+        capture[stream].push(args.map(a => (typeof a === 'string' ? a : safeInspect(a))).join(' '));
+    };
+}
+
+function safeInspect(value) {
+    try {
+        return require('util').inspect(value, { depth: 3 });
+    } catch (e) {
+        return String(value);
+    }
+}
+
+console.log = captureWriter('stdout');
+console.info = captureWriter('stdout');
+console.debug = captureWriter('stdout');
+console.warn = captureWriter('stderr');
+console.error = captureWriter('stderr');
+process.stdout.write = (chunk) => {
+    if (capture.active) capture.stdout.push(String(chunk));
+    return true;
+};
+
+process.on('uncaughtException', (err) => {
+    if (capture.active) capture.stderr.push(`Uncaught ${err && err.stack ? err.stack : String(err)}`);
+});
+process.on('unhandledRejection', (err) => {
+    if (capture.active) capture.stderr.push(`Unhandled rejection ${err && err.stack ? err.stack : String(err)}`);
+});
+
+function send(message) {
+    protocolWrite(JSON.stringify(message) + '\n');
+}
+
+function parseArgs() {
+    const args = process.argv.slice(2);
+    const config = { targetJs: args[0], sink: '', coverageBackend: 'inspector', entry: '', mocks: true, corpusRoot: '', runId: '' };
+    for (let i = 1; i < args.length; i++) {
+        if (args[i] === '--sink' && i + 1 < args.length) {
+            config.sink = args[i + 1];
+            i++;
+        } else if (args[i] === '--entry' && i + 1 < args.length) {
+            config.entry = args[i + 1];
+            i++;
+        } else if (args[i] === '--coverage-backend' && i + 1 < args.length) {
+            config.coverageBackend = args[i + 1];
+            i++;
+        } else if (args[i] === '--no-mocks') {
+            config.mocks = false;
+        } else if (args[i] === '--corpus-root' && i + 1 < args.length) {
+            config.corpusRoot = path.resolve(args[i + 1]);
+            i++;
+        } else if (args[i] === '--run-id' && i + 1 < args.length) {
+            config.runId = args[i + 1];
+            i++;
+        }
+    }
+    return config;
+}
+
+async function handleRequest(fuzzer, request) {
+    const input = String(request.input ?? '');
+    capture.active = true;
+    capture.stdout = [];
+    capture.stderr = [];
+    const started = process.hrtime.bigint();
+    try {
+        const result = await fuzzer.runInput(input);
+        let isNewPath = false;
+        try {
+            isNewPath = fuzzer.checkNewCoverage();
+        } catch (e) {
+            isNewPath = false;
+        }
+        // 새 경로를 연 입력은 대화형 모드처럼 코퍼스에 저장한다
+        const newCorpusFile = isNewPath ? fuzzer._saveNewSeed(input) : null;
+        const entry = fuzzer._attributedEntry();
+        fuzzer.stats.updateExec(input, result.coverage, result.cumulativeCoverage, result.crashed, isNewPath, entry);
+        // 비동기 콜백 출력이 같은 요청에 잡히도록 한 틱 양보한다
+        await new Promise(r => setImmediate(r));
+        // 요청마다 한 번 실행이므로 응답 전에 크래시 버킷 파일을 써 둔다
+        await fuzzer.flushCrashes();
+        return {
+            id: request.id,
+            ok: true,
+            coverage: result.coverage,
+            cumulativeCoverage: result.cumulativeCoverage,
+            coverageMax: fuzzer.stats.maxCoverage,
+            crashed: result.crashed,
+            crashInfo: result.crashInfo,
+            hung: result.hung,
+            // 워커가 살아 있는 동안 쌓인 기준선보다 훨씬 느리거나 힙을 많이 쓴 실행이면 { cause, value, baseline, ratio }
+            resource: result.resource,
+            heapDelta: result.heapDelta,
+            isNewPath,
+            entry,
+            sinkCalls: result.sinkCalls,
+            verdict: result.verdict,
+            newCorpus: newCorpusFile ? [newCorpusFile] : [],
+            crashes: result.crashRecord ? [result.crashRecord] : [],
+            totalExecs: fuzzer.stats.totalExecs,
+            uniqueCrashes: fuzzer.stats.uniqueCrashes.size,
+            execMs: Number(process.hrtime.bigint() - started) / 1e6,
+            stdout: capture.stdout.join('\n'),
+            stderr: capture.stderr.join('\n')
+        };
+    } catch (e) {
+        return { id: request.id, ok: false, error: e && e.message ? e.message : String(e), stderr: capture.stderr.join('\n') };
+    } finally {
+        capture.active = false;
+    }
+}
+
+async function main() {
+    const config = parseArgs();
+    if (!config.targetJs) {
+        send({ ready: false, error: 'usage: node harness_worker.js <target_js> [--sink name] [--coverage-backend inspector|instrument] [--entry fn] [--no-mocks] [--corpus-root dir] [--run-id id]' });
+        process.exit(1);
+    }
+    const fuzzer = new FuzzerCore({
+        sink: config.sink,
+        coverageBackend: config.coverageBackend,
+        entry: config.entry,
+        mocks: config.mocks,
+        corpusRoot: config.corpusRoot,
+        runId: config.runId,
+        // 변이를 하지 않으므로 비교 피연산자를 모을 필요가 없다
+        cmplog: false
+    });
+    try {
+        await fuzzer.init(path.resolve(config.targetJs), '', null);
+    } catch (e) {
+        send({ ready: false, error: e && e.message ? e.message : String(e) });
+        process.exit(1);
+    }
+    send({ ready: true, target: fuzzer.targetFilePath, pid: process.pid, entry: fuzzer._attributedEntry(), entryMissing: fuzzer.entryMissing });
+
+    // 요청은 도착 순서대로 하나씩 처리한다
+    let chain = Promise.resolve();
+    const rl = readline.createInterface({ input: process.stdin });
+    rl.on('line', (line) => {
+        if (!line.trim()) return;
+        let request;
+        try {
+            request = JSON.parse(line);
+        } catch (e) {
+            send({ id: null, ok: false, error: `bad request: ${e.message}` });
+            return;
+        }
+        chain = chain.then(() => handleRequest(fuzzer, request)).then(send);
+    });
+    rl.on('close', () => {
+        chain.then(() => {
+            fuzzer.stop();
+            process.exit(0);
+        });
+    });
+}
+
+main();
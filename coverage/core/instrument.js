@@ -0,0 +1,218 @@
+// coverage/core/instrument.js
+//
+// inspector 없이 커버리지를 얻기 위한 소스 계측기.
+// 하네스를 로드할 때 블록마다 `__libspear_cov[n]++;` 를 끼워 넣고, 카운터는 파일별 Uint32Array 에 쌓인다.
+// 파서 대신 토크나이저 수준으로 훑는다: 문자열/템플릿/주석/정규식은 건너뛰고,
+// `)` `=>` else try finally do catch 뒤에 오는 `{` 만 블록으로 본다 (switch 본문은 제외).
+
+const fs = require('fs');
+const path = require('path');
+const Module = require('module');
+
+const COUNTERS_GLOBAL = '__libspearCoverage';
+const COUNTER_VAR = '__libspear_cov';
+
+const BLOCK_KEYWORDS = new Set(['else', 'try', 'finally', 'do', 'catch']);
+// 이 키워드 뒤의 `/` 는 나눗셈이 아니라 정규식 시작
+const REGEX_KEYWORDS = new Set(['return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+    'throw', 'case', 'do', 'else', 'yield', 'await']);
+const KEYWORDS = new Set([...BLOCK_KEYWORDS, ...REGEX_KEYWORDS, 'if', 'for', 'while', 'switch', 'function',
+    'with', 'class', 'const', 'let', 'var']);
+
+function isIdentStart(ch) {
+    return /[A-Za-z_$]/.test(ch) || ch.charCodeAt(0) > 127;
+}
+
+function isIdentPart(ch) {
+    return /[\w$]/.test(ch) || ch.charCodeAt(0) > 127;
+}
+
+function skipString(src, i) {
+    const quote = src[i++];
+    while (i < src.length && src[i] !== quote) {
+        if (src[i] === '\\') i++;
+        else if (src[i] === '\n') break;
+        i++;
+    }
+    return i + 1;
+}
+
+// 템플릿 문자열을 훑다가 끝(`)이나 ${ 에서 멈춘다
+function scanTemplate(src, i) {
+    while (i < src.length) {
+        const ch = src[i];
+        if (ch === '\\') {
+            i += 2;
+        } else if (ch === '`') {
+            return { end: i + 1, interpolation: false };
+        } else if (ch === '$' && src[i + 1] === '{') {
+            return { end: i + 2, interpolation: true };
+        } else {
+            i++;
+        }
+    }
+    return { end: i, interpolation: false };
+}
+
+function skipRegex(src, i) {
+    let inClass = false;
+    i++;
+    while (i < src.length && src[i] !== '\n') {
+        const ch = src[i];
+        if (ch === '\\') {
+            i += 2;
+            continue;
+        }
+        if (ch === '[') inClass = true;
+        else if (ch === ']') inClass = false;
+        else if (ch === '/' && !inClass) break;
+        i++;
+    }
+    i++;
+    while (i < src.length && isIdentPart(src[i])) i++;
+    return i;
+}
+
+// source 에 블록 카운터를 넣은 코드와, 카운터 번호별 원본 블록 범위를 돌려준다
+function instrumentSource(source) {
+    const inserts = [];
+    const blocks = [];
+    const braceStack = [];
+    const parenStack = [];
+    let lastToken = '';
+    let lastType = '';
+    let lastParenKeyword = null;
+    let i = 0;
+    const n = source.length;
+
+    const regexAllowed = () => {
+        if (lastType === '') return true;
+        if (lastType === 'keyword') return REGEX_KEYWORDS.has(lastToken);
+        if (lastType === 'punct') return lastToken !== ')' && lastToken !== ']';
+        return false;
+    };
+
+    const resumeTemplate = (from) => {
+        const res = scanTemplate(source, from);
+        if (res.interpolation) braceStack.push({ template: true });
+        lastToken = '`';
+        lastType = res.interpolation ? 'punct' : 'string';
+        return res.end;
+    };
+
+    while (i < n) {
+        const ch = source[i];
+        if (ch === ' ' || ch === '\t' || ch === '\n' || ch === '\r') {
+            i++;
+        } else if (ch === '/' && source[i + 1] === '/') {
+            while (i < n && source[i] !== '\n') i++;
+        } else if (ch === '/' && source[i + 1] === '*') {
+            const end = source.indexOf('*/', i + 2);
+            i = end < 0 ? n : end + 2;
+        } else if (ch === '\'' || ch === '"') {
+            i = skipString(source, i);
+            lastToken = ch;
+            lastType = 'string';
+        } else if (ch === '`') {
+            i = resumeTemplate(i + 1);
+        } else if (ch === '/' && regexAllowed()) {
+            i = skipRegex(source, i);
+            lastToken = '/';
+            lastType = 'regex';
+        } else if (isIdentStart(ch)) {
+            const start = i;
+            while (i < n && isIdentPart(source[i])) i++;
+            lastToken = source.slice(start, i);
+            lastType = KEYWORDS.has(lastToken) ? 'keyword' : 'ident';
+        } else if (/[0-9]/.test(ch) || (ch === '.' && /[0-9]/.test(source[i + 1] || ''))) {
+            while (i < n && (isIdentPart(source[i]) || source[i] === '.')) i++;
+            lastToken = '0';
+            lastType = 'num';
+        } else if (ch === '=' && source[i + 1] === '>') {
+            i += 2;
+            lastToken = '=>';
+            lastType = 'punct';
+        } else if (ch === '(') {
+            parenStack.push(lastType === 'keyword' ? lastToken : null);
+            i++;
+            lastToken = '(';
+            lastType = 'punct';
+        } else if (ch === ')') {
+            lastParenKeyword = parenStack.length ? parenStack.pop() : null;
+            i++;
+            lastToken = ')';
+            lastType = 'punct';
+        } else if (ch === '{') {
+            const isBlock = (lastToken === ')' && lastParenKeyword !== 'switch')
+                || lastToken === '=>'
+                || (lastType === 'keyword' && BLOCK_KEYWORDS.has(lastToken));
+            if (isBlock) {
+                const id = blocks.length;
+                blocks.push({ start: i, end: n });
+                inserts.push({ pos: i + 1, text: `${COUNTER_VAR}[${id}]++;` });
+                braceStack.push({ block: id });
+            } else {
+                braceStack.push({});
+            }
+            i++;
+            lastToken = '{';
+            lastType = 'punct';
+        } else if (ch === '}') {
+            const top = braceStack.pop();
+            if (top && top.template) {
+                i = resumeTemplate(i + 1);
+                continue;
+            }
+            if (top && top.block !== undefined) blocks[top.block].end = i + 1;
+            i++;
+            lastToken = '}';
+            lastType = 'punct';
+        } else {
+            i++;
+            lastToken = ch;
+            lastType = 'punct';
+        }
+    }
+
+    let code = '';
+    let cursor = 0;
+    for (const ins of inserts) {
+        code += source.slice(cursor, ins.pos) + ins.text;
+        cursor = ins.pos;
+    }
+    code += source.slice(cursor);
+    return { code, blocks };
+}
+
+// 계측한 하네스를 require.cache 에 올린다. 이후 같은 경로를 require 하면 계측본이 나온다
+function loadInstrumented(filename) {
+    filename = path.resolve(filename);
+    let source = fs.readFileSync(filename, 'utf-8');
+    // 앞에 프렐류드를 붙이므로 hashbang 은 주석으로 바꾼다
+    if (source.startsWith('#!')) source = '//' + source.slice(2);
+    const { code, blocks } = instrumentSource(source);
+    const counters = new Uint32Array(Math.max(1, blocks.length));
+    const registry = globalThis[COUNTERS_GLOBAL] || (globalThis[COUNTERS_GLOBAL] = Object.create(null));
+    registry[filename] = counters;
+
+    // 줄 번호가 바뀌지 않도록 프렐류드는 첫 줄 앞에 같은 줄로 붙인다
+    const prelude = `const ${COUNTER_VAR} = globalThis.${COUNTERS_GLOBAL}[${JSON.stringify(filename)}];`;
+    const mod = new Module(filename, module);
+    mod.filename = filename;
+    mod.paths = Module._nodeModulePaths(path.dirname(filename));
+    require.cache[filename] = mod;
+    try {
+        mod._compile(prelude + code, filename);
+        mod.loaded = true;
+    } catch (e) {
+        delete require.cache[filename];
+        throw e;
+    }
+    return { exports: mod.exports, counters, blocks };
+}
+
+module.exports = {
+    instrumentSource, loadInstrumented,
+    // cmplog.js 의 리터럴 수집기가 같은 토큰 규칙을 쓴다
+    isIdentStart, isIdentPart, skipString, scanTemplate, skipRegex, REGEX_KEYWORDS, KEYWORDS
+};
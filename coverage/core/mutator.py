@@ -1,6 +1,10 @@
 # coverage/core/mutator.py
+import argparse
+import json
 import random
+import re
 import string
+import struct
 import sys
 import select
 import termios
@@ -70,8 +74,333 @@ def interactive_mode():
     
     return current_input
 
+# --- havoc / splice 변형 엔진 ---
+FIELD_DELIM = "||"
+PRINTABLE = string.ascii_letters + string.digits + string.punctuation + " "
+INTERESTING_CHARS = ["\x00", "\n", "\r", "\t", " ", "'", '"', "`", "\\", "/", "%", "{", "}", "[", "]", "<", ">"]
+INTERESTING_INTS = [0, 1, -1, 7, 8, 16, 32, 64, 100, 127, 128, 255, 256, 1024, 4096, 32767, 65535, 2147483647, -2147483648]
+NUMBER_RE = re.compile(r"-?\d+")
+
+# --- sink 계열별 토큰 사전 ---
+# rules/test.scala 의 sink 이름을 계열로 묶고, 계열마다 삽입/덮어쓰기용 토큰을 둔다
+SINK_FAMILIES = {
+    "shell": ["exec", "execsync", "execfile", "system", "popen", "runtime.exec", "processbuilder.start",
+              "fork", "spawn", "spawnsync", "execvp"],
+    "sql": ["executequery", "executeupdate", "preparestatement", "createstatement", "all", "run", "query"],
+    "path": ["writefilesync", "writefile", "appendfilesync", "createwritestream", "files.write", "bufferedwriter.write"],
+    "network": ["send", "sendbytes", "sendmessage", "socket.write", "outputstream.write",
+                "httpurlconnection.connect", "urlconnection.getoutputstream", "get", "request"],
+    "json": ["parse", "objectoutputstream.writeobject", "deserialize", "unserialize"],
+}
+
+SINK_DICTIONARIES = {
+    "shell": [";", "|", "&", "&&", "`", "$(", ")", "${IFS}", "$IFS", "\n", "%0a", ">", "<", "2>&1", "#",
+              "'", '"', "\\", "*", "~", "-c", "/bin/sh", "id", "whoami", "echo LIBSPEAR", "sleep 1",
+              "; id", "| id", "`id`", "$(id)", "&& id"],
+    "sql": ["'", '"', "`", "\\", "--", "-- -", "#", "/*", "*/", ";", "(", ")", "%", "_", "NULL", "0x",
+            " OR 1=1", "' OR '1'='1", '" OR "1"="1', " AND 1=2", " UNION SELECT ", " ORDER BY 1",
+            "SLEEP(1)", "1' --", "') OR ('1'='1"],
+    "path": ["../", "..\\", "..", "/", "\\", "....//", "..%2f", "%2e%2e%2f", "%2e%2e/", "%00", "\x00",
+             "~", "/etc/passwd", "/proc/self/environ", "/dev/null", "C:\\", "file:", ".htaccess"],
+    "network": ["http://", "https://", "file://", "gopher://", "ftp://", "//", "@", "#", "?", ":", "%00",
+                "127.0.0.1", "localhost", "0.0.0.0", "[::1]", "0x7f000001", "2130706433",
+                "169.254.169.254", ":22", ":6379", "/latest/meta-data/"],
+    "json": ["{", "}", "[", "]", ":", ",", '"', "null", "true", "false", "1e309", "-0", "\\u0000",
+             '"__proto__"', '"constructor"', '"prototype"', '{"__proto__":{"polluted":true}}',
+             '{"constructor":{"prototype":{"polluted":true}}}', "[[[[[[[[", "{{{{{{{{"],
+}
+
+def sink_family(sink) -> str:
+    """sink 이름(예: exec, db.all, fs.writeFileSync)을 사전 계열 이름으로 바꾼다."""
+    if not sink:
+        return ""
+    name = str(sink).strip().lower()
+    short = name.rsplit(".", 1)[-1]
+    for family, names in SINK_FAMILIES.items():
+        if name in names or short in names:
+            return family
+    return ""
+
+def tokens_for_sink(sink):
+    return list(SINK_DICTIONARIES.get(sink_family(sink), []))
+
+
+class Mutator:
+    """시드 문자열에 havoc 연산을 여러 개 쌓아 변형체를 만든다.
+
+    `||` 로 구분된 다중 인자 입력은 필드 단위로 다루고, 코퍼스 항목 간
+    splice 를 지원한다. 같은 seed 로 만든 Mutator 는 같은 결과를 낸다.
+    objective 가 "slowness" 면 반복/중첩을 늘리는 연산을 더 자주 골라 느린 입력 쪽으로 민다.
+    """
+
+    def __init__(self, seed=None, max_len: int = 4096, max_stack: int = 8, max_corpus: int = 1024, sink=None,
+                 objective: str = "coverage"):
+        self.rng = random.Random(seed)
+        self.max_len = max_len
+        self.max_stack = max_stack
+        self.max_corpus = max_corpus
+        self.corpus = []
+        self._corpus_set = set()
+        self.havoc_ops = [
+            self._flip_char,
+            self._random_char,
+            self._insert_char,
+            self._insert_interesting_char,
+            self._delete_run,
+            self._duplicate_run,
+            self._overwrite_run,
+            self._insert_repeated_run,
+            self._swap_runs,
+            self._number_arith,
+            self._number_interesting,
+            self._swap_case,
+            self._splice,
+        ]
+        self.field_ops = [
+            self._field_havoc,
+            self._field_havoc,
+            self._field_havoc,
+            self._field_swap,
+            self._field_duplicate,
+            self._field_drop,
+            self._field_splice,
+        ]
+        self.tokens = []
+        self._token_set = set()
+        self._ops = self.havoc_ops
+        self.objective = objective
+        self.set_sink(sink)
+
+    def set_sink(self, sink):
+        self.sink = sink or ""
+        self.tokens = []
+        self._token_set = set()
+        self.add_tokens(tokens_for_sink(sink))
+
+    def add_tokens(self, tokens):
+        for token in tokens:
+            if isinstance(token, str) and token and token not in self._token_set:
+                self.tokens.append(token)
+                self._token_set.add(token)
+        self._rebuild_ops()
+
+    def set_objective(self, objective):
+        self.objective = objective or "coverage"
+        self._rebuild_ops()
+
+    def _rebuild_ops(self):
+        # 사전이 있으면 토큰 연산을 다른 havoc 연산보다 자주 고른다
+        token_ops = [self._insert_token, self._overwrite_token] * 3 if self.tokens else []
+        # slowness: 정규식 역추적/중첩 파싱/반복 처리 비용은 반복 구간과 중첩 깊이에 비례해 커진다
+        growth_ops = [self._duplicate_run, self._insert_repeated_run, self._nest_run] * 3 if self.objective == "slowness" else []
+        self._ops = self.havoc_ops + token_ops + growth_ops
+
+    def add_corpus(self, entries):
+        for entry in entries:
+            if not isinstance(entry, str) or not entry or entry in self._corpus_set:
+                continue
+            if len(self.corpus) >= self.max_corpus:
+                evicted = self.corpus.pop(self.rng.randrange(len(self.corpus)))
+                self._corpus_set.discard(evicted)
+            self.corpus.append(entry)
+            self._corpus_set.add(entry)
+
+    def mutate(self, data: str) -> str:
+        for _ in range(4):
+            if FIELD_DELIM in data and self.rng.random() < 0.7:
+                mutated = self.rng.choice(self.field_ops)(data)
+            else:
+                mutated = self.havoc(data)
+            if mutated != data:
+                break
+        return mutated[:self.max_len]
+
+    def mutate_batch(self, inputs):
+        self.add_corpus(inputs)
+        return [self.mutate(s) for s in inputs]
+
+    def havoc(self, data: str) -> str:
+        stack = 1 << self.rng.randint(0, max(0, self.max_stack.bit_length() - 1))
+        for _ in range(stack):
+            data = self.rng.choice(self._ops)(data)
+            if len(data) > self.max_len:
+                data = data[:self.max_len]
+        return data
+
+    # --- 문자/바이트열 연산 ---
+    def _pos(self, data: str) -> int:
+        return self.rng.randrange(len(data)) if data else 0
+
+    def _run(self, data: str):
+        """data 안의 (시작, 길이) 구간을 고른다. 짧은 구간일수록 자주 뽑힌다."""
+        start = self._pos(data)
+        limit = len(data) - start
+        length = min(limit, 1 << self.rng.randint(0, 4))
+        return start, max(1, length)
+
+    def _flip_char(self, data: str) -> str:
+        if not data:
+            return self._insert_char(data)
+        idx = self._pos(data)
+        code = ord(data[idx])
+        if code >= 128:
+            return data
+        flipped = chr(code ^ (1 << self.rng.randint(0, 6)))
+        return data[:idx] + flipped + data[idx + 1:]
+
+    def _random_char(self, data: str) -> str:
+        if not data:
+            return self._insert_char(data)
+        idx = self._pos(data)
+        return data[:idx] + self.rng.choice(PRINTABLE) + data[idx + 1:]
+
+    def _insert_char(self, data: str) -> str:
+        idx = self.rng.randint(0, len(data))
+        return data[:idx] + self.rng.choice(PRINTABLE) + data[idx:]
+
+    def _insert_interesting_char(self, data: str) -> str:
+        idx = self.rng.randint(0, len(data))
+        return data[:idx] + self.rng.choice(INTERESTING_CHARS) + data[idx:]
+
+    def _delete_run(self, data: str) -> str:
+        if len(data) < 2:
+            return data
+        start, length = self._run(data)
+        return data[:start] + data[start + length:]
+
+    def _duplicate_run(self, data: str) -> str:
+        if not data:
+            return data
+        start, length = self._run(data)
+        chunk = data[start:start + length]
+        idx = self.rng.randint(0, len(data))
+        return data[:idx] + chunk * self.rng.randint(1, 4) + data[idx:]
+
+    def _overwrite_run(self, data: str) -> str:
+        if len(data) < 2:
+            return data
+        start, length = self._run(data)
+        chunk = data[start:start + length]
+        idx = self._pos(data)
+        return data[:idx] + chunk + data[idx + len(chunk):]
+
+    def _insert_repeated_run(self, data: str) -> str:
+        idx = self.rng.randint(0, len(data))
+        char = data[self._pos(data)] if data and self.rng.random() < 0.5 else self.rng.choice(PRINTABLE)
+        return data[:idx] + char * (1 << self.rng.randint(1, 7)) + data[idx:]
+
+    def _nest_run(self, data: str) -> str:
+        """구간을 앞/가운데/뒤로 나눠 앞뒤만 반복한다 ([1] -> [[[[1]]]] 처럼 중첩 깊이를 늘린다)."""
+        if len(data) < 2:
+            return self._insert_repeated_run(data)
+        start, length = self._run(data)
+        end = start + length
+        left = self.rng.randint(start, end)
+        right = self.rng.randint(left, end)
+        depth = 1 << self.rng.randint(1, 4)
+        return data[:start] + data[start:left] * depth + data[left:right] + data[right:end] * depth + data[end:]
+
+    def _swap_runs(self, data: str) -> str:
+        if len(data) < 4:
+            return data
+        a, b = sorted(self.rng.sample(range(len(data) + 1), 2))
+        c = self.rng.randint(b, len(data))
+        return data[:a] + data[b:c] + data[a:b] + data[c:]
+
+    def _number_arith(self, data: str) -> str:
+        matches = list(NUMBER_RE.finditer(data))
+        if not matches:
+            return self._random_char(data)
+        m = self.rng.choice(matches)
+        delta = self.rng.randint(1, 35) * self.rng.choice((-1, 1))
+        return data[:m.start()] + str(int(m.group()) + delta) + data[m.end():]
+
+    def _number_interesting(self, data: str) -> str:
+        matches = list(NUMBER_RE.finditer(data))
+        value = str(self.rng.choice(INTERESTING_INTS))
+        if not matches:
+            idx = self.rng.randint(0, len(data))
+            return data[:idx] + value + data[idx:]
+        m = self.rng.choice(matches)
+        return data[:m.start()] + value + data[m.end():]
+
+    def _swap_case(self, data: str) -> str:
+        if not data:
+            return data
+        start, length = self._run(data)
+        return data[:start] + data[start:start + length].swapcase() + data[start + length:]
+
+    def _splice(self, data: str) -> str:
+        pool = self.corpus if len(self.corpus) <= 64 else self.rng.sample(self.corpus, 8)
+        others = [c for c in pool if c != data]
+        if not others:
+            return self._duplicate_run(data)
+        other = self.rng.choice(others)
+        cut_a = self.rng.randint(0, len(data))
+        cut_b = self.rng.randint(0, len(other))
+        return data[:cut_a] + other[cut_b:]
+
+    # --- 사전 토큰 연산 ---
+    def _insert_token(self, data: str) -> str:
+        idx = self.rng.randint(0, len(data))
+        return data[:idx] + self.rng.choice(self.tokens) + data[idx:]
+
+    def _overwrite_token(self, data: str) -> str:
+        if not data:
+            return self._insert_token(data)
+        token = self.rng.choice(self.tokens)
+        idx = self._pos(data)
+        return data[:idx] + token + data[idx + len(token):]
+
+    # --- `||` 구분 다중 인자 연산 ---
+    def _field_havoc(self, data: str) -> str:
+        fields = data.split(FIELD_DELIM)
+        idx = self.rng.randrange(len(fields))
+        mutated = self.havoc(fields[idx])
+        # 필드 내부 변형이 구분자를 만들어 인자 개수를 바꾸지 않도록 한다
+        fields[idx] = mutated.replace(FIELD_DELIM, "|")
+        return FIELD_DELIM.join(fields)
+
+    def _field_swap(self, data: str) -> str:
+        fields = data.split(FIELD_DELIM)
+        if len(fields) < 2:
+            return self._field_havoc(data)
+        a, b = self.rng.sample(range(len(fields)), 2)
+        fields[a], fields[b] = fields[b], fields[a]
+        return FIELD_DELIM.join(fields)
+
+    def _field_duplicate(self, data: str) -> str:
+        fields = data.split(FIELD_DELIM)
+        a, b = self.rng.randrange(len(fields)), self.rng.randrange(len(fields))
+        fields[b] = fields[a]
+        return FIELD_DELIM.join(fields)
+
+    def _field_drop(self, data: str) -> str:
+        fields = data.split(FIELD_DELIM)
+        idx = self.rng.randrange(len(fields))
+        fields[idx] = ""
+        return FIELD_DELIM.join(fields)
+
+    def _field_splice(self, data: str) -> str:
+        fields = data.split(FIELD_DELIM)
+        donors = [c.split(FIELD_DELIM) for c in self.corpus if FIELD_DELIM in c and c != data]
+        if not donors:
+            return self._field_havoc(data)
+        donor = self.rng.choice(donors)
+        idx = self.rng.randrange(len(fields))
+        fields[idx] = donor[idx] if idx < len(donor) else self.rng.choice(donor)
+        return FIELD_DELIM.join(fields)
+
+
+_default_mutator = Mutator()
+
+def configure(seed=None, sink=None, objective="coverage"):
+    global _default_mutator
+    _default_mutator = Mutator(seed=seed, sink=sink, objective=objective)
+    return _default_mutator
+
 def mutate(input_str: str) -> str:
-    return input_str
+    return _default_mutator.mutate(input_str)
 
 def _read_all_from_stdin() -> str:
     if sys.stdin is None:
@@ -81,11 +410,94 @@ def _read_all_from_stdin() -> str:
     except Exception:
         return ""
 
+# --- 서버 모드 ---
+# 프레임 = 4바이트 big-endian 길이 + UTF-8 JSON 본문
+#   요청: {"op": "mutate", "inputs": [...]}  ->  응답: {"mutants": [...]}
+#   요청: {"op": "add_corpus", "entries": [...]} -> 응답: {"ok": true}
+#   요청: {"op": "set_sink", "sink": "exec"}  ->  응답: {"ok": true, "family": "shell", ...}
+#   요청: {"op": "add_tokens", "tokens": [...]} -> 응답: {"ok": true, "tokens": n}
+#   요청: {"op": "ping"}                     ->  응답: {"ok": true}
+#   요청: {"op": "exit"}                     ->  응답 없이 종료
+FRAME_HEADER = struct.Struct(">I")
+
+def _read_frame(stream):
+    header = stream.read(FRAME_HEADER.size)
+    if not header or len(header) < FRAME_HEADER.size:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    body = stream.read(length) if length else b""
+    if len(body) < length:
+        return None
+    return json.loads(body.decode("utf-8"))
+
+def _write_frame(stream, message: dict):
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    stream.write(FRAME_HEADER.pack(len(body)) + body)
+    stream.flush()
+
+def handle_request(request: dict) -> dict:
+    op = request.get("op", "mutate")
+    if op == "mutate":
+        inputs = [str(s) for s in request.get("inputs") or []]
+        return {"mutants": _default_mutator.mutate_batch(inputs)}
+    if op == "add_corpus":
+        _default_mutator.add_corpus([str(s) for s in request.get("entries") or []])
+        return {"ok": True}
+    if op == "set_sink":
+        _default_mutator.set_sink(request.get("sink"))
+        return {"ok": True, "family": sink_family(request.get("sink")), "tokens": len(_default_mutator.tokens)}
+    if op == "add_tokens":
+        _default_mutator.add_tokens([str(t) for t in request.get("tokens") or []])
+        return {"ok": True, "tokens": len(_default_mutator.tokens)}
+    if op == "ping":
+        return {"ok": True}
+    return {"error": f"unknown op: {op}"}
+
+def serve(stdin=None, stdout=None):
+    stdin = stdin or sys.stdin.buffer
+    stdout = stdout or sys.stdout.buffer
+    while True:
+        try:
+            request = _read_frame(stdin)
+        except (ValueError, UnicodeDecodeError) as e:
+            _write_frame(stdout, {"error": f"bad frame: {e}"})
+            continue
+        if request is None or request.get("op") == "exit":
+            break
+        try:
+            response = handle_request(request)
+        except Exception as e:
+            response = {"error": str(e)}
+        _write_frame(stdout, response)
+
+def parse_args(argv=None):
+    """옵션을 읽는다. 예전 호출 방식(mutator.py <입력>)처럼 '-' 로 시작하는 입력(-la; id 등)도 입력으로 받는다.
+
+    옵션 이름과 똑같은 입력은 `mutator.py -- --seed` 처럼 -- 뒤에 준다.
+    """
+    parser = argparse.ArgumentParser(description="Libspear input mutator", allow_abbrev=False)
+    parser.add_argument("input", nargs="?", help="변형할 입력 문자열 (생략 시 stdin, '-' 로 시작하는 옵션 이름과 같으면 -- 뒤에)")
+    parser.add_argument("--server", action="store_true", help="프레임 기반 stdin/stdout 서버 모드")
+    parser.add_argument("--seed", type=int, default=None, help="재현 가능한 결과를 위한 RNG 시드")
+    parser.add_argument("--sink", type=str, default=None, help="sink 이름 (계열별 토큰 사전 선택)")
+    parser.add_argument("--objective", choices=["coverage", "slowness"], default="coverage",
+                        help="slowness 면 반복/중첩을 늘리는 연산을 더 자주 고른다")
+    args, unknown = parser.parse_known_args(argv)
+    if unknown:
+        # 모르는 옵션처럼 보이는 인자는 입력이다 (셸 페이로드는 '-' 로 시작하는 경우가 많다)
+        if args.input is not None or len(unknown) > 1:
+            parser.error(f"unrecognized arguments: {' '.join(unknown)}")
+        args.input = unknown[0]
+    return args
+
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        input_str = sys.argv[1]
-        print(mutate(input_str))
+    cli_args = parse_args()
+    configure(seed=cli_args.seed, sink=cli_args.sink, objective=cli_args.objective)
+    if cli_args.server:
+        serve()
+    elif cli_args.input is not None:
+        print(mutate(cli_args.input))
     else:
         if sys.stdin is not None and not sys.stdin.isatty():
             buffered_input = _read_all_from_stdin().strip()
@@ -0,0 +1,110 @@
+// coverage/core/mutator_client.js
+
+const { spawn } = require('child_process');
+
+// mutator.py --server 와 통신하는 클라이언트
+// 프레임 = 4바이트 big-endian 길이 + UTF-8 JSON 본문
+class MutatorClient {
+    constructor(mutatorPyPath, options = {}) {
+        this.mutatorPyPath = mutatorPyPath;
+        this.pythonBin = options.pythonBin || 'python';
+        this.extraArgs = options.extraArgs || [];
+        this.timeoutMs = options.timeoutMs || 5000;
+        this.proc = null;
+        this.buffer = Buffer.alloc(0);
+        this.pending = [];
+        this.alive = false;
+    }
+
+    start() {
+        if (this.alive) return;
+        const proc = spawn(this.pythonBin, [this.mutatorPyPath, '--server', ...this.extraArgs], {
+            stdio: ['pipe', 'pipe', 'ignore']
+        });
+        this.proc = proc;
+        this.alive = true;
+        this.buffer = Buffer.alloc(0);
+        proc.stdout.on('data', chunk => { if (this.proc === proc) this._onData(chunk); });
+        proc.on('error', err => { if (this.proc === proc) this._failAll(err); });
+        proc.on('exit', () => { if (this.proc === proc) this._failAll(new Error('mutator process exited')); });
+        proc.stdin.on('error', () => {});
+    }
+
+    _onData(chunk) {
+        this.buffer = this.buffer.length ? Buffer.concat([this.buffer, chunk]) : chunk;
+        while (this.buffer.length >= 4) {
+            const length = this.buffer.readUInt32BE(0);
+            if (this.buffer.length < 4 + length) break;
+            const body = this.buffer.subarray(4, 4 + length).toString('utf-8');
+            this.buffer = this.buffer.subarray(4 + length);
+            const waiter = this.pending.shift();
+            if (!waiter) continue;
+            clearTimeout(waiter.timer);
+            try {
+                const message = JSON.parse(body);
+                if (message && message.error) waiter.reject(new Error(message.error));
+                else waiter.resolve(message);
+            } catch (e) {
+                waiter.reject(e);
+            }
+        }
+    }
+
+    _failAll(err) {
+        this.alive = false;
+        const waiters = this.pending.splice(0);
+        for (const waiter of waiters) {
+            clearTimeout(waiter.timer);
+            waiter.reject(err);
+        }
+    }
+
+    request(message) {
+        if (!this.alive) return Promise.reject(new Error('mutator process not running'));
+        return new Promise((resolve, reject) => {
+            const waiter = { resolve, reject, timer: null };
+            waiter.timer = setTimeout(() => {
+                // 응답 순서가 깨지므로 타임아웃 시 프로세스를 폐기한다
+                this.close();
+                reject(new Error('mutator request timeout'));
+            }, this.timeoutMs);
+            this.pending.push(waiter);
+            const body = Buffer.from(JSON.stringify(message), 'utf-8');
+            const header = Buffer.alloc(4);
+            header.writeUInt32BE(body.length, 0);
+            try {
+                this.proc.stdin.write(Buffer.concat([header, body]));
+            } catch (e) {
+                this._failAll(e);
+            }
+        });
+    }
+
+    async mutateBatch(inputs) {
+        const res = await this.request({ op: 'mutate', inputs });
+        const mutants = res && Array.isArray(res.mutants) ? res.mutants : [];
+        return inputs.map((input, idx) => (typeof mutants[idx] === 'string' && mutants[idx].length ? mutants[idx] : input));
+    }
+
+    // 사전에 토큰을 더한다 (CmpLog 가 모은 비교 피연산자). 응답의 tokens 는 사전 크기
+    async addTokens(tokens) {
+        const res = await this.request({ op: 'add_tokens', tokens });
+        return res && typeof res.tokens === 'number' ? res.tokens : 0;
+    }
+
+    close() {
+        if (!this.proc) return;
+        const proc = this.proc;
+        this.proc = null;
+        this._failAll(new Error('mutator client closed'));
+        try {
+            const body = Buffer.from(JSON.stringify({ op: 'exit' }), 'utf-8');
+            const header = Buffer.alloc(4);
+            header.writeUInt32BE(body.length, 0);
+            proc.stdin.end(Buffer.concat([header, body]));
+        } catch (e) {}
+        setTimeout(() => { try { proc.kill(); } catch (e) {} }, 500).unref();
+    }
+}
+
+module.exports = { MutatorClient };
@@ -0,0 +1,519 @@
+// coverage/core/parallel_fuzzer.js
+//
+// 하나의 하네스를 worker_threads 여러 개로 동시에 퍼징한다.
+// 워커들은 SharedArrayBuffer virgin 맵을 공유하므로 같은 경로를 중복으로 "새 경로"로 세지 않고,
+// 새로 찾은 시드는 메인 스레드를 거쳐 다른 워커들에게 전달된다.
+// 메인 스레드는 워커마다 ExecHeartbeat 를 감시해, 실행 하나가 데드라인을 넘기면(동기 무한 루프 등)
+// 그 입력을 hang 코퍼스에 남기고 워커를 종료한 뒤 남은 반복으로 다시 띄운다.
+// 다시 띄울 때 FuzzerCore.init(하네스 로드, 뮤테이터 시작)을 기다리지 않도록 처음 비정상 종료 뒤부터
+// init 을 마친 예비 워커 하나를 늘 준비해 둔다. 워커는 init 뒤 start 메시지를 받아야 퍼징을 시작한다.
+
+const fs = require('fs');
+const path = require('path');
+const { Worker, isMainThread, parentPort, workerData } = require('worker_threads');
+const { FuzzerCore, FuzzingStats, readSeedFile, MAX_RECORDED_FILES } = require('./fuzzer');
+const { CoverageMap } = require('./coverage_utils');
+const { CorpusManifest, DEFAULT_CORPUS_ROOT, corpusNamespace } = require('./corpus_manifest');
+const { CrashBuckets } = require('./crash_buckets');
+const { ExecHeartbeat, FindingCorpus } = require('./watchdog');
+const { ResourceOracle } = require('./resource_oracle');
+const { locateSink } = require('./sink_distance');
+
+const STATS_INTERVAL_MS = 250;
+// hang 으로 끊긴 워커는 늘 다시 띄운다 (hang 하나가 반복 하나와 데드라인만큼의 시간을 쓰므로 저절로 유한하다).
+// 하네스가 워커를 죽이는 경우(process.exit 등)만 슬롯마다 최근 RESPAWN_WINDOW_MS 안의 횟수로 제한한다
+const RESPAWN_WINDOW_MS = 30000;
+const MAX_RESPAWNS_PER_WINDOW = 20;
+const WATCHDOG_INTERVAL_MS = 100;
+// Promise 데드라인이 먼저 끊을 수 있도록 감시자는 조금 더 기다린다
+const WATCHDOG_GRACE_MS = 250;
+
+class ParallelFuzzer {
+    constructor(options = {}) {
+        this.numWorkers = Math.max(1, options.workers || 1);
+        this.fuzzerOptions = Object.assign({}, options);
+        delete this.fuzzerOptions.workers;
+        this.stats = new FuzzingStats();
+        // 워커들은 모두 init 에서 정한 같은 네임스페이스 디렉터리에 쓴다
+        this.corpusRoot = options.corpusRoot || DEFAULT_CORPUS_ROOT;
+        this.runId = options.runId || '';
+        this.corpusDir = options.corpusDir || '';
+        this.seedInputs = [];
+        this.isRunning = false;
+        this.workers = [];
+        this.workerStats = new Map();
+        this.virginBuffer = CoverageMap.createShared();
+        this.targetFilePath = '';
+        this.mutatorPyPath = '';
+        // 워커들이 저장한 코퍼스 파일 경로와 크래시 기록 (FuzzerCore 와 같은 형식)
+        this.newCorpus = [];
+        this.crashRecords = [];
+        // 워커들의 크래시를 같은 스택 서명 규칙으로 다시 묶는다 (워커 사이의 중복 제거)
+        this.crashBuckets = null;
+        this.execTimeoutMs = options.execTimeoutMs > 0 ? options.execTimeoutMs : 2000;
+        this.timeBudgetMs = options.timeBudgetMs > 0 ? options.timeBudgetMs : 0;
+        this.deadline = Infinity;
+        this.watchdogTimer = null;
+        // 감시자가 끊은 동기 hang 수 (워커 안의 Promise hang 은 워커 스냅샷에 들어 있다)
+        this.syncHangs = 0;
+        this.hangs = null;
+        this.asyncErrors = 0;
+        this.tierCounts = null;
+        this.cminLog = [];
+        this.schedulerSummary = null;
+        // 워커마다 따로 모은 CmpLog 사전 크기 (워커 중 가장 큰 값)
+        this.cmplogSummary = null;
+        // 워커들의 시간/힙 히스토그램을 합친 것과 워커들이 저장한 resource 발견 기록
+        this.resources = new ResourceOracle();
+        this.resourceFindings = null;
+        // 하네스에서 찾은 sink 호출 자리 (워커의 FuzzerCore 가 같은 규칙으로 거리를 잰다)
+        this.sinkTarget = null;
+        // init 을 마치고 start 를 기다리는 예비 워커 (처음 재시작할 때 만든다)
+        this.spare = null;
+        this.updateCallback = () => {};
+    }
+
+    async init(targetJSPath, mutatorPyPath, seedFilePath) {
+        this.targetFilePath = path.resolve(targetJSPath);
+        this.mutatorPyPath = mutatorPyPath || '';
+        this.seedInputs.push(...readSeedFile(seedFilePath));
+        this.crashBuckets = new CrashBuckets(this.targetFilePath);
+        if (!this.corpusDir) this.corpusDir = corpusNamespace(this.corpusRoot, this.targetFilePath, this.runId);
+        if (!fs.existsSync(this.corpusDir)) fs.mkdirSync(this.corpusDir, { recursive: true });
+        // 새 경로/크래시는 워커들이 매니페스트에 남기고, 시드 파일과 감시자가 찾은 hang 은 여기서 남긴다
+        const manifest = new CorpusManifest(this.corpusDir, path.basename(this.targetFilePath));
+        this.hangs = new FindingCorpus(this.corpusDir, manifest, 'hang');
+        this.resourceFindings = new FindingCorpus(this.corpusDir, manifest, 'resource');
+        if (this.fuzzerOptions.sink) {
+            try {
+                this.sinkTarget = locateSink(fs.readFileSync(this.targetFilePath, 'utf-8'), this.fuzzerOptions.sink, this.fuzzerOptions.sinkLine);
+            } catch (e) {}
+        }
+        if (seedFilePath && fs.existsSync(seedFilePath)) {
+            manifest.append('seed', seedFilePath, { count: this.seedInputs.length });
+        }
+        this.stats.currentStage = 'ready';
+    }
+
+    startFuzzing(maxIterations = 1000, updateCallback = () => {}) {
+        this.isRunning = true;
+        this.updateCallback = updateCallback;
+        this.stats.currentStage = 'fuzzing';
+        const perWorker = Math.ceil(maxIterations / this.numWorkers);
+        if (this.timeBudgetMs) this.deadline = Date.now() + this.timeBudgetMs;
+        this.watchdogTimer = setInterval(() => this._checkWatchdog(), WATCHDOG_INTERVAL_MS);
+        const runs = [];
+        for (let i = 0; i < this.numWorkers; i++) {
+            const iterations = Math.min(perWorker, maxIterations - perWorker * i);
+            if (iterations <= 0) break;
+            runs.push(this._spawnWorker(i, iterations));
+        }
+        return Promise.all(runs).then(() => {
+            clearInterval(this.watchdogTimer);
+            this.watchdogTimer = null;
+            this.isRunning = false;
+            this._dropSpare();
+            // 재시작 제한에 걸려 반복을 다 못 돌았으면 completed 가 아니다
+            this.stats.currentStage = this.stats.stoppedReason ? 'stopped' : 'completed';
+            this._aggregate();
+            try { updateCallback(this.stats.toJSON()); } catch (e) {}
+        });
+    }
+
+    // 워커 스레드를 띄운다. 워커는 FuzzerCore.init 을 마치면 start 메시지를 기다린다
+    _createWorker() {
+        const heartbeat = ExecHeartbeat.create();
+        const worker = new Worker(__filename, {
+            workerData: {
+                targetFilePath: this.targetFilePath,
+                mutatorPyPath: this.mutatorPyPath,
+                virginBuffer: this.virginBuffer,
+                heartbeat: heartbeat.buffer,
+                options: Object.assign({}, this.fuzzerOptions, { corpusDir: this.corpusDir })
+            }
+        });
+        worker.heartbeat = heartbeat;
+        worker.finished = false;
+        worker.hung = null;
+        worker.onExit = null;
+        worker.on('message', (msg) => this._onWorkerMessage(worker, msg));
+        worker.on('error', () => {});
+        worker.on('exit', () => {
+            if (worker.onExit) worker.onExit();
+            else if (this.spare === worker) this.spare = null;
+        });
+        return worker;
+    }
+
+    _takeSpare() {
+        const spare = this.spare;
+        this.spare = null;
+        return spare;
+    }
+
+    _dropSpare() {
+        const spare = this._takeSpare();
+        if (spare) spare.terminate();
+    }
+
+    // 슬롯 workerId 에 워커를 붙여 iterations 번 돌린다. respawnTimes: 이 슬롯에서 hang 이 아닌 이유로 재시작한 시각
+    _spawnWorker(workerId, iterations, respawnTimes = []) {
+        return new Promise((resolve) => {
+            const worker = this._takeSpare() || this._createWorker();
+            // 재시작된 워커는 처음 정한 시간 예산의 남은 만큼만 돈다
+            const timeBudgetMs = this.deadline !== Infinity ? Math.max(1, this.deadline - Date.now()) : 0;
+            worker.postMessage({ type: 'start', workerId, iterations, seeds: this.seedInputs.slice(), timeBudgetMs });
+            // 워커가 죽어도 이전 실행 횟수는 합계에 남긴다
+            const base = this.workerStats.get(workerId);
+            worker.baseStats = base ? Object.assign({}, base) : null;
+            worker.workerId = workerId;
+            this.workers.push(worker);
+            worker.onExit = () => {
+                this.workers = this.workers.filter(w => w !== worker);
+                // 실행 횟수는 마지막 stats 메시지가 아니라 heartbeat 로 센다 (멈춘 실행도 한 번으로 친다)
+                const done = worker.heartbeat.execs + (worker.hung ? 1 : 0);
+                this._settleExecs(worker, done);
+                const remaining = iterations - done;
+                // hang 이나 하네스 예외로 워커가 비정상 종료되면 남은 반복으로 다시 띄운다
+                if (worker.finished || !this.isRunning || remaining <= 0 || Date.now() >= this.deadline) {
+                    resolve();
+                    return;
+                }
+                const now = Date.now();
+                const recent = respawnTimes.filter(t => now - t < RESPAWN_WINDOW_MS);
+                if (!worker.hung) {
+                    if (recent.length >= MAX_RESPAWNS_PER_WINDOW) {
+                        this.stats.stoppedReason = 'respawn-limit';
+                        resolve();
+                        return;
+                    }
+                    recent.push(now);
+                }
+                const next = this._spawnWorker(workerId, remaining, recent);
+                // 다음 재시작을 위해 예비 워커를 미리 init 해 둔다
+                if (!this.spare) this.spare = this._createWorker();
+                resolve(next);
+            };
+        });
+    }
+
+    // 데드라인을 넘긴 실행이 있는 워커는 입력을 hang 코퍼스에 남기고 종료한다
+    _checkWatchdog() {
+        const now = Date.now();
+        for (const worker of this.workers) {
+            if (worker.hung || worker.finished) continue;
+            const stall = worker.heartbeat.stalled(this.execTimeoutMs + WATCHDOG_GRACE_MS, now);
+            if (!stall) continue;
+            worker.hung = stall;
+            this.syncHangs++;
+            this.hangs.record(stall.input, { timeoutMs: this.execTimeoutMs, elapsedMs: Math.round(stall.elapsedMs), cause: 'sync', truncated: stall.truncated || undefined });
+            // 시드 자체가 멈추는 입력이면 다시 띄운 워커에 넘기지 않는다
+            this.seedInputs = this.seedInputs.filter(seed => seed !== stall.input);
+            worker.terminate();
+        }
+    }
+
+    // 강제 종료된 워커의 마지막 스냅샷에 빠진 실행 횟수를 채운다
+    _settleExecs(worker, done) {
+        const baseExecs = worker.baseStats ? worker.baseStats.totalExecs : 0;
+        const snap = this.workerStats.get(worker.workerId);
+        if (snap && snap.totalExecs - baseExecs >= done) return;
+        this.workerStats.set(worker.workerId, Object.assign(snap ? Object.assign({}, snap) : emptySnapshot(worker.baseStats),
+            { totalExecs: baseExecs + done }));
+        this._aggregate();
+    }
+
+    _onWorkerMessage(worker, msg) {
+        const updateCallback = this.updateCallback;
+        if (!msg || typeof msg !== 'object') return;
+        if (msg.type === 'seed') {
+            this.seedInputs.push(msg.input);
+            if (msg.file && this.newCorpus.length < MAX_RECORDED_FILES) this.newCorpus.push(msg.file);
+            for (const other of this.workers) {
+                if (other !== worker) other.postMessage({ type: 'seed', input: msg.input });
+            }
+        } else if (msg.type === 'hang') {
+            if (msg.record && msg.record.file) this.hangs.records.push(msg.record);
+        } else if (msg.type === 'resource') {
+            if (msg.record && msg.record.file) this.resourceFindings.records.push(msg.record);
+        } else if (msg.type === 'crash') {
+            if (!msg.crashInfo) return;
+            const { bucket, isNew } = this.crashBuckets.record(msg.crashInfo, msg.input);
+            this.stats.uniqueCrashes.add(bucket.key);
+            if (!bucket.file && msg.record) bucket.file = msg.record.file;
+            if (isNew && msg.record && this.crashRecords.length < MAX_RECORDED_FILES) this.crashRecords.push(msg.record);
+        } else if (msg.type === 'stats' || msg.type === 'done') {
+            if (msg.type === 'done') worker.finished = true;
+            this.workerStats.set(msg.workerId, mergeSnapshots(worker.baseStats, msg.stats));
+            this._aggregate();
+            try { updateCallback(this.stats.toJSON()); } catch (e) {}
+        }
+    }
+
+    // 워커별 스냅샷을 하나의 FuzzingStats 로 합친다
+    _aggregate() {
+        const st = this.stats;
+        let totalExecs = 0;
+        let crashCount = 0;
+        let paths = 0;
+        let execsPerSec = 0;
+        let sinkReached = 0;
+        let sinkExploited = 0;
+        let hangs = this.syncHangs;
+        let slowInputs = 0;
+        let memoryInputs = 0;
+        let asyncErrors = 0;
+        let latest = null;
+        let tierCounts = null;
+        let cminLog = [];
+        let scheduler = null;
+        let cmplog = null;
+        const resources = new ResourceOracle();
+        st.resetLatency();
+        const functions = {};
+        for (const snap of this.workerStats.values()) {
+            mergeFunctionStats(functions, snap.functions);
+            totalExecs += snap.totalExecs;
+            crashCount += snap.crashCount;
+            paths += snap.paths;
+            execsPerSec += snap.execsPerSec;
+            sinkReached += snap.sinkReached;
+            sinkExploited += snap.sinkExploited;
+            hangs += snap.hangs || 0;
+            slowInputs += snap.slowInputs || 0;
+            memoryInputs += snap.memoryInputs || 0;
+            asyncErrors += snap.asyncErrors || 0;
+            if (snap.tierCounts) {
+                tierCounts = tierCounts || { cheap: 0, precise: 0 };
+                tierCounts.cheap += snap.tierCounts.cheap;
+                tierCounts.precise += snap.tierCounts.precise;
+            }
+            if (snap.cminLog) cminLog = cminLog.concat(snap.cminLog);
+            if (snap.scheduler) scheduler = mergeSchedulerSummary(scheduler, snap.scheduler);
+            if (snap.resources) mergeResources(resources, snap.resources);
+            if (snap.cmplog) cmplog = mergeCmpLogSummary(cmplog, snap.cmplog);
+            if (snap.latency) st.mergeLatency(snap.latency);
+            // 첫 익스플로잇/time-to-sink 은 워커가 아니라 캠페인 시작 기준으로 다시 잰다
+            st.firstExploit = earliestEvent(st.firstExploit, snap.firstExploit, st.startTime);
+            st.firstReach = earliestEvent(st.firstReach, snap.firstReach, st.startTime);
+            st.closestDistance = minDistance(st.closestDistance, snap.closestDistance);
+            st.maxCoverage = Math.max(st.maxCoverage, snap.maxCoverage);
+            st.cumulativeCoverage = Math.max(st.cumulativeCoverage, snap.cumulativeCoverage);
+            if (!latest || snap.lastExecTime > latest.lastExecTime) latest = snap;
+        }
+        st.totalExecs = totalExecs;
+        st.crashCount = crashCount;
+        st.paths = paths;
+        st.execsPerSec = execsPerSec;
+        st.sinkReached = sinkReached;
+        st.sinkExploited = sinkExploited;
+        st.hangs = hangs;
+        st.slowInputs = slowInputs;
+        st.memoryInputs = memoryInputs;
+        st.functions = functions;
+        this.asyncErrors = asyncErrors;
+        this.tierCounts = tierCounts;
+        this.cminLog = cminLog;
+        this.schedulerSummary = scheduler;
+        this.cmplogSummary = cmplog;
+        this.resources = resources;
+        if (latest) {
+            st.currentCoverage = latest.currentCoverage;
+            st.lastInput = latest.lastInput;
+            st.lastExecTime = latest.lastExecTime;
+        }
+    }
+
+    stop() {
+        this.isRunning = false;
+        this.stats.currentStage = 'stopping';
+        this._dropSpare();
+        for (const worker of this.workers) {
+            try { worker.postMessage({ type: 'stop' }); } catch (e) {}
+        }
+    }
+
+    addSeed(seed) {
+        if (!seed) return;
+        this.seedInputs.push(String(seed));
+        for (const worker of this.workers) worker.postMessage({ type: 'seed', input: String(seed) });
+    }
+}
+
+// 재시작된 워커의 스냅샷에 이전 워커의 누적값을 더한다
+function mergeSnapshots(base, snap) {
+    if (!base) return snap;
+    const functions = mergeFunctionStats(mergeFunctionStats({}, base.functions), snap.functions);
+    return Object.assign({}, snap, {
+        functions,
+        totalExecs: base.totalExecs + snap.totalExecs,
+        crashCount: base.crashCount + snap.crashCount,
+        paths: base.paths + snap.paths,
+        sinkReached: base.sinkReached + snap.sinkReached,
+        sinkExploited: base.sinkExploited + snap.sinkExploited,
+        hangs: (base.hangs || 0) + (snap.hangs || 0),
+        slowInputs: (base.slowInputs || 0) + (snap.slowInputs || 0),
+        memoryInputs: (base.memoryInputs || 0) + (snap.memoryInputs || 0),
+        latency: base.latency && snap.latency ? mergeLatency(base.latency, snap.latency) : snap.latency,
+        resources: base.resources && snap.resources ? mergeResources(mergeResources(new ResourceOracle(), base.resources), snap.resources).toJSON() : snap.resources,
+        asyncErrors: (base.asyncErrors || 0) + (snap.asyncErrors || 0),
+        tierCounts: base.tierCounts && snap.tierCounts
+            ? { cheap: base.tierCounts.cheap + snap.tierCounts.cheap, precise: base.tierCounts.precise + snap.tierCounts.precise }
+            : snap.tierCounts,
+        cminLog: (base.cminLog || []).concat(snap.cminLog || []),
+        firstExploit: earliestEvent(base.firstExploit, snap.firstExploit),
+        firstReach: earliestEvent(base.firstReach, snap.firstReach),
+        closestDistance: minDistance(base.closestDistance, snap.closestDistance),
+        maxCoverage: Math.max(base.maxCoverage, snap.maxCoverage),
+        cumulativeCoverage: Math.max(base.cumulativeCoverage, snap.cumulativeCoverage)
+    });
+}
+
+// 워커가 첫 stats 메시지도 보내기 전에 종료됐을 때의 빈 스냅샷
+function emptySnapshot(base) {
+    if (base) return Object.assign({}, base);
+    return {
+        totalExecs: 0, crashCount: 0, paths: 0, hangs: 0, slowInputs: 0, memoryInputs: 0, asyncErrors: 0, currentCoverage: 0, cumulativeCoverage: 0,
+        maxCoverage: 0, execsPerSec: 0, functions: {}, sinkReached: 0, sinkExploited: 0, firstExploit: null,
+        firstReach: null, closestDistance: null, lastInput: '', lastExecTime: 0
+    };
+}
+
+// firstExploit/firstReach 중 먼저 일어난 것 (at: 벽시계 시각). startTime 을 주면 ms 를 그 기준으로 다시 잰다
+function earliestEvent(current, event, startTime) {
+    if (!event || (current && !(event.at < current.at))) return current;
+    return startTime === undefined ? event : Object.assign({}, event, { ms: event.at - startTime });
+}
+
+// sink 까지의 거리 중 작은 쪽 (모르면 null)
+function minDistance(a, b) {
+    if (typeof a !== 'number') return typeof b === 'number' ? b : null;
+    return typeof b === 'number' ? Math.min(a, b) : a;
+}
+
+// 워커별 시드 큐 요약을 하나로 더한다
+function mergeSchedulerSummary(total, summary) {
+    if (!total) return Object.assign({}, summary);
+    const merged = {
+        schedule: summary.schedule,
+        objective: summary.objective,
+        seeds: total.seeds + summary.seeds,
+        favored: total.favored + summary.favored,
+        culled: total.culled + summary.culled,
+        picks: total.picks + summary.picks
+    };
+    if (summary.objective === 'sink') merged.closestDistance = minDistance(total.closestDistance, summary.closestDistance);
+    return merged;
+}
+
+// 워커들은 같은 하네스 리터럴을 각자 모으므로 더하지 않고 항목별 최댓값을 쓴다
+function mergeCmpLogSummary(a, b) {
+    if (!a) return Object.assign({}, b);
+    return { tokens: Math.max(a.tokens, b.tokens), static: Math.max(a.static, b.static), dynamic: Math.max(a.dynamic, b.dynamic) };
+}
+
+// 워커 스냅샷의 히스토그램(ResourceOracle.toJSON)을 target 에 더한다
+function mergeResources(target, resources) {
+    target.execUs.merge(resources.execUs);
+    target.heapBytes.merge(resources.heapBytes);
+    return target;
+}
+
+// 두 스냅샷의 단계별 지연 시간 히스토그램(FuzzingStats.latencyJSON)을 합친다
+function mergeLatency(a, b) {
+    const total = new FuzzingStats();
+    total.mergeLatency(a);
+    total.mergeLatency(b);
+    return total.latencyJSON();
+}
+
+// 함수별 통계를 target 에 더한다 (maxCoverage 는 최대값)
+function mergeFunctionStats(target, functions) {
+    for (const [name, f] of Object.entries(functions || {})) {
+        const t = target[name] || (target[name] = { execs: 0, crashes: 0, paths: 0, maxCoverage: 0 });
+        t.execs += f.execs;
+        t.crashes += f.crashes;
+        t.paths += f.paths;
+        t.maxCoverage = Math.max(t.maxCoverage, f.maxCoverage);
+    }
+    return target;
+}
+
+function workerSnapshot(fuzzer, asyncErrors = 0) {
+    const st = fuzzer.stats;
+    return {
+        totalExecs: st.totalExecs,
+        crashCount: st.crashCount,
+        paths: st.paths,
+        hangs: st.hangs,
+        slowInputs: st.slowInputs,
+        memoryInputs: st.memoryInputs,
+        resources: fuzzer.resources.toJSON(),
+        cmplog: fuzzer.cmplog ? fuzzer.cmplog.summary() : null,
+        asyncErrors,
+        tierCounts: fuzzer.coverageMode === 'tiered' ? Object.assign({}, fuzzer.tierCounts) : null,
+        cminLog: fuzzer.cminLog,
+        scheduler: fuzzer.scheduler.summary(),
+        currentCoverage: st.currentCoverage,
+        cumulativeCoverage: st.cumulativeCoverage,
+        maxCoverage: st.maxCoverage,
+        execsPerSec: st.execsPerSec,
+        latency: st.latencyJSON(),
+        functions: st.functions,
+        sinkReached: st.sinkReached,
+        sinkExploited: st.sinkExploited,
+        firstExploit: st.firstExploit,
+        firstReach: st.firstReach,
+        closestDistance: st.closestDistance,
+        lastInput: st.lastInput,
+        lastExecTime: st.lastExecTime
+    };
+}
+
+async function workerMain() {
+    const { targetFilePath, mutatorPyPath, virginBuffer, heartbeat, options } = workerData;
+    const fuzzer = new FuzzerCore(Object.assign({}, options, {
+        sharedVirginMap: virginBuffer,
+        heartbeat,
+        onNewSeed: (input, file) => parentPort.postMessage({ type: 'seed', input, file }),
+        onCrash: (input, crashInfo, record) => parentPort.postMessage({ type: 'crash', input, crashInfo, record }),
+        onHang: (input, record) => parentPort.postMessage({ type: 'hang', record }),
+        onResource: (input, record) => parentPort.postMessage({ type: 'resource', record })
+    }));
+    // 하네스가 비동기로 던진 예외(spawn ENOENT 등) 때문에 워커가 죽지 않도록 세기만 한다
+    let asyncErrors = 0;
+    process.on('uncaughtException', () => { asyncErrors++; });
+    process.on('unhandledRejection', () => { asyncErrors++; });
+    // 예비 워커는 init 을 마친 채로 start 를 기다린다 (init 중에 온 start 도 놓치지 않는다)
+    let onStart = null;
+    const started = new Promise((resolve) => { onStart = resolve; });
+    parentPort.on('message', (msg) => {
+        if (msg && msg.type === 'start') onStart(msg);
+        else if (msg && msg.type === 'seed') fuzzer.addSeed(msg.input);
+        else if (msg && msg.type === 'stop') fuzzer.stop();
+    });
+    await fuzzer.init(targetFilePath, mutatorPyPath, null);
+    fuzzer.warmUp();
+    const { workerId, iterations, seeds, timeBudgetMs } = await started;
+    fuzzer.seedInputs = seeds.slice();
+    if (timeBudgetMs) fuzzer.timeBudgetMs = timeBudgetMs;
+
+    let lastPost = 0;
+    await fuzzer.startFuzzing(iterations, () => {
+        const now = Date.now();
+        if (now - lastPost < STATS_INTERVAL_MS) return;
+        lastPost = now;
+        parentPort.postMessage({ type: 'stats', workerId, stats: workerSnapshot(fuzzer, asyncErrors) });
+    });
+    parentPort.postMessage({ type: 'done', workerId, stats: workerSnapshot(fuzzer, asyncErrors) });
+    process.exit(0);
+}
+
+if (!isMainThread && workerData && workerData.virginBuffer) {
+    workerMain().catch((e) => {
+        parentPort.postMessage({ type: 'error', message: e && e.message ? e.message : String(e) });
+        process.exit(1);
+    });
+}
+
+module.exports = { ParallelFuzzer };
@@ -0,0 +1,66 @@
+// coverage/core/resource_oracle.js
+//
+// 예외를 던지지 않아도 실행 시간이나 메모리를 비정상적으로 많이 쓰는 입력(알고리즘 복잡도 공격,
+// catastrophic regex, 깊게 중첩된 JSON 등)을 크래시/hang 과 다른 발견 종류('resource')로 남긴다.
+//   ResourceOracle : 실행마다 시간(µs)과 힙 증가량(bytes)을 LogHistogram(exec_stats.js)에 넣고, 지금까지의 중앙값(기준선)보다
+//                    factor 배 이상이고 하한(minSlowUs / minHeapBytes)도 넘는 실행을 찾는다.
+//                    처음 warmup 번은 JIT 워밍업 때문에 판정하지 않는다.
+// 힙 증가량은 실행 전후 used_heap_size 의 차이라 실행 중에 GC 가 돌면 실제보다 작게 잡힌다 (음수는 0 으로 센다).
+
+const { LogHistogram } = require('./exec_stats');
+
+// 기준선(중앙값)은 이 횟수마다 다시 계산한다
+const BASELINE_INTERVAL = 64;
+// 같은 종류의 발견은 지금까지 가장 나빴던 값보다 이만큼 더 나빠야 새로 저장한다
+const WORSEN_RATIO = 1.1;
+
+class ResourceOracle {
+    // options: { slowFactor, minSlowUs, memoryFactor, minHeapBytes, warmup }
+    constructor(options = {}) {
+        this.slowFactor = options.slowFactor > 1 ? options.slowFactor : 10;
+        this.minSlowUs = options.minSlowUs >= 0 ? options.minSlowUs : 10000;
+        this.memoryFactor = options.memoryFactor > 1 ? options.memoryFactor : 10;
+        this.minHeapBytes = options.minHeapBytes >= 0 ? options.minHeapBytes : 8 * 1024 * 1024;
+        this.warmup = options.warmup >= 0 ? options.warmup : 100;
+        this.execUs = new LogHistogram();
+        this.heapBytes = new LogHistogram();
+        this.baseline = { slow: 0, memory: 0 };
+        this.worst = { slow: 0, memory: 0 };
+    }
+
+    // 실행 하나를 기록한다. 기준선보다 훨씬 무거우면 { cause, value, baseline, ratio, worst } 를 돌려준다.
+    // worst 는 같은 종류에서 지금까지 가장 나쁜 값을 WORSEN_RATIO 이상 넘었는지 (입력을 새로 저장할지)
+    observe(execUs, heapBytes) {
+        heapBytes = heapBytes > 0 ? heapBytes : 0;
+        let finding = null;
+        if (this.execUs.count >= this.warmup) {
+            if (this.execUs.count % BASELINE_INTERVAL === 0 || !this.baseline.slow) {
+                this.baseline.slow = this.execUs.percentile(50);
+                this.baseline.memory = this.heapBytes.percentile(50);
+            }
+            finding = this._check('slow', execUs, this.slowFactor, this.minSlowUs)
+                || this._check('memory', heapBytes, this.memoryFactor, this.minHeapBytes);
+        }
+        this.execUs.record(execUs);
+        this.heapBytes.record(heapBytes);
+        return finding;
+    }
+
+    _check(cause, value, factor, floor) {
+        const baseline = this.baseline[cause];
+        if (value < floor || value < baseline * factor) return null;
+        const worst = value >= this.worst[cause] * WORSEN_RATIO;
+        if (worst) this.worst[cause] = value;
+        return { cause, value: Math.round(value), baseline: Math.round(baseline), ratio: baseline ? Math.round(value / baseline) : null, worst };
+    }
+
+    summary() {
+        return { execUs: this.execUs.summary(), heapBytes: this.heapBytes.summary() };
+    }
+
+    toJSON() {
+        return { execUs: this.execUs.toJSON(), heapBytes: this.heapBytes.toJSON() };
+    }
+}
+
+module.exports = { ResourceOracle };
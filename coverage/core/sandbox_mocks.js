@@ -0,0 +1,417 @@
+// coverage/core/sandbox_mocks.js
+//
+// 하네스가 require 하는 부작용 모듈(child_process, fs 쓰기, net/http/https, DB 클라이언트)을
+// 메모리에 호출만 기록하고 바로 돌아오는 가짜로 바꿔 준다.
+// Module._load 를 가로채되, 요청한 쪽(parent)이 대상 하네스일 때만 가짜를 돌려주므로
+// 퍼저 자신이 쓰는 fs 등은 그대로 실제 모듈이다.
+
+const Module = require('module');
+const EventEmitter = require('events');
+const { Readable, Writable } = require('stream');
+const realFs = require('fs');
+
+// 기록 중에 쓰는 JSON.parse 가 hookJsonParse 에 다시 잡히지 않도록 원본을 잡아 둔다
+const jsonParse = JSON.parse;
+// 같은 이유로 cmplog.js 가 감싸기 전의 String.prototype.includes 를 쓴다 (스택 검사가 비교 피연산자로 기록되지 않도록)
+const stringIncludes = String.prototype.includes;
+
+const MAX_CALLS_PER_EXEC = 256;
+const MAX_ARG_LENGTH = 4096;
+
+// 가짜 모듈 호출을 순서대로 모아 둔다. 실행 한 번이 끝나면 drain() 으로 꺼낸다
+class CallRecorder {
+    constructor(maxCalls = MAX_CALLS_PER_EXEC) {
+        this.maxCalls = maxCalls;
+        this.calls = [];
+        this.dropped = 0;
+        // 하네스 함수를 실행하는 동안만 true (전역 훅이 퍼저 자신의 호출을 기록하지 않도록)
+        this.armed = false;
+    }
+
+    record(module, fn, args) {
+        if (this.calls.length >= this.maxCalls) {
+            this.dropped++;
+            return;
+        }
+        this.calls.push({ module, fn, args: Array.from(args, summarizeArg) });
+    }
+
+    drain() {
+        const calls = this.calls;
+        this.calls = [];
+        this.dropped = 0;
+        return calls;
+    }
+}
+
+function summarizeArg(value) {
+    if (typeof value === 'function') return '[Function]';
+    if (typeof value === 'string') return value.length > MAX_ARG_LENGTH ? value.slice(0, MAX_ARG_LENGTH) : value;
+    if (Buffer.isBuffer(value)) return value.toString('utf-8', 0, MAX_ARG_LENGTH);
+    if (value === null || typeof value !== 'object') return value;
+    try {
+        const json = JSON.stringify(value);
+        return json && json.length > MAX_ARG_LENGTH ? json.slice(0, MAX_ARG_LENGTH) : jsonParse(json);
+    } catch (e) {
+        return String(value);
+    }
+}
+
+function lastCallback(args) {
+    const last = args[args.length - 1];
+    return typeof last === 'function' ? last : null;
+}
+
+function later(fn, ...args) {
+    if (typeof fn === 'function') process.nextTick(fn, ...args);
+}
+
+// 실제 API 가 동기적으로 던지는 인자 오류는 그대로 흉내 낸다 (크래시 신호를 잃지 않도록)
+function checkPath(p) {
+    if (typeof p !== 'string' && !Buffer.isBuffer(p) && !(p instanceof URL) && typeof p !== 'number') {
+        const err = new TypeError(`The "path" argument must be of type string or an instance of Buffer or URL. Received ${typeof p}`);
+        err.code = 'ERR_INVALID_ARG_TYPE';
+        throw err;
+    }
+    if (typeof p === 'string' && p.includes('\u0000')) {
+        const err = new TypeError('The argument \'path\' must be a string, Uint8Array, or URL without null bytes.');
+        err.code = 'ERR_INVALID_ARG_VALUE';
+        throw err;
+    }
+}
+
+function checkString(name, value) {
+    if (typeof value !== 'string') {
+        const err = new TypeError(`The "${name}" argument must be of type string. Received ${typeof value}`);
+        err.code = 'ERR_INVALID_ARG_TYPE';
+        throw err;
+    }
+}
+
+function fakeStream() {
+    const stream = new Readable({ read() {} });
+    stream.push(null);
+    return stream;
+}
+
+function fakeChildProcess() {
+    const child = new EventEmitter();
+    child.pid = 0;
+    child.exitCode = null;
+    child.stdin = new Writable({ write(chunk, enc, cb) { cb(); } });
+    child.stdout = fakeStream();
+    child.stderr = fakeStream();
+    child.kill = () => true;
+    child.unref = () => child;
+    child.ref = () => child;
+    process.nextTick(() => {
+        child.exitCode = 0;
+        child.emit('exit', 0, null);
+        child.emit('close', 0, null);
+    });
+    return child;
+}
+
+function createChildProcessMock(recorder) {
+    const execLike = (fn) => function (command, ...rest) {
+        checkString(fn === 'execFile' ? 'file' : 'command', command);
+        recorder.record('child_process', fn, [command, ...rest]);
+        later(lastCallback(rest), null, '', '');
+        return fakeChildProcess();
+    };
+    const syncLike = (fn) => function (command, ...rest) {
+        checkString(fn === 'execFileSync' ? 'file' : 'command', command);
+        recorder.record('child_process', fn, [command, ...rest]);
+        const opts = rest.find(a => a && typeof a === 'object' && !Array.isArray(a)) || {};
+        return opts.encoding && opts.encoding !== 'buffer' ? '' : Buffer.alloc(0);
+    };
+    return {
+        exec: execLike('exec'),
+        execFile: execLike('execFile'),
+        spawn(command, ...rest) {
+            checkString('file', command);
+            recorder.record('child_process', 'spawn', [command, ...rest]);
+            return fakeChildProcess();
+        },
+        fork(modulePath, ...rest) {
+            recorder.record('child_process', 'fork', [modulePath, ...rest]);
+            return fakeChildProcess();
+        },
+        execSync: syncLike('execSync'),
+        execFileSync: syncLike('execFileSync'),
+        spawnSync(command, ...rest) {
+            checkString('file', command);
+            recorder.record('child_process', 'spawnSync', [command, ...rest]);
+            return { pid: 0, status: 0, signal: null, output: [null, Buffer.alloc(0), Buffer.alloc(0)], stdout: Buffer.alloc(0), stderr: Buffer.alloc(0) };
+        }
+    };
+}
+
+const FS_WRITE_SYNC = ['writeFileSync', 'appendFileSync', 'unlinkSync', 'rmSync', 'rmdirSync', 'mkdirSync',
+    'renameSync', 'copyFileSync', 'chmodSync', 'chownSync', 'symlinkSync', 'linkSync', 'truncateSync', 'utimesSync'];
+const FS_WRITE_ASYNC = ['writeFile', 'appendFile', 'unlink', 'rm', 'rmdir', 'mkdir', 'rename', 'copyFile',
+    'chmod', 'chown', 'symlink', 'link', 'truncate', 'utimes'];
+
+// 읽기 API 는 실제 fs 를 그대로 쓰고 쓰기 계열만 가로챈다
+function createFsMock(recorder) {
+    const fs = Object.create(realFs);
+    for (const fn of FS_WRITE_SYNC) {
+        fs[fn] = function (target, ...rest) {
+            checkPath(target);
+            recorder.record('fs', fn, [target, ...rest]);
+            return undefined;
+        };
+    }
+    for (const fn of FS_WRITE_ASYNC) {
+        fs[fn] = function (target, ...rest) {
+            checkPath(target);
+            recorder.record('fs', fn, [target, ...rest]);
+            later(lastCallback(rest), null);
+        };
+    }
+    fs.createWriteStream = function (target, options) {
+        checkPath(target);
+        recorder.record('fs', 'createWriteStream', [target, options]);
+        const stream = new Writable({
+            write(chunk, enc, cb) {
+                recorder.record('fs', 'createWriteStream.write', [target, chunk]);
+                cb();
+            }
+        });
+        stream.path = target;
+        stream.bytesWritten = 0;
+        return stream;
+    };
+    const promises = Object.create(realFs.promises);
+    for (const fn of FS_WRITE_ASYNC) {
+        promises[fn] = async function (target, ...rest) {
+            checkPath(target);
+            recorder.record('fs.promises', fn, [target, ...rest]);
+        };
+    }
+    fs.promises = promises;
+    return fs;
+}
+
+function fakeResponse() {
+    const res = fakeStream();
+    res.statusCode = 200;
+    res.statusMessage = 'OK';
+    res.headers = {};
+    res.setEncoding = () => res;
+    return res;
+}
+
+function fakeServer(moduleName, recorder) {
+    const server = new EventEmitter();
+    server.listen = (...args) => {
+        recorder.record(moduleName, 'listen', args);
+        later(lastCallback(args));
+        return server;
+    };
+    server.close = (cb) => {
+        later(cb);
+        return server;
+    };
+    server.address = () => ({ address: '127.0.0.1', family: 'IPv4', port: 0 });
+    return server;
+}
+
+function createHttpMock(moduleName, recorder) {
+    const real = require(moduleName);
+    const defaultProtocol = moduleName === 'https' ? 'https:' : 'http:';
+    const request = (fn) => function (target, ...rest) {
+        // 실제 구현처럼 잘못된 URL/프로토콜은 동기적으로 던진다
+        if (typeof target === 'string') target = new URL(target);
+        const protocol = target && target.protocol ? target.protocol : defaultProtocol;
+        if (protocol !== defaultProtocol) {
+            const err = new TypeError(`Protocol "${protocol}" not supported. Expected "${defaultProtocol}"`);
+            err.code = 'ERR_INVALID_PROTOCOL';
+            throw err;
+        }
+        recorder.record(moduleName, fn, [target instanceof URL ? target.href : target, ...rest]);
+        const cb = lastCallback(rest);
+        const req = new EventEmitter();
+        let sent = false;
+        const send = () => {
+            if (sent) return;
+            sent = true;
+            process.nextTick(() => {
+                const res = fakeResponse();
+                if (cb) cb(res);
+                req.emit('response', res);
+                req.emit('close');
+            });
+        };
+        req.write = (chunk) => {
+            recorder.record(moduleName, `${fn}.write`, [chunk]);
+            return true;
+        };
+        req.end = (...args) => {
+            if (args.length && typeof args[0] !== 'function') req.write(args[0]);
+            send();
+            return req;
+        };
+        req.setHeader = () => req;
+        req.setTimeout = () => req;
+        req.abort = () => {};
+        req.destroy = () => req;
+        if (fn === 'get') send();
+        return req;
+    };
+    return Object.assign(Object.create(real), {
+        request: request('request'),
+        get: request('get'),
+        createServer: (...args) => {
+            recorder.record(moduleName, 'createServer', args);
+            return fakeServer(moduleName, recorder);
+        }
+    });
+}
+
+function createNetMock(recorder) {
+    const real = require('net');
+    const connect = (...args) => {
+        recorder.record('net', 'connect', args);
+        const socket = new EventEmitter();
+        socket.write = (chunk) => {
+            recorder.record('net', 'write', [chunk]);
+            return true;
+        };
+        socket.end = () => {
+            process.nextTick(() => socket.emit('close', false));
+            return socket;
+        };
+        socket.destroy = () => socket;
+        socket.setEncoding = () => socket;
+        socket.setTimeout = () => socket;
+        socket.setNoDelay = () => socket;
+        socket.setKeepAlive = () => socket;
+        later(lastCallback(args));
+        process.nextTick(() => socket.emit('connect'));
+        return socket;
+    };
+    return Object.assign(Object.create(real), {
+        connect,
+        createConnection: connect,
+        createServer: (...args) => {
+            recorder.record('net', 'createServer', args);
+            return fakeServer('net', recorder);
+        }
+    });
+}
+
+// 쿼리 계열 메서드는 기록만 하고 빈 결과를 콜백/Promise 로 돌려준다
+function createDbClient(moduleName, recorder) {
+    const client = {};
+    const query = (fn) => function (sql, ...rest) {
+        recorder.record(moduleName, fn, [sql, ...rest]);
+        const cb = lastCallback(rest);
+        if (cb) {
+            later(cb, null, fn === 'get' ? undefined : []);
+            return client;
+        }
+        return Promise.resolve(fn === 'get' ? undefined : { rows: [], rowCount: 0 });
+    };
+    for (const fn of ['all', 'get', 'run', 'exec', 'each', 'query', 'execute']) client[fn] = query(fn);
+    client.prepare = (sql) => {
+        recorder.record(moduleName, 'prepare', [sql]);
+        return { run: query('run'), all: query('all'), get: query('get'), finalize: (cb) => later(cb) };
+    };
+    client.serialize = (cb) => { if (typeof cb === 'function') cb(); };
+    client.connect = (cb) => {
+        later(cb, null);
+        return cb ? client : Promise.resolve(client);
+    };
+    client.end = (cb) => {
+        later(cb, null);
+        return cb ? undefined : Promise.resolve();
+    };
+    client.close = client.end;
+    client.release = () => {};
+    client.getConnection = (cb) => {
+        later(cb, null, client);
+        return cb ? undefined : Promise.resolve(client);
+    };
+    return client;
+}
+
+function createDbModule(moduleName, recorder) {
+    const factory = () => createDbClient(moduleName, recorder);
+    function Client() { return factory(); }
+    return {
+        Database: Client,
+        Client,
+        Pool: Client,
+        verbose() { return this; },
+        createConnection: factory,
+        createPool: factory,
+        connect: () => Promise.resolve(factory())
+    };
+}
+
+const DB_MODULES = ['sqlite3', 'better-sqlite3', 'mysql', 'mysql2', 'mysql2/promise', 'pg'];
+
+// 모듈 이름 -> 가짜 생성 함수. 사용자가 options.mocks 로 추가/교체할 수 있다
+function defaultMockFactories() {
+    const factories = {
+        child_process: recorder => createChildProcessMock(recorder),
+        fs: recorder => createFsMock(recorder),
+        'fs/promises': recorder => createFsMock(recorder).promises,
+        http: recorder => createHttpMock('http', recorder),
+        https: recorder => createHttpMock('https', recorder),
+        net: recorder => createNetMock(recorder)
+    };
+    for (const name of DB_MODULES) factories[name] = recorder => createDbModule(name, recorder);
+    return factories;
+}
+
+// JSON.parse 는 require 없이 쓰이므로 전역을 감싸고, 대상 하네스에서 부른 호출만 기록한다
+function hookJsonParse(recorder, targets) {
+    const originalParse = JSON.parse;
+    JSON.parse = function parse(text, reviver) {
+        if (recorder.armed) {
+            const stack = new Error().stack || '';
+            for (const target of targets) {
+                if (stringIncludes.call(stack, target)) {
+                    recorder.record('JSON', 'parse', [text]);
+                    break;
+                }
+            }
+        }
+        return originalParse.apply(this, arguments);
+    };
+    return () => {
+        JSON.parse = originalParse;
+    };
+}
+
+// 대상 하네스가 require 하는 모듈만 가짜로 바꾼다. 되돌리는 함수를 반환한다
+function installMocks({ targetPath, recorder, factories = defaultMockFactories() }) {
+    const cache = new Map();
+    const targets = new Set([targetPath]);
+    try { targets.add(realFs.realpathSync(targetPath)); } catch (e) {}
+    const originalLoad = Module._load;
+    Module._load = function (request, parent, isMain) {
+        if (parent && targets.has(parent.filename)) {
+            const name = request.startsWith('node:') ? request.slice(5) : request;
+            if (Object.prototype.hasOwnProperty.call(factories, name)) {
+                if (!cache.has(name)) cache.set(name, factories[name](recorder));
+                return cache.get(name);
+            }
+        }
+        return originalLoad.apply(this, arguments);
+    };
+    const restoreJson = hookJsonParse(recorder, targets);
+    return () => {
+        if (Module._load !== originalLoad) Module._load = originalLoad;
+        restoreJson();
+    };
+}
+
+// 예전 FuzzerCore.init 의 global.db 스텁. 이제 호출도 기록한다
+function createGlobalDb(recorder) {
+    return createDbClient('global.db', recorder);
+}
+
+module.exports = { CallRecorder, installMocks, defaultMockFactories, createGlobalDb };
@@ -0,0 +1,256 @@
+// coverage/core/seed_scheduler.js
+//
+// 시드마다 에너지를 매기고 가중 추첨으로 다음 변이 대상을 고른다 (AFLFast 류 power schedule).
+//   rarity  : 시드 trace 에서 가장 드물게 실행된 맵 인덱스일수록(히트 수가 적을수록) 크다
+//   speed   : 평균보다 빨리 실행되는 시드일수록 크다
+//   size    : 평균보다 짧은 입력일수록 크다
+//   recency : 최근에 새 경로를 낳은 시드일수록 크다 (실행 횟수 기준 반감기)
+//   fatigue : 아직 안 뽑힌 시드는 두 배, 많이 뽑힌 시드는 로그 스케일로 줄인다
+// 맵 인덱스마다 가장 짧고 빠른 시드를 favored 로 두고 나머지는 에너지를 낮춘다.
+// objective 가 slowness 면 speed 를 뒤집어 평균보다 느린 시드에 에너지를 더 주고 size 는 보지 않으며,
+// favored 도 맵 인덱스마다 가장 느린 시드로 정한다.
+// objective 가 sink 면 (directed, AFLGo 류) sink 까지의 거리(sink_distance.js)를 시드 사이에서 0~1 로 정규화하고
+// 담금질 온도 T = 20^(-execs / DIRECTED_COOLING_EXECS) 로 처음에는 거리를 거의 보지 않다가 점점 가까운 시드에
+// 에너지를 몰아준다 (최대 DIRECTED_MAX_FACTOR 배). 가장 가까운 시드는 항상 favored 다.
+// 주기적으로(CULL_INTERVAL 번 뽑을 때마다) favored 를 다시 정하고, 오래 뽑혀도 아무것도 못 찾은 시드와
+// maxSeeds 를 넘는 시드를 favored 가 아닌 것 중 에너지가 낮은 것부터 버린다. favored 만으로 maxSeeds 를
+// 넘으면 cost 가 높은 favored 도 버린다 (큐는 항상 maxSeeds 이하).
+
+const { MAP_SIZE } = require('./coverage_utils');
+
+const DEFAULT_MAX_SEEDS = 1024;
+const CULL_INTERVAL = 4096;
+const STALE_PICKS = 256;
+const RECENCY_HALF_LIFE = 2000;
+const FACTOR_MIN = 0.25;
+const FACTOR_MAX = 4;
+const RARITY_MAX = 16;
+const UNFAVORED_WEIGHT = 0.1;
+const DIRECTED_COOLING_EXECS = 20000;
+const DIRECTED_MAX_FACTOR = 32;
+
+function clamp(v, lo, hi) {
+    return v < lo ? lo : (v > hi ? hi : v);
+}
+
+class SeedScheduler {
+    // options: { schedule: 'energy' | 'uniform', maxSeeds, objective: 'coverage' | 'slowness' | 'sink' }
+    constructor(options = {}) {
+        this.schedule = options.schedule === 'uniform' ? 'uniform' : 'energy';
+        this.objective = ['slowness', 'sink'].includes(options.objective) ? options.objective : 'coverage';
+        this.slowness = this.objective === 'slowness';
+        this.directed = this.objective === 'sink';
+        this.maxSeeds = options.maxSeeds > 0 ? options.maxSeeds : DEFAULT_MAX_SEEDS;
+        // 맵 인덱스별 누적 히트 수 (rarity 의 기준)
+        this.hits = new Uint32Array(MAP_SIZE);
+        this.entries = [];
+        this.byInput = new Map();
+        this.execs = 0;
+        this.picks = 0;
+        this.nextCull = CULL_INTERVAL;
+        this.favoredDirty = true;
+        this.culled = 0;
+    }
+
+    get size() {
+        return this.entries.length;
+    }
+
+    inputs() {
+        return this.entries.map(e => e.input);
+    }
+
+    // 같은 입력은 한 번만 둔다. meta: { indices (trace 의 맵 인덱스), execUs, distance (sink 까지, 모르면 null) }
+    add(input, meta = {}) {
+        input = String(input);
+        let entry = this.byInput.get(input);
+        if (!entry) {
+            entry = { input, indices: null, execUs: 0, distance: null, cost: 0, picks: 0, found: 0, lastFound: 0, favored: false };
+            this.byInput.set(input, entry);
+            this.entries.push(entry);
+        }
+        if (meta.indices && meta.indices.length && !entry.indices) entry.indices = meta.indices;
+        if (meta.execUs && !entry.execUs) entry.execUs = meta.execUs;
+        if (typeof meta.distance === 'number' && (entry.distance === null || meta.distance < entry.distance)) entry.distance = meta.distance;
+        this.favoredDirty = true;
+        if (this.entries.length > this.maxSeeds) this.cull();
+        return entry;
+    }
+
+    // 큐를 통째로 바꾼다 (시드 파일, 병렬 워커 초기 시드, importState)
+    reset(inputs) {
+        this.entries = [];
+        this.byInput = new Map();
+        for (const input of inputs) this.add(input);
+    }
+
+    // cmin 결과처럼 남길 입력만 골라 메타데이터는 유지한다
+    retain(inputs) {
+        const keep = new Set(inputs.map(String));
+        this.entries = this.entries.filter(e => keep.has(e.input));
+        this.byInput = new Map(this.entries.map(e => [e.input, e]));
+        this.favoredDirty = true;
+    }
+
+    // 실행 하나(또는 tiered 배치 하나)의 trace 를 히트 수에 더한다
+    observe(trace, execs = 1) {
+        this.execs += execs;
+        const { touched, length } = trace;
+        for (let i = 0; i < length; i++) this.hits[touched[i]]++;
+    }
+
+    // entry 에서 변이한 입력이 새 경로를 열었다
+    reward(entry) {
+        if (!entry) return;
+        entry.found++;
+        entry.lastFound = this.execs;
+    }
+
+    pickBatch(n) {
+        const entries = this.entries;
+        const picked = new Array(n);
+        if (!entries.length) return [];
+        if (this.schedule === 'uniform') {
+            for (let i = 0; i < n; i++) picked[i] = entries[Math.floor(Math.random() * entries.length)];
+        } else {
+            if (this.picks >= this.nextCull) {
+                this.cull();
+                this.nextCull = this.picks + CULL_INTERVAL;
+            }
+            const energies = this._energies();
+            const cumulative = new Float64Array(energies.length);
+            let total = 0;
+            for (let i = 0; i < energies.length; i++) cumulative[i] = (total += energies[i]);
+            for (let i = 0; i < n; i++) {
+                const r = Math.random() * total;
+                let lo = 0;
+                let hi = cumulative.length - 1;
+                while (lo < hi) {
+                    const mid = (lo + hi) >>> 1;
+                    if (cumulative[mid] > r) hi = mid;
+                    else lo = mid + 1;
+                }
+                picked[i] = entries[lo];
+            }
+        }
+        for (const entry of picked) entry.picks++;
+        this.picks += n;
+        return picked;
+    }
+
+    _updateFavored() {
+        const best = new Map();
+        for (const entry of this.entries) {
+            entry.favored = false;
+            if (!entry.indices) continue;
+            entry.cost = this.slowness ? -(entry.execUs || 0) : Math.max(1, entry.input.length) * (entry.execUs || 1);
+            for (const idx of entry.indices) {
+                const cur = best.get(idx);
+                if (!cur || entry.cost < cur.cost) best.set(idx, entry);
+            }
+        }
+        for (const entry of best.values()) entry.favored = true;
+        if (this.directed) {
+            const closest = this._distanceRange().min;
+            for (const entry of this.entries) if (entry.distance !== null && entry.distance === closest) entry.favored = true;
+        }
+        this.favoredDirty = false;
+        return best.size > 0;
+    }
+
+    // 거리를 아는 시드들의 최소/최대 거리
+    _distanceRange(entries = this.entries) {
+        let min = Infinity;
+        let max = -Infinity;
+        for (const entry of entries) {
+            if (entry.distance === null) continue;
+            if (entry.distance < min) min = entry.distance;
+            if (entry.distance > max) max = entry.distance;
+        }
+        return { min, max };
+    }
+
+    // AFLGo 의 annealing power schedule. 거리를 모르는 시드는 1
+    _directedFactor(entry, range, temperature) {
+        if (entry.distance === null || !(range.max >= range.min)) return 1;
+        const norm = range.max > range.min ? (entry.distance - range.min) / (range.max - range.min) : 0;
+        const p = (1 - norm) * (1 - temperature) + 0.5 * temperature;
+        return Math.pow(2, 2 * Math.log2(DIRECTED_MAX_FACTOR) * (p - 0.5));
+    }
+
+    _energies(entries = this.entries) {
+        if (this.favoredDirty) this._updateFavored();
+        let totalUs = 0;
+        let timed = 0;
+        let totalLen = 0;
+        for (const entry of entries) {
+            totalLen += entry.input.length;
+            if (entry.execUs) {
+                totalUs += entry.execUs;
+                timed++;
+            }
+        }
+        const avgUs = timed ? totalUs / timed : 0;
+        const avgLen = entries.length ? totalLen / entries.length : 0;
+        const rarityBase = Math.log2(this.execs + 2);
+        const range = this.directed ? this._distanceRange(entries) : null;
+        const temperature = Math.pow(20, -this.execs / DIRECTED_COOLING_EXECS);
+        const energies = new Float64Array(entries.length);
+        for (let i = 0; i < entries.length; i++) {
+            const entry = entries[i];
+            let energy = 1;
+            if (entry.indices) {
+                let rare = Infinity;
+                for (const idx of entry.indices) if (this.hits[idx] < rare) rare = this.hits[idx];
+                energy *= clamp(rarityBase / Math.log2(rare + 2), 1, RARITY_MAX);
+                if (!entry.favored) energy *= UNFAVORED_WEIGHT;
+            }
+            if (entry.execUs && avgUs) {
+                energy *= clamp(this.slowness ? entry.execUs / avgUs : avgUs / entry.execUs, FACTOR_MIN, FACTOR_MAX);
+            }
+            if (avgLen && !this.slowness) energy *= clamp(avgLen / Math.max(1, entry.input.length), FACTOR_MIN, FACTOR_MAX);
+            if (range) energy *= this._directedFactor(entry, range, temperature);
+            if (entry.found) energy *= 1 + entry.found * Math.pow(2, -(this.execs - entry.lastFound) / RECENCY_HALF_LIFE);
+            energy = entry.picks ? energy / (1 + Math.log2(1 + entry.picks / 64)) : energy * 2;
+            energies[i] = energy;
+        }
+        return energies;
+    }
+
+    // favored 를 다시 정하고, 오래된 비생산 시드와 maxSeeds 초과분을 버린다.
+    // 남길 순서는 favored(가장 가까운 시드, 그다음 cost 가 낮은 것부터) → 나머지(에너지가 높은 것부터)라서
+    // favored 가 maxSeeds 보다 많아도 큐는 maxSeeds 를 넘지 않는다
+    cull() {
+        const traced = this._updateFavored();
+        const before = this.entries.length;
+        // trace 가 하나도 없으면(시드 파일만 읽은 직후) 오래된 시드를 가를 근거가 없으니 maxSeeds 만 맞춘다
+        let keep = traced ? this.entries.filter(e => e.favored || e.found || e.picks < STALE_PICKS) : this.entries;
+        if (keep.length > this.maxSeeds) {
+            const energies = this._energies(keep);
+            const closest = this.directed ? this._distanceRange(keep).min : null;
+            const far = e => (e.distance !== null && e.distance === closest ? 0 : 1);
+            const favored = keep.map((entry, i) => i).filter(i => keep[i].favored)
+                .sort((a, b) => far(keep[a]) - far(keep[b]) || keep[a].cost - keep[b].cost);
+            const rest = keep.map((entry, i) => i).filter(i => !keep[i].favored).sort((a, b) => energies[b] - energies[a]);
+            const kept = new Set(favored.concat(rest).slice(0, this.maxSeeds));
+            keep = keep.filter((entry, i) => kept.has(i));
+        }
+        this.entries = keep;
+        this.byInput = new Map(keep.map(e => [e.input, e]));
+        this.culled += before - keep.length;
+        this.favoredDirty = true;
+    }
+
+    summary() {
+        let favored = 0;
+        for (const entry of this.entries) if (entry.favored) favored++;
+        const out = { schedule: this.schedule, objective: this.objective, seeds: this.entries.length, favored, culled: this.culled, picks: this.picks };
+        if (this.directed) {
+            const { min } = this._distanceRange();
+            out.closestDistance = min === Infinity ? null : min;
+        }
+        return out;
+    }
+}
+
+module.exports = { SeedScheduler };
@@ -0,0 +1,106 @@
+// coverage/core/sink_distance.js
+//
+// directed 모드(objective: 'sink')에서 쓰는 "입력이 sink 에 얼마나 가까이 갔는가" 측정 (AFLGo 류).
+//   locateSink   : 리포트의 sink 이름(exec, spawn, all ...)을 의사 하네스에서 호출하는 자리를 찾는다.
+//                  호출 자리가 여럿이면 리포트의 sink.line 에 가장 가까운 것을 고른다 (의사 하네스는 원본과 줄 번호가 다르다)
+//   SinkDistance : 실행 하나의 커버리지 범위들을 받아 거리를 낸다.
+//                  sink 를 감싼 범위 중 실행되지 않은 가장 바깥 범위의 시작 줄에서 sink 줄까지의 줄 수 + 1,
+//                  감싼 범위가 모두 실행됐으면 0 (sink 문장까지 왔다), 감싼 범위를 하나도 못 봤으면 null.
+// AFLGo 처럼 CFG/호출 그래프 거리를 만들지 않고 블록 중첩만 본다. inspector 는 부모와 실행 횟수가 같은 블록을
+// 합쳐서 보고하므로, 실행되지 않은 블록이 보이는 가장 바깥 지점이 곧 입력이 멈춘 분기다.
+
+const { tokenize } = require('./cmplog');
+
+// 같은 이름의 함수 정의나 메서드 정의는 호출 자리가 아니다
+const DEFINITION_KEYWORDS = new Set(['function', 'class']);
+
+// 줄 번호는 1 부터
+function lineStarts(source) {
+    const starts = [0];
+    for (let i = source.indexOf('\n'); i >= 0; i = source.indexOf('\n', i + 1)) starts.push(i + 1);
+    return starts;
+}
+
+function lineOf(starts, offset) {
+    let lo = 0;
+    let hi = starts.length - 1;
+    while (lo < hi) {
+        const mid = (lo + hi + 1) >>> 1;
+        if (starts[mid] <= offset) lo = mid;
+        else hi = mid - 1;
+    }
+    return lo + 1;
+}
+
+// source 에서 name( 호출 자리를 찾아 { name, offset, line, candidates } 를 돌려준다 (없으면 null)
+function locateSink(source, name, lineHint = 0) {
+    if (!source || !name) return null;
+    const tokens = tokenize(source);
+    const starts = lineStarts(source);
+    const sites = [];
+    for (let i = 0; i < tokens.length - 1; i++) {
+        const t = tokens[i];
+        if (t.type !== 'ident' || t.value !== name || tokens[i + 1].value !== '(') continue;
+        const prev = tokens[i - 1];
+        if (prev && prev.type === 'keyword' && DEFINITION_KEYWORDS.has(prev.value)) continue;
+        // 객체 리터럴/클래스의 메서드 정의 name(...) { 는 건너뛴다
+        if (prev && (prev.value === '{' || prev.value === ',' || prev.value === ';' || prev.value === '}') && isMethodDefinition(tokens, i + 1)) continue;
+        sites.push({ offset: t.start, line: lineOf(starts, t.start) });
+    }
+    if (!sites.length) return null;
+    let best = sites[0];
+    if (lineHint > 0) {
+        for (const site of sites) if (Math.abs(site.line - lineHint) < Math.abs(best.line - lineHint)) best = site;
+    }
+    return { name, offset: best.offset, line: best.line, candidates: sites.length };
+}
+
+// tokens[open] 의 '(' 와 짝인 ')' 바로 뒤가 '{' 인지
+function isMethodDefinition(tokens, open) {
+    let depth = 0;
+    for (let i = open; i < tokens.length; i++) {
+        const v = tokens[i].type === 'punct' ? tokens[i].value : '';
+        if (v === '(') depth++;
+        else if (v === ')' && --depth === 0) return Boolean(tokens[i + 1]) && tokens[i + 1].value === '{';
+    }
+    return false;
+}
+
+class SinkDistance {
+    constructor(source, target) {
+        this.target = target;
+        this.offset = target.offset;
+        this.starts = lineStarts(source);
+        this.sinkLine = lineOf(this.starts, this.offset);
+        this.seen = false;
+        this.outermost = -1;
+    }
+
+    contains(start, end) {
+        return start <= this.offset && this.offset < end;
+    }
+
+    begin() {
+        this.seen = false;
+        this.outermost = -1;
+    }
+
+    // 커버리지 범위 하나 (inspector 의 range 또는 instrument 의 블록과 그 카운터)
+    observe(start, end, count) {
+        if (start > this.offset || this.offset >= end) return;
+        this.seen = true;
+        if (!count && (this.outermost < 0 || start < this.outermost)) this.outermost = start;
+    }
+
+    finish() {
+        if (!this.seen) return null;
+        if (this.outermost < 0) return 0;
+        return this.sinkLine - lineOf(this.starts, this.outermost) + 1;
+    }
+
+    summary() {
+        return { name: this.target.name, line: this.sinkLine, offset: this.offset, candidates: this.target.candidates };
+    }
+}
+
+module.exports = { SinkDistance, locateSink };
@@ -0,0 +1,332 @@
+// coverage/core/sink_oracle.js
+//
+// sandbox_mocks 가 기록한 sink 호출을 보고 이번 실행이 sink 에 도달했는지, 익스플로잇이 성립했는지 판정한다.
+// 판정은 sink 계열별 술어로 한다 (LLM 없이 실행마다 즉시):
+//   shell   : 셸이 해석하는 명령에 입력에서 온 메타문자가 따옴표 밖에 남아 있음
+//   sql     : 입력 조각이 문자열 리터럴을 닫고 빠져나오거나, 따옴표 없는 자리에 SQL 구문을 넣음
+//   path    : 입력에서 온 `..` 세그먼트가 기준 디렉터리를 벗어나거나 절대 경로가 그대로 쓰임
+//   network : 요청 URL 의 호스트를 입력이 정함
+//   json    : 입력이 __proto__ / constructor.prototype 키를 가진 JSON 으로 파싱됨
+
+const path = require('path');
+const { tokenize } = require('./cmplog');
+
+// coverage/core/mutator.py 의 SINK_FAMILIES 와 같은 분류
+const SINK_FAMILIES = {
+    shell: ['exec', 'execsync', 'execfile', 'system', 'popen', 'runtime.exec', 'processbuilder.start',
+        'fork', 'spawn', 'spawnsync', 'execvp'],
+    sql: ['executequery', 'executeupdate', 'preparestatement', 'createstatement', 'all', 'run', 'query'],
+    path: ['writefilesync', 'writefile', 'appendfilesync', 'createwritestream', 'files.write', 'bufferedwriter.write'],
+    network: ['send', 'sendbytes', 'sendmessage', 'socket.write', 'outputstream.write',
+        'httpurlconnection.connect', 'urlconnection.getoutputstream', 'get', 'request'],
+    json: ['parse', 'objectoutputstream.writeobject', 'deserialize', 'unserialize']
+};
+
+// 기록된 호출의 모듈 -> 계열
+const MODULE_FAMILIES = {
+    child_process: 'shell',
+    fs: 'path',
+    'fs.promises': 'path',
+    http: 'network',
+    https: 'network',
+    net: 'network',
+    JSON: 'json',
+    'global.db': 'sql',
+    sqlite3: 'sql',
+    'better-sqlite3': 'sql',
+    mysql: 'sql',
+    mysql2: 'sql',
+    'mysql2/promise': 'sql',
+    pg: 'sql'
+};
+
+// 판정 대상이 아닌 호출 (스트림 열기 뒤의 write, 서버 listen 등)
+const IGNORED_CALLS = new Set(['createWriteStream.write', 'request.write', 'get.write', 'write', 'listen',
+    'createServer', 'prepare']);
+
+// sandbox_mocks 가 기록하는 호출 이름 (소문자). sink 이름이 여기 있으면 그 이름의 호출만 판정한다
+const RECORDED_CALLS = new Set(['exec', 'execfile', 'execsync', 'execfilesync', 'spawn', 'spawnsync', 'fork',
+    'writefilesync', 'appendfilesync', 'unlinksync', 'rmsync', 'rmdirsync', 'mkdirsync', 'renamesync', 'copyfilesync',
+    'chmodsync', 'chownsync', 'symlinksync', 'linksync', 'truncatesync', 'utimessync',
+    'writefile', 'appendfile', 'unlink', 'rm', 'rmdir', 'mkdir', 'rename', 'copyfile', 'chmod', 'chown', 'symlink',
+    'link', 'truncate', 'utimes', 'createwritestream', 'request', 'get', 'connect',
+    'all', 'run', 'each', 'query', 'execute', 'parse']);
+
+const SHELL_METACHARS = [';', '|', '&', '`', '$(', '\n', '>', '<'];
+const SHELL_INTERPRETED = new Set(['exec', 'execSync']);
+// 셸 없이 첫 인자를 실행 파일로 쓰는 호출
+const EXECUTABLE_CALLS = new Set(['spawn', 'spawnSync', 'execFile', 'execFileSync', 'fork']);
+// 셸 없이 실행될 때 입력이 골라도 명령 해석을 넘겨주는 실행 파일
+const INTERPRETER_EXECUTABLES = new Set(['sh', 'bash', 'dash', 'zsh', 'ksh', 'csh', 'tcsh', 'fish', 'busybox', 'env',
+    'cmd', 'cmd.exe', 'powershell', 'powershell.exe', 'pwsh', 'node', 'python', 'python3', 'perl', 'ruby', 'php']);
+
+function sinkShortName(sink) {
+    return String(sink || '').trim().toLowerCase().split('.').pop();
+}
+
+function sinkFamily(sink) {
+    if (!sink) return '';
+    const name = String(sink).trim().toLowerCase();
+    const short = sinkShortName(sink);
+    for (const [family, names] of Object.entries(SINK_FAMILIES)) {
+        if (names.includes(name) || names.includes(short)) return family;
+    }
+    return '';
+}
+
+// 하네스 함수에 넘긴 인자들에서 비교에 쓸 입력 조각(문자열)을 뽑는다
+function inputFragments(argLists) {
+    const fragments = new Set();
+    const visit = (value) => {
+        if (typeof value === 'string') {
+            if (value.length) fragments.add(value);
+        } else if (Array.isArray(value)) {
+            value.forEach(visit);
+        } else if (value !== null && value !== undefined && typeof value !== 'object') {
+            fragments.add(String(value));
+        }
+    };
+    for (const args of argLists) visit(args);
+    return Array.from(fragments);
+}
+
+// 따옴표 밖에 있는 위치만 true 인 마스크 (셸 문맥)
+function unquotedMask(command) {
+    const mask = new Uint8Array(command.length);
+    let quote = '';
+    for (let i = 0; i < command.length; i++) {
+        const ch = command[i];
+        if (quote) {
+            if (ch === quote) quote = '';
+            else if (quote === '"' && ch === '\\') i++;
+            continue;
+        }
+        if (ch === '\\') {
+            i++;
+            continue;
+        }
+        if (ch === '\'' || ch === '"') {
+            quote = ch;
+            continue;
+        }
+        mask[i] = 1;
+    }
+    return mask;
+}
+
+// 하네스 소스에서 spawn/execFile 등의 첫 인자로 쓴 문자열 리터럴(또는 리터럴로 초기화한 상수)을 모은다.
+// 호출 이름 -> 실행 파일 Set. 실행 순서와 상관없이 하네스가 고정해 둔 실행 파일만 담긴다
+function harnessExecutables(source) {
+    const fixed = new Map();
+    if (!source) return fixed;
+    const tokens = tokenize(source);
+    const constants = new Map();
+    for (let i = 0; i + 3 < tokens.length; i++) {
+        const t = tokens[i];
+        if (t.type === 'keyword' && (t.value === 'const' || t.value === 'let' || t.value === 'var') &&
+            tokens[i + 1].type === 'ident' && tokens[i + 2].value === '=' && tokens[i + 3].type === 'string') {
+            constants.set(tokens[i + 1].value, tokens[i + 3].value);
+        }
+    }
+    for (let i = 0; i + 3 < tokens.length; i++) {
+        const t = tokens[i];
+        if (t.type !== 'ident' || !EXECUTABLE_CALLS.has(t.value) || tokens[i + 1].value !== '(') continue;
+        const arg = tokens[i + 2];
+        if (tokens[i + 3].value !== ',' && tokens[i + 3].value !== ')') continue;
+        const executable = arg.type === 'string' ? arg.value : (arg.type === 'ident' ? constants.get(arg.value) : undefined);
+        if (typeof executable !== 'string' || !executable.trim()) continue;
+        if (!fixed.has(t.value)) fixed.set(t.value, new Set());
+        fixed.get(t.value).add(executable.trim());
+    }
+    return fixed;
+}
+
+// fixedExecutables: harnessExecutables 결과 (하네스 소스를 모르면 비어 있다)
+function checkShell(call, fragments, fixedExecutables) {
+    const [command, second, third] = call.args;
+    if (typeof command !== 'string') return null;
+    const options = [second, third].find(a => a && typeof a === 'object' && !Array.isArray(a)) || {};
+    if (SHELL_INTERPRETED.has(call.fn) || options.shell) {
+        const argv = Array.isArray(second) ? ' ' + second.join(' ') : '';
+        const line = command + argv;
+        const mask = unquotedMask(line);
+        for (const frag of fragments) {
+            let at = line.indexOf(frag);
+            while (at >= 0) {
+                for (const meta of SHELL_METACHARS) {
+                    let m = frag.indexOf(meta);
+                    while (m >= 0) {
+                        if (mask[at + m]) return `shell metacharacter ${JSON.stringify(meta)} reached ${call.fn} unquoted`;
+                        m = frag.indexOf(meta, m + 1);
+                    }
+                }
+                at = line.indexOf(frag, at + 1);
+            }
+        }
+        return null;
+    }
+    // 셸 없이 실행되면 입력이 실행 파일을 하네스가 정한 것과 다른 것으로 바꿀 때만 성립
+    const executable = command.trim();
+    if (!executable || !fragments.some(frag => frag.trim() === executable)) return null;
+    const fixed = fixedExecutables ? fixedExecutables.get(call.fn) : undefined;
+    if (fixed && fixed.size) {
+        return fixed.has(executable) ? null
+            : `${call.fn} executable changed from ${Array.from(fixed).join('/')} to ${command}`;
+    }
+    // 하네스가 실행 파일을 고정하지 않은 호출: 평범한 명령 이름(ls 등)은 도달일 뿐이고,
+    // 경로를 지정하거나 인터프리터로 바꿔야 익스플로잇이다
+    const base = path.basename(executable.replace(/\\/g, '/')).toLowerCase();
+    if (/[\\/]/.test(executable) || INTERPRETER_EXECUTABLES.has(base)) {
+        return `${call.fn} executable is attacker-controlled (${command})`;
+    }
+    return null;
+}
+
+// SQL 을 훑으며 각 위치가 문자열 리터럴 안인지(여는 따옴표 문자 코드, 밖이면 0)와 리터럴을 닫는 위치를 기록한다
+function sqlQuoteState(sql) {
+    const state = new Uint16Array(sql.length + 1);
+    const closes = new Uint8Array(sql.length);
+    let quote = 0;
+    for (let i = 0; i < sql.length; i++) {
+        state[i] = quote;
+        const code = sql.charCodeAt(i);
+        if (quote) {
+            if (code === 92) {
+                state[i + 1] = quote;
+                i++;
+            } else if (code === quote) {
+                quote = 0;
+                closes[i] = 1;
+            }
+        } else if (code === 39 || code === 34 || code === 96) {
+            quote = code;
+        }
+    }
+    state[sql.length] = quote;
+    return { state, closes };
+}
+
+function checkSql(call, fragments) {
+    const sql = call.args[0];
+    if (typeof sql !== 'string') return null;
+    const { state, closes } = sqlQuoteState(sql);
+    for (const frag of fragments) {
+        let at = sql.indexOf(frag);
+        while (at >= 0) {
+            const startQuote = state[at];
+            if (startQuote) {
+                // 리터럴 안에서 시작했는데 조각 안에서 리터럴이 닫히면 탈출 ('' 처럼 두 번 쓴 따옴표는 제외)
+                for (let i = at; i < at + frag.length; i++) {
+                    if (closes[i] && sql.charCodeAt(i + 1) !== startQuote) {
+                        return `input closes the ${String.fromCharCode(startQuote)}-quoted literal in ${call.module}.${call.fn}`;
+                    }
+                }
+            } else if (/[\s;'"`()]|--|\/\*|#/.test(frag)) {
+                // 따옴표 없는 자리(숫자 등)에 공백/구분자가 들어가면 구문을 바꿀 수 있다
+                return `input adds SQL syntax in an unquoted position of ${call.module}.${call.fn}`;
+            }
+            at = sql.indexOf(frag, at + 1);
+        }
+    }
+    return null;
+}
+
+function checkPath(call, fragments) {
+    const target = call.args[0];
+    if (typeof target !== 'string') return null;
+    for (const frag of fragments) {
+        // path.join 등으로 정규화된 뒤에도 기준 디렉터리 밖을 가리키는 `..` 가 남아 있어야 탈출이다
+        if (/(^|[\\/])\.\.([\\/]|$)/.test(frag)) {
+            const normalized = path.normalize(frag);
+            const tail = normalized.replace(/^(\.\.[\\/])+/, '');
+            if (normalized.startsWith('..') && tail && target.endsWith(tail)) {
+                return `path traversal reached ${call.fn} (${target})`;
+            }
+        }
+        if (path.isAbsolute(frag) && target.startsWith(frag)) return `absolute path reached ${call.fn} (${target})`;
+    }
+    return null;
+}
+
+function checkNetwork(call, fragments) {
+    const target = call.args[0];
+    let host = '';
+    if (typeof target === 'string') {
+        try {
+            host = new URL(target).hostname;
+        } catch (e) {
+            return null;
+        }
+    } else if (target && typeof target === 'object') {
+        host = target.hostname || target.host || '';
+    }
+    if (!host) return null;
+    if (fragments.some(frag => frag.includes(host))) return `request host ${host} is attacker-controlled (${call.module}.${call.fn})`;
+    return null;
+}
+
+const PROTO_KEY_RE = /"__proto__"\s*:|"constructor"\s*:\s*\{[^]*"prototype"\s*:/;
+
+function checkJson(call, fragments) {
+    const text = call.args[0];
+    if (typeof text !== 'string' || !fragments.some(frag => text.includes(frag))) return null;
+    if (!PROTO_KEY_RE.test(text)) return null;
+    // 파싱에 실패한 입력은 객체를 만들지 못하므로 익스플로잇이 아니다
+    try {
+        JSON.parse(text);
+    } catch (e) {
+        return null;
+    }
+    return 'prototype-polluting keys reached JSON.parse';
+}
+
+const PREDICATES = { shell: checkShell, sql: checkSql, path: checkPath, network: checkNetwork, json: checkJson };
+
+class SinkOracle {
+    constructor(sink = '') {
+        this.sink = sink || '';
+        // sink 이름을 모르면 모든 계열을 판정한다
+        this.family = sinkFamily(this.sink);
+        // mocks 가 기록하는 이름이면 그 호출만 본다 (exec sink 에 spawn 호출을 들이대지 않도록). 아니면 계열로 판정
+        const short = sinkShortName(this.sink);
+        this.callName = this.family && RECORDED_CALLS.has(short) ? short : '';
+        // 하네스가 고정해 둔 실행 파일 (learnHarness 전에는 비어 있다)
+        this.fixedExecutables = new Map();
+    }
+
+    // 하네스 소스를 읽어 판정에 쓸 정적 정보를 정한다 (실행 순서에 따라 판정이 달라지지 않도록)
+    learnHarness(source) {
+        this.fixedExecutables = harnessExecutables(source);
+    }
+
+    // calls: CallRecorder.drain() 결과, argLists: 하네스 함수별 인자 배열
+    evaluate(calls, argLists) {
+        const verdict = { sink: this.sink, family: this.family, reached: false, exploited: false, reason: '', call: null };
+        if (!calls || !calls.length) return verdict;
+        const fragments = inputFragments(argLists);
+        for (const call of calls) {
+            if (IGNORED_CALLS.has(call.fn)) continue;
+            const family = MODULE_FAMILIES[call.module];
+            if (!family || (this.family && family !== this.family)) continue;
+            if (this.callName && call.fn.toLowerCase() !== this.callName) continue;
+            if (!verdict.reached) {
+                verdict.reached = true;
+                verdict.call = call;
+                if (!this.family) verdict.family = family;
+            }
+            const reason = PREDICATES[family](call, fragments, this.fixedExecutables);
+            if (reason) {
+                verdict.exploited = true;
+                verdict.reason = reason;
+                verdict.call = call;
+                verdict.family = family;
+                return verdict;
+            }
+        }
+        if (verdict.reached) verdict.reason = `${verdict.call.module}.${verdict.call.fn} reached without an exploit pattern`;
+        return verdict;
+    }
+}
+
+module.exports = { SinkOracle, sinkFamily };
+
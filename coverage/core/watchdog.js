@@ -0,0 +1,115 @@
+// coverage/core/watchdog.js
+//
+// 실행 단위 데드라인 감시.
+//   ExecHeartbeat : 워커가 실행을 시작할 때 입력과 시작 시각을 SharedArrayBuffer 에 적고 끝나면 지운다.
+//                   동기 무한 루프나 catastrophic regex 로 워커 이벤트 루프가 멈춰도 감시자(메인 스레드)는
+//                   버퍼만 읽어 멈춘 실행과 그 입력을 알 수 있다. 완료한 실행 횟수도 여기에 세므로
+//                   워커가 강제 종료돼도 실행 횟수는 정확하다.
+//   withDeadline  : Promise 를 돌려주는 함수에 데드라인을 건다 (타이머는 끝나면 반드시 정리한다).
+//                   넘기면 ExecTimeoutError 로 거부되며, 크래시가 아니라 hang 으로 처리한다.
+//   FindingCorpus : 크래시가 아닌 발견(kind)의 입력을 크래시와 따로 <corpusDir>/<kind>s/<kind>_<sha1 12자리>.txt 로 저장한다.
+//                   데드라인을 넘긴 입력은 'hang', resource_oracle.js 가 찾은 느린/메모리를 많이 쓰는 입력은 'resource' 다.
+//                   같은 입력은 프로세스/스레드가 달라도 파일 하나 (O_EXCL 생성)이며 매니페스트에는 kind 로 남긴다.
+// 레이아웃: Int32 [state, length, execs, truncated] | Float64 시작 시각(ms) | 입력 바이트(utf-8)
+
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+
+const HEADER_BYTES = 24;
+const DEFAULT_INPUT_BYTES = 64 * 1024;
+const STATE = 0;
+const LENGTH = 1;
+const EXECS = 2;
+const TRUNCATED = 3;
+
+class ExecTimeoutError extends Error {
+    constructor(timeoutMs) {
+        super(`function timeout after ${timeoutMs}ms`);
+        this.name = 'ExecTimeoutError';
+        this.timeoutMs = timeoutMs;
+    }
+}
+
+function withDeadline(promise, timeoutMs) {
+    let timer = null;
+    const deadline = new Promise((_, reject) => {
+        timer = setTimeout(() => reject(new ExecTimeoutError(timeoutMs)), timeoutMs);
+    });
+    return Promise.race([promise, deadline]).finally(() => clearTimeout(timer));
+}
+
+class ExecHeartbeat {
+    static create(inputBytes = DEFAULT_INPUT_BYTES) {
+        return new ExecHeartbeat(new SharedArrayBuffer(HEADER_BYTES + inputBytes));
+    }
+
+    constructor(buffer) {
+        this.buffer = buffer;
+        this.header = new Int32Array(buffer, 0, 4);
+        this.started = new Float64Array(buffer, 16, 1);
+        this.bytes = new Uint8Array(buffer, HEADER_BYTES);
+        this.encoder = new TextEncoder();
+    }
+
+    // 워커: 실행 시작 (입력이 버퍼보다 길면 앞부분만 남기고 truncated 를 세운다)
+    begin(input) {
+        const { read, written } = this.encoder.encodeInto(String(input), this.bytes);
+        this.header[LENGTH] = written;
+        this.header[TRUNCATED] = read < String(input).length ? 1 : 0;
+        this.started[0] = Date.now();
+        Atomics.store(this.header, STATE, 1);
+    }
+
+    // 워커: 실행 끝. counted 면 반복 횟수에 들어가는 실행이다 (replay/trim 은 세지 않는다)
+    end(counted = true) {
+        Atomics.store(this.header, STATE, 0);
+        if (counted) Atomics.add(this.header, EXECS, 1);
+    }
+
+    get execs() {
+        return Atomics.load(this.header, EXECS);
+    }
+
+    // 감시자: timeoutMs 를 넘겨 아직 끝나지 않은 실행이 있으면 { input, elapsedMs, truncated }
+    stalled(timeoutMs, now = Date.now()) {
+        if (Atomics.load(this.header, STATE) !== 1) return null;
+        const elapsedMs = now - this.started[0];
+        if (elapsedMs < timeoutMs) return null;
+        const input = Buffer.from(this.bytes.buffer, HEADER_BYTES, this.header[LENGTH]).toString('utf-8');
+        return { input, elapsedMs, truncated: this.header[TRUNCATED] === 1 };
+    }
+}
+
+class FindingCorpus {
+    constructor(corpusDir, manifest = null, kind = 'hang') {
+        this.kind = kind;
+        this.dir = path.join(corpusDir, `${kind}s`);
+        this.manifest = manifest;
+        this.records = [];
+        this.count = 0;
+    }
+
+    // extra: hang 이면 { func, timeoutMs, elapsedMs, cause: 'sync' | 'async' },
+    //        resource 면 { cause: 'slow' | 'memory', value, baseline, ratio }
+    record(input, extra = {}) {
+        this.count++;
+        input = String(input);
+        const key = crypto.createHash('sha1').update(input).digest('hex').slice(0, 12);
+        const file = path.join(this.dir, `${this.kind}_${key}.txt`);
+        let isNew = false;
+        try {
+            if (!fs.existsSync(this.dir)) fs.mkdirSync(this.dir, { recursive: true });
+            fs.writeFileSync(file, input, { encoding: 'utf-8', flag: 'wx' });
+            isNew = true;
+        } catch (e) {}
+        const record = Object.assign({ file, key, input }, extra);
+        if (isNew) {
+            this.records.push(record);
+            if (this.manifest) this.manifest.append(this.kind, file, Object.assign({ key }, extra));
+        }
+        return { record, isNew };
+    }
+}
+
+module.exports = { ExecHeartbeat, FindingCorpus, ExecTimeoutError, withDeadline };
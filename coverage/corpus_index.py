@@ -0,0 +1,157 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from coverage.corpus_pack import read_ref
+
+# coverage/core/corpus_manifest.js 가 append 하는 매니페스트
+MANIFEST_NAME = "manifest.jsonl"
+DEFAULT_CORPUS_DIR = os.path.join(os.path.dirname(__file__), "corpus")
+
+KINDS = ("seed", "new-path", "crash", "hang", "resource")
+HANGS_DIR = "hangs"
+DEFAULT_RUN_ID = "default"
+
+
+def _safe_name(name: str) -> str:
+    # coverage/core/corpus_manifest.js 의 safeName 과 같은 규칙
+    return re.sub(r"^\.+", "_", re.sub(r"[^A-Za-z0-9._-]", "_", str(name)))
+
+
+def corpus_namespace(corpus_root: Optional[str], harness: str, run_id: Optional[str] = None) -> str:
+    """하네스와 실행 ID 별 코퍼스 디렉터리 (<corpus_root>/<하네스 이름>/<run_id>). 퍼저와 같은 경로를 만든다."""
+    stem = os.path.splitext(os.path.basename(harness))[0]
+    root = os.path.abspath(corpus_root or os.getenv("CORPUS_DIR") or DEFAULT_CORPUS_DIR)
+    return os.path.join(root, _safe_name(stem), _safe_name(run_id or DEFAULT_RUN_ID))
+
+
+def prune_runs(corpus_root: Optional[str], harness: str, keep: int, current: Optional[str] = None) -> List[str]:
+    """하네스의 실행 ID 네임스페이스 중 최근 keep 개만 남기고 지운다 (지운 디렉터리 목록을 반환).
+
+    current 실행과 기본 네임스페이스(DEFAULT_RUN_ID, 수동 fuzzer_runner 실행)는 지우지 않는다.
+    최근 여부는 매니페스트(없으면 디렉터리)의 수정 시각으로 정한다.
+    """
+    harness_dir = os.path.dirname(corpus_namespace(corpus_root, harness))
+    protected = {DEFAULT_RUN_ID, _safe_name(current)} if current else {DEFAULT_RUN_ID}
+    runs = []
+    try:
+        names = os.listdir(harness_dir)
+    except FileNotFoundError:
+        return []
+    for name in names:
+        run_dir = os.path.join(harness_dir, name)
+        if name in protected or not os.path.isdir(run_dir):
+            continue
+        manifest = os.path.join(run_dir, MANIFEST_NAME)
+        try:
+            mtime = os.path.getmtime(manifest if os.path.exists(manifest) else run_dir)
+        except OSError:
+            continue
+        runs.append((mtime, run_dir))
+    runs.sort(reverse=True)
+    # current 도 남기는 keep 개에 들어간다
+    keep_others = max(0, keep - 1) if current else max(0, keep)
+    removed = []
+    for _, run_dir in runs[keep_others:]:
+        shutil.rmtree(run_dir, ignore_errors=True)
+        removed.append(run_dir)
+    return removed
+
+
+def record_hang(corpus_dir: str, harness: str, payload: str, timeout_ms: Optional[float] = None,
+                cause: str = "sync") -> Tuple[str, bool]:
+    """데드라인을 넘긴 입력을 coverage/core/watchdog.js 의 FindingCorpus('hang') 와 같은 형식으로 남긴다.
+
+    <corpus_dir>/hangs/hang_<sha1 12자리>.txt 를 한 번만 만들고(같은 입력이면 (경로, False)), 매니페스트에 'hang' 으로 남긴다.
+    """
+    data = payload.encode("utf-8")
+    key = hashlib.sha1(data).hexdigest()[:12]
+    hang_dir = os.path.join(corpus_dir, HANGS_DIR)
+    os.makedirs(hang_dir, exist_ok=True)
+    path = os.path.join(hang_dir, f"hang_{key}.txt")
+    try:
+        with open(path, "xb") as f:
+            f.write(data)
+    except FileExistsError:
+        return path, False
+    ts = int(time.time() * 1000)
+    entry = {"id": f"{ts:x}-py{os.getpid():x}-{key}", "harness": os.path.basename(harness), "kind": "hang",
+             "file": os.path.relpath(path, corpus_dir), "signature": None, "ts": ts, "key": key, "cause": cause}
+    if timeout_ms is not None:
+        entry["timeoutMs"] = timeout_ms
+    with open(os.path.join(corpus_dir, MANIFEST_NAME), "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+    return path, True
+
+
+class Checkpoint(NamedTuple):
+    """매니페스트 위치. 파일이 새로 만들어지면 inode 가 바뀌므로 처음부터 다시 읽는다."""
+    inode: int
+    offset: int
+
+
+class CorpusIndex:
+    """코퍼스 디렉터리를 훑는 대신 manifest.jsonl 을 읽는 인덱스.
+
+    - checkpoint() 로 현재 위치를 잡아 두고 entries_since() 로 그 이후 항목만 읽는다 (새 항목 수에 비례)
+    - 오래된 실행의 코퍼스는 prune_runs() 가 네임스페이스 디렉터리째 지운다
+    """
+
+    def __init__(self, corpus_dir: Optional[str] = None):
+        self.corpus_dir = os.path.abspath(corpus_dir or os.getenv("CORPUS_DIR") or DEFAULT_CORPUS_DIR)
+        self.path = os.path.join(self.corpus_dir, MANIFEST_NAME)
+
+    def checkpoint(self) -> Checkpoint:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return Checkpoint(0, 0)
+        return Checkpoint(st.st_ino, st.st_size)
+
+    def entries_since(self, checkpoint: Optional[Checkpoint] = None, harness: Optional[str] = None,
+                      kinds: Optional[Iterable[str]] = None) -> Tuple[List[Dict], Checkpoint]:
+        """checkpoint 이후에 추가된 항목과 새 checkpoint 를 반환한다. 쓰는 중인 마지막 줄은 다음에 읽는다."""
+        kinds = set(kinds) if kinds else None
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return [], Checkpoint(0, 0)
+        with f:
+            inode = os.fstat(f.fileno()).st_ino
+            offset = 0
+            if checkpoint and checkpoint.inode == inode:
+                offset = checkpoint.offset
+            f.seek(offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        entries = []
+        for line in data[:end].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            if harness and entry.get("harness") != os.path.basename(harness):
+                continue
+            if kinds and entry.get("kind") not in kinds:
+                continue
+            entry["path"] = self.resolve(entry.get("file"))
+            entries.append(entry)
+        return entries, Checkpoint(inode, offset + end)
+
+    def entries(self, harness: Optional[str] = None, kinds: Optional[Iterable[str]] = None) -> List[Dict]:
+        return self.entries_since(None, harness=harness, kinds=kinds)[0]
+
+    def resolve(self, file: Optional[str]) -> Optional[str]:
+        if not file:
+            return None
+        return file if os.path.isabs(file) else os.path.join(self.corpus_dir, file)
+
+    def read(self, entry: Dict) -> bytes:
+        """항목의 내용을 읽는다. packed 항목("<name>.pack#<번호>")은 mmap 으로 읽는다."""
+        return read_ref(entry.get("path") or self.resolve(entry.get("file")))
@@ -0,0 +1,224 @@
+import argparse
+import glob
+import json
+import mmap
+import os
+import struct
+import time
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+# coverage/core/corpus_pack.js 와 같은 형식
+#   <name>.pack : 입력 바이트를 이어 붙인 데이터 파일
+#   <name>.idx  : 항목마다 24바이트 레코드 (offset u64, length u32, kind u8, 예약 3바이트, signature u32, ts u32)
+INDEX_RECORD = struct.Struct("<QIB3xII")
+KIND_NAMES = {0: "seed", 1: "new-path", 2: "crash"}
+KIND_CODES = {name: code for code, name in KIND_NAMES.items()}
+
+
+class PackEntry(NamedTuple):
+    index: int
+    offset: int
+    length: int
+    kind: str
+    signature: str
+    ts: int
+
+
+class PackReader:
+    """packed 코퍼스 하나를 mmap 으로 연다. 쓰는 중인 pack 이면 데이터까지 다 쓰인 항목만 보인다."""
+
+    def __init__(self, pack_path: str):
+        self.pack_path = pack_path
+        self.index_path = os.path.splitext(pack_path)[0] + ".idx"
+        self._data = self._map(pack_path)
+        self._index = self._map(self.index_path)
+        data_size = len(self._data) if self._data is not None else 0
+        count = (len(self._index) if self._index is not None else 0) // INDEX_RECORD.size
+        # 인덱스는 데이터 뒤에 쓰이지만, 잘린 파일을 만나도 데이터 밖을 가리키는 레코드는 버린다
+        while count and sum(self._record(count - 1)[:2]) > data_size:
+            count -= 1
+        self.count = count
+
+    @staticmethod
+    def _map(path: str) -> Optional[mmap.mmap]:
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+
+    def _record(self, i: int) -> Tuple[int, int, int, int, int]:
+        return INDEX_RECORD.unpack_from(self._index, i * INDEX_RECORD.size)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def entry(self, i: int) -> PackEntry:
+        if not 0 <= i < self.count:
+            raise IndexError(f"pack entry {i} out of range ({self.pack_path}, {self.count} entries)")
+        offset, length, kind, signature, ts = self._record(i)
+        return PackEntry(i, offset, length, KIND_NAMES.get(kind, "seed"), f"{signature:08x}" if signature else "", ts)
+
+    def read(self, i: int) -> bytes:
+        entry = self.entry(i)
+        return self._data[entry.offset:entry.offset + entry.length]
+
+    def __iter__(self) -> Iterator[Tuple[PackEntry, bytes]]:
+        for i in range(self.count):
+            yield self.entry(i), self.read(i)
+
+    def close(self):
+        for m in (self._data, self._index):
+            if m is not None:
+                m.close()
+        self._data = self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PackWriter:
+    """import 용 동기 writer. 파일 이름 규칙은 JS 쪽과 같다 (writer 마다 새 파일 쌍)."""
+
+    def __init__(self, corpus_dir: str):
+        os.makedirs(corpus_dir, exist_ok=True)
+        self.name = f"corpus-{int(time.time() * 1000):x}-{os.getpid():x}.import"
+        self.pack_path = os.path.join(corpus_dir, f"{self.name}.pack")
+        self.index_path = os.path.join(corpus_dir, f"{self.name}.idx")
+        self.count = 0
+        self._offset = 0
+        self._data = open(self.pack_path, "ab")
+        self._index = open(self.index_path, "ab")
+
+    def append(self, kind: str, data: bytes, signature: str = "", ts: Optional[int] = None) -> str:
+        self._data.write(data)
+        self._index.write(INDEX_RECORD.pack(self._offset, len(data), KIND_CODES.get(kind, 0),
+                                            int(signature, 16) if signature else 0, int(ts or time.time())))
+        self._offset += len(data)
+        self.count += 1
+        return f"{self.pack_path}#{self.count - 1}"
+
+    def close(self):
+        # 데이터를 먼저 내보내야 인덱스가 쓰이지 않은 바이트를 가리키지 않는다
+        self._data.close()
+        self._index.close()
+
+
+def pack_files(corpus_dir: str):
+    return sorted(glob.glob(os.path.join(corpus_dir, "*.pack")))
+
+
+def read_ref(ref: str) -> bytes:
+    """"<경로>.pack#<번호>" 또는 일반 파일 경로가 가리키는 내용을 읽는다."""
+    if "#" in os.path.basename(ref):
+        pack_path, _, index = ref.rpartition("#")
+        with PackReader(pack_path) as reader:
+            return reader.read(int(index))
+    with open(ref, "rb") as f:
+        return f.read()
+
+
+def iter_corpus(corpus_dir: str) -> Iterator[Tuple[str, str, bytes]]:
+    """(kind, 위치, 내용) 을 packed 항목과 기존 파일(input_*.txt, crash_*.json) 모두에서 돌려준다."""
+    for pack_path in pack_files(corpus_dir):
+        with PackReader(pack_path) as reader:
+            for entry, data in reader:
+                yield entry.kind, f"{pack_path}#{entry.index}", bytes(data)
+    for pattern, kind in (("input_*.txt", "new-path"), ("crash_*.json", "crash")):
+        for path in sorted(glob.glob(os.path.join(corpus_dir, pattern))):
+            with open(path, "rb") as f:
+                yield kind, path, f.read()
+
+
+def export_corpus(corpus_dir: str, out_dir: str) -> int:
+    """packed 항목을 파일 하나당 입력 하나인 기존 형식으로 풀어 쓴다."""
+    os.makedirs(out_dir, exist_ok=True)
+    count = 0
+    for pack_path in pack_files(corpus_dir):
+        name = os.path.splitext(os.path.basename(pack_path))[0]
+        with PackReader(pack_path) as reader:
+            for entry, data in reader:
+                if entry.kind == "crash":
+                    # 기존 crash_*.json 처럼 들여쓰기한 JSON 으로 되돌린다
+                    try:
+                        record = json.loads(bytes(data).decode("utf-8"))
+                        func = (record.get("crashInfo") or {}).get("func", "unknown")
+                        content = json.dumps(record, indent=2, ensure_ascii=False).encode("utf-8")
+                    except (UnicodeDecodeError, ValueError, AttributeError):
+                        func, content = "unknown", bytes(data)
+                    fname = f"crash_{entry.ts * 1000}_{name}_{entry.index}_{func}.json"
+                else:
+                    fname, content = f"input_{entry.ts * 1000}_{name}_{entry.index}.txt", bytes(data)
+                with open(os.path.join(out_dir, fname), "wb") as f:
+                    f.write(content)
+                count += 1
+    return count
+
+
+def import_corpus(src_dir: str, corpus_dir: str, harness: str = "") -> int:
+    """기존 형식(input_*.txt, crash_*.json)의 파일들을 새 pack 하나로 모으고 매니페스트에 남긴다."""
+    from coverage.corpus_index import MANIFEST_NAME
+
+    writer = PackWriter(corpus_dir)
+    lines = []
+    try:
+        for kind, path, data in iter_corpus(src_dir):
+            if path.partition("#")[1]:
+                continue
+            if kind == "crash":
+                # pack 안의 크래시는 JS 가 쓰는 것처럼 한 줄 JSON 으로 저장한다
+                try:
+                    record = json.loads(data.decode("utf-8"))
+                    data = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                except (UnicodeDecodeError, ValueError):
+                    pass
+            ts = int(os.path.getmtime(path))
+            ref = writer.append(kind, data, ts=ts)
+            lines.append({"id": f"{writer.name}-{writer.count - 1:x}", "harness": harness, "kind": kind,
+                          "file": os.path.relpath(ref, corpus_dir), "signature": None, "ts": ts * 1000,
+                          "imported_from": os.path.basename(path)})
+    finally:
+        writer.close()
+    with open(os.path.join(corpus_dir, MANIFEST_NAME), "a", encoding="utf-8") as f:
+        for line in lines:
+            f.write(json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n")
+    return writer.count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="packed 코퍼스(.pack + .idx) 변환 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_export = sub.add_parser("export", help="packed 코퍼스를 input_*.txt / crash_*.json 파일로 풀어 쓴다")
+    p_export.add_argument("corpus_dir")
+    p_export.add_argument("out_dir")
+    p_import = sub.add_parser("import", help="input_*.txt / crash_*.json 파일들을 pack 하나로 모은다")
+    p_import.add_argument("src_dir")
+    p_import.add_argument("corpus_dir")
+    p_import.add_argument("--harness", default="", help="매니페스트에 남길 하네스 파일 이름 (예: P_x.js)")
+    p_list = sub.add_parser("ls", help="코퍼스 디렉터리의 pack 별 항목 수를 출력한다")
+    p_list.add_argument("corpus_dir")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        count = export_corpus(args.corpus_dir, args.out_dir)
+        print(f"[INFO] - {count}개 항목을 {args.out_dir} 에 파일로 내보냈습니다.")
+    elif args.command == "import":
+        count = import_corpus(args.src_dir, args.corpus_dir, harness=args.harness)
+        print(f"[INFO] - {count}개 파일을 {args.corpus_dir} 의 pack 으로 가져왔습니다.")
+    else:
+        for pack_path in pack_files(args.corpus_dir):
+            with PackReader(pack_path) as reader:
+                kinds = {}
+                for i in range(len(reader)):
+                    kind = reader.entry(i).kind
+                    kinds[kind] = kinds.get(kind, 0) + 1
+            print(f"  {os.path.basename(pack_path):<48} {len(reader):>8} {kinds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,286 @@
 import os
+import json
 import subprocess
 import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 from coverage.coverage_module import CovChecker
+from coverage.corpus_index import corpus_namespace
+from coverage.json_result import parse_json_result
+from coverage.stats_tail import STATS_NAME
 
 load_dotenv()
 
 TARGET_DIR = os.getenv("TARGET_DIR")
 FUZZER_JS = os.path.join(os.path.dirname(__file__), "core", "fuzzer_interface.js")
 MUTATOR_PY = os.path.join(os.path.dirname(__file__), "core", "mutator.py")
+REPORT_DIR = os.getenv("REPORT_DIR", "report")
+# 코퍼스 루트. 하네스는 그 아래 <하네스 이름>/<run id>/ 에 입력과 크래시를 쓴다
+CORPUS_ROOT = os.getenv("CORPUS_DIR")
 
-def run_batch_fuzzing(js_files, max_iterations=1000):
-    for js_file in js_files:
-        print(f"Batch fuzzing {js_file}")
+def find_seed_file(js_file):
+    base_name = os.path.splitext(os.path.basename(js_file))[0]
+    specific_seed = os.path.join(os.path.dirname(js_file), f"seed_{base_name}.txt")
+    default_seed = os.path.join(os.path.dirname(js_file), "seed.txt")
+    if os.path.exists(specific_seed):
+        return specific_seed
+    if os.path.exists(default_seed):
+        return default_seed
+    return None
 
-        seed_file = None
-        base_name = os.path.splitext(os.path.basename(js_file))[0]
-        specific_seed = os.path.join(os.path.dirname(js_file), f"seed_{base_name}.txt")
-        default_seed = os.path.join(os.path.dirname(js_file), "seed.txt")
-        if os.path.exists(specific_seed):
-            seed_file = specific_seed
-        elif os.path.exists(default_seed):
-            seed_file = default_seed
+def _load_reports(report_path=None):
+    report_path = report_path or os.path.join(REPORT_DIR, "report.json")
+    try:
+        with open(report_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return []
+    if isinstance(data, list) and data:
+        data = data[0]
+    reports = data.get("reports", []) if isinstance(data, dict) else []
+    return [r for r in reports if isinstance(r, dict)]
 
-        args = ["node", FUZZER_JS, js_file, MUTATOR_PY, "--batch", str(max_iterations)]
-        if seed_file:
-            args.append(seed_file)
+def load_report_sinks(report_path=None):
+    """report.json 에서 sink id -> sink 이름 매핑을 만든다."""
+    sinks = {}
+    for report in _load_reports(report_path):
+        sink = report.get("sink", {})
+        if sink.get("id") is not None and sink.get("name"):
+            sinks[str(sink["id"])] = sink["name"]
+    return sinks
+
+def load_report_sink_lines(report_path=None):
+    """report.json 에서 sink id -> sink.line 매핑을 만든다 (하네스에 sink 호출이 여럿일 때 가까운 자리를 고른다)."""
+    lines = {}
+    for report in _load_reports(report_path):
+        sink = report.get("sink", {})
+        if sink.get("id") is not None and isinstance(sink.get("line"), int):
+            lines[str(sink["id"])] = sink["line"]
+    return lines
+
+def load_report_entries(report_path=None):
+    """report.json 에서 sink id -> 진입 함수 이름 매핑을 만든다 (orchestrator 의 function_name 과 같은 규칙)."""
+    entries = {}
+    for report in _load_reports(report_path):
+        sink = report.get("sink", {})
+        flows = report.get("flows", [])
+        if sink.get("id") is None or not flows or not flows[0]:
+            continue
+        # orchestrator 처럼 sink 직전 단계를 쓰되, ":program" 같은 가상 함수면 마지막 단계로 내려간다
+        steps = [flows[0][-2], flows[0][-1]] if len(flows[0]) > 1 else [flows[0][-1]]
+        for step in steps:
+            function_name = step.get("function", "") if isinstance(step, dict) else ""
+            if function_name and not function_name.startswith(":"):
+                entries[str(sink["id"])] = function_name
+                break
+    return entries
+
+def _harness_sink_id(js_file):
+    base_name = os.path.splitext(os.path.basename(js_file))[0]
+    return base_name.rsplit("_", 1)[-1]
+
+def sink_for_harness(js_file, report_sinks):
+    """의사 하네스 파일명(P_<원본>_<sink_id>.js)의 sink id 로 sink 이름을 찾는다."""
+    return report_sinks.get(_harness_sink_id(js_file), "")
+
+def entry_for_harness(js_file, report_entries):
+    """의사 하네스 파일명의 sink id 로 진입 함수 이름을 찾는다."""
+    return report_entries.get(_harness_sink_id(js_file), "")
+
+def sink_line_for_harness(js_file, report_sink_lines):
+    """의사 하네스 파일명의 sink id 로 리포트의 sink.line 을 찾는다 (없으면 0)."""
+    return report_sink_lines.get(_harness_sink_id(js_file), 0)
+
+def _corpus_args(corpus_root=None, run_id=None, corpus_format=None):
+    corpus_root = corpus_root or CORPUS_ROOT
+    args = ["--corpus-root", os.path.abspath(corpus_root)] if corpus_root else []
+    if run_id:
+        args.extend(["--run-id", run_id])
+    if corpus_format:
+        args.extend(["--corpus-format", corpus_format])
+    return args
+
+def fuzz_harness(js_file, max_iterations=1000, sink=None, time_budget=None, workers=1, coverage_mode=None,
+                 coverage_backend=None, entry=None, mocks=True, corpus_root=None, run_id=None, corpus_format=None,
+                 trim_seeds=False, cmin_threshold=None, schedule=None, exec_timeout=None, objective=None,
+                 stats_file=None, cmplog=True, sink_line=0):
+    """하네스 하나를 헤드리스로 퍼징하고 구조화된 결과를 반환한다."""
+    seed_file = find_seed_file(js_file)
+    args = ["node", FUZZER_JS, js_file, MUTATOR_PY, "--batch", str(max_iterations), "--json"]
+    if sink:
+        args.extend(["--sink", sink])
+    if sink_line:
+        args.extend(["--sink-line", str(sink_line)])
+    if entry:
+        args.extend(["--entry", entry])
+    if time_budget:
+        args.extend(["--time-budget", str(time_budget)])
+    if workers and workers > 1:
+        args.extend(["--workers", str(workers)])
+    if coverage_mode:
+        args.extend(["--coverage-mode", coverage_mode])
+    if coverage_backend:
+        args.extend(["--coverage-backend", coverage_backend])
+    if not mocks:
+        args.append("--no-mocks")
+    args.extend(_corpus_args(corpus_root, run_id, corpus_format))
+    if trim_seeds:
+        args.append("--trim-seeds")
+    if cmin_threshold is not None:
+        args.extend(["--cmin-threshold", str(cmin_threshold)])
+    if schedule:
+        args.extend(["--schedule", schedule])
+    if exec_timeout:
+        args.extend(["--exec-timeout", str(exec_timeout)])
+    if objective:
+        args.extend(["--objective", objective])
+    if stats_file:
+        args.extend(["--stats-file", stats_file])
+    if not cmplog:
+        args.append("--no-cmplog")
+    if seed_file:
+        args.append(seed_file)
 
-        subprocess.run(args)
+    # 예산이 있으면 node 가 스스로 멈추지 못한 경우를 대비해 여유를 두고 강제 종료
+    hard_timeout = time_budget + 30 if time_budget else None
+    started = time.time()
+    result = {"file": js_file, "sink": sink or "", "entry": entry or "", "status": "ok", "returncode": None, "elapsed": 0.0, "stats": {},
+              "corpus_dir": corpus_namespace(corpus_root or CORPUS_ROOT, js_file, run_id)}
+    if stats_file:
+        result["stats_file"] = stats_file
+    try:
+        proc = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=hard_timeout)
+        result["returncode"] = proc.returncode
+        message = parse_json_result(proc.stdout)
+        if message:
+            result["stats"] = message.get("stats", {})
+            result["new_corpus"] = message.get("newCorpus", [])
+            result["crashes"] = message.get("crashes", [])
+            # 스택 서명으로 묶은 크래시 버킷 (대표 입력, 히트 수). stats.uniqueCrashes 는 버킷 수다
+            result["crash_buckets"] = message.get("crashBuckets", [])
+            result["async_errors"] = message.get("asyncErrors", 0)
+            result["elapsed_ms"] = message.get("elapsedMs")
+            # 하네스에서 찾은 sink 호출 자리 (time-to-sink 와 sink 거리의 기준, 못 찾았으면 None)
+            result["sink_target"] = message.get("sinkTarget")
+            # 재시작 제한 등으로 반복을 다 돌지 못하고 멈춘 실행은 ok 로 치지 않는다
+            if message.get("stoppedReason"):
+                result["status"] = "stopped"
+                result["error"] = f"stopped early: {message['stoppedReason']}"
+        else:
+            result["status"] = "error"
+            result["error"] = (proc.stderr or proc.stdout or "no result").strip()[-500:]
+    except subprocess.TimeoutExpired:
+        result["status"] = "timeout"
+    except OSError as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+    result["elapsed"] = time.time() - started
+    return result
 
-def run_interactive_fuzzing(js_files):
-    if len(js_files) > 1:
+def _run_tool(js_file, tool_args, sink=None, entry=None, coverage_backend=None, mocks=True, corpus_root=None, run_id=None,
+              timeout=None):
+    """fuzzer_interface.js 의 cmin/tmin 을 실행하고 결과 메시지를 반환한다."""
+    args = ["node", FUZZER_JS, js_file, MUTATOR_PY, *tool_args, "--json"]
+    if sink:
+        args.extend(["--sink", sink])
+    if entry:
+        args.extend(["--entry", entry])
+    if coverage_backend:
+        args.extend(["--coverage-backend", coverage_backend])
+    if not mocks:
+        args.append("--no-mocks")
+    args.extend(_corpus_args(corpus_root, run_id))
+    seed_file = find_seed_file(js_file)
+    if seed_file:
+        args.append(seed_file)
+    try:
+        proc = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"type": "result", "ok": False, "file": js_file, "error": "timeout"}
+    message = parse_json_result(proc.stdout)
+    if not message:
+        return {"type": "result", "ok": False, "file": js_file, "error": (proc.stderr or proc.stdout or "no result").strip()[-500:]}
+    message["file"] = js_file
+    return message
+
+def minimize_corpus(js_file, out=None, **kwargs):
+    """하네스 코퍼스(시드 파일 + 네임스페이스)를 커버리지 튜플 합집합을 유지하는 최소 집합으로 줄인다 (cmin)."""
+    return _run_tool(js_file, ["--cmin"] + (["--out", out] if out else []), **kwargs)
+
+def trim_input(js_file, input_path, out=None, **kwargs):
+    """입력 하나를 같은 경로 서명(크래시면 같은 크래시 버킷)을 유지하는 가장 짧은 입력으로 줄인다 (tmin)."""
+    return _run_tool(js_file, ["--tmin", input_path] + (["--out", out] if out else []), **kwargs)
+
+def print_batch_summary(results):
+    print("\n[INFO] - 배치 퍼징 요약")
+    print(f"  {'harness':<45} {'status':<8} {'execs':>8} {'exec/s':>8} {'crash':>6} {'hang':>5} {'slow':>5} {'paths':>6} {'maxcov':>8} {'sink':>8} {'time':>8}")
+    total_execs = 0
+    total_crashes = 0
+    for res in results:
+        stats = res.get("stats") or {}
+        execs = stats.get("totalExecs", 0)
+        total_execs += execs
+        total_crashes += stats.get("uniqueCrashes", 0)
+        rate = execs / res["elapsed"] if res["elapsed"] > 0 else 0.0
+        # time-to-sink (처음 sink 에 도달할 때까지 걸린 시간), 도달하지 못했으면 -
+        tts = stats.get("timeToSinkMs")
+        tts = f"{tts / 1000:.1f}s" if isinstance(tts, (int, float)) else "-"
+        print(f"  {os.path.basename(res['file']):<45} {res['status']:<8} {execs:>8} {rate:>8.1f} "
+              f"{stats.get('uniqueCrashes', 0):>6} {stats.get('hangs', 0):>5} {stats.get('slowInputs', 0):>5} {stats.get('paths', 0):>6} "
+              f"{stats.get('maxCoverage', 0.0):>7.2f}% {tts:>8} {res['elapsed']:>7.1f}s")
+    failed = [r for r in results if r["status"] != "ok"]
+    for res in failed:
+        if res.get("error"):
+            print(f"  [ERR] - {os.path.basename(res['file'])}: {res['error'].splitlines()[-1]}")
+    print(f"  하네스 {len(results)}개, 총 실행 {total_execs}회, 고유 크래시 {total_crashes}개, 실패 {len(failed)}개")
+
+def run_batch_fuzzing(js_files, max_iterations=1000, sink=None, jobs=None, time_budget=None, workers=1,
+                      coverage_mode=None, coverage_backend=None, entry=None, mocks=True, verbose=True,
+                      corpus_root=None, run_id=None, corpus_format="pack", trim_seeds=False, cmin_threshold=None,
+                      schedule=None, exec_timeout=None, objective=None, stats=False, cmplog=True):
+    """여러 하네스를 최대 jobs 개까지 동시에 퍼징하고 요약을 출력한다 (verbose=False 면 결과만 반환).
+
+    긴 배치 실행은 작은 파일이 수없이 생기지 않도록 기본으로 packed 코퍼스(corpus_format="pack")에 쓴다.
+    stats=True 면 하네스마다 <코퍼스 네임스페이스>/stats.jsonl 에 초마다 통계를 남긴다 (coverage.stats_tail 로 읽는다).
+    """
+    report_sinks = {} if sink else load_report_sinks()
+    report_entries = {} if entry else load_report_entries()
+    report_sink_lines = {} if sink else load_report_sink_lines()
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    results = []
+    if verbose:
+        print(f"[INFO] - 하네스 {len(js_files)}개를 동시 {jobs}개씩 퍼징합니다.")
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(fuzz_harness, js_file, max_iterations, sink or sink_for_harness(js_file, report_sinks),
+                            time_budget, workers, coverage_mode, coverage_backend,
+                            entry or entry_for_harness(js_file, report_entries), mocks, corpus_root, run_id,
+                            corpus_format, trim_seeds, cmin_threshold, schedule, exec_timeout, objective,
+                            os.path.join(corpus_namespace(corpus_root or CORPUS_ROOT, js_file, run_id), STATS_NAME) if stats else None,
+                            cmplog, sink_line_for_harness(js_file, report_sink_lines)): js_file
+            for js_file in js_files
+        }
+        for future in as_completed(futures):
+            res = future.result()
+            results.append(res)
+            if not verbose:
+                continue
+            stats = res.get("stats") or {}
+            print(f"Batch fuzzing {res['file']} -> {res['status']} "
+                  f"(execs={stats.get('totalExecs', 0)}, crashes={stats.get('uniqueCrashes', 0)}, {res['elapsed']:.1f}s)")
+    results.sort(key=lambda r: js_files.index(r["file"]))
+    if verbose:
+        print_batch_summary(results)
+    return results
+
+def run_interactive_fuzzing(js_files, sink=None, coverage_backend=None, entry=None, mocks=True, json_output=False,
+                            file_hint=None, corpus_root=None, run_id=None, corpus_format=None):
+    if json_output:
+        # 기계용 출력: 파일을 묻지 않고 (--file 과 정확히 같은 경로가 있으면 그것을) 고르며, stdout 에는 결과 한 줄만 나간다
+        exact = [f for f in js_files if file_hint and os.path.abspath(f) == os.path.abspath(file_hint)]
+        js_file = (exact or js_files)[0]
+    elif len(js_files) > 1:
         print("[INFO] - 대화형 모드에서는 한 번에 하나의 파일만 테스트할 수 있습니다.")
         for i, js_file in enumerate(js_files, 1):
             print(f"  {i}. {js_file}")
@@ -48,19 +298,26 @@ def run_interactive_fuzzing(js_files):
     else:
         js_file = js_files[0]
 
-    print(f"\n대화형 퍼징 시작: {js_file}")
-    print("Ctrl+C로 종료할 수 있습니다.")
+    if not json_output:
+        print(f"\n대화형 퍼징 시작: {js_file}")
+        print("Ctrl+C로 종료할 수 있습니다.")
 
-    seed_file = None
-    base_name = os.path.splitext(os.path.basename(js_file))[0]
-    specific_seed = os.path.join(os.path.dirname(js_file), f"seed_{base_name}.txt")
-    default_seed = os.path.join(os.path.dirname(js_file), "seed.txt")
-    if os.path.exists(specific_seed):
-        seed_file = specific_seed
-    elif os.path.exists(default_seed):
-        seed_file = default_seed
+    seed_file = find_seed_file(js_file)
+    harness_sink = sink or sink_for_harness(js_file, load_report_sinks())
+    harness_entry = entry or entry_for_harness(js_file, load_report_entries())
 
     args = ["node", FUZZER_JS, js_file, MUTATOR_PY, "--interactive"]
+    if harness_sink:
+        args.extend(["--sink", harness_sink])
+    if coverage_backend:
+        args.extend(["--coverage-backend", coverage_backend])
+    if harness_entry:
+        args.extend(["--entry", harness_entry])
+    if not mocks:
+        args.append("--no-mocks")
+    args.extend(_corpus_args(corpus_root, run_id, corpus_format))
+    if json_output:
+        args.append("--json")
     if seed_file:
         args.append(seed_file)
 
@@ -68,39 +325,127 @@ def run_interactive_fuzzing(js_files):
 
 def main():
     parser = argparse.ArgumentParser(description="JavaScript Fuzzing Tool")
-    parser.add_argument("--mode", choices=["batch", "interactive"], 
-                       default="batch", help="퍼징 모드 선택")
+    parser.add_argument("--mode", choices=["batch", "interactive", "cmin", "tmin"],
+                       default="batch", help="퍼징 모드 선택 (cmin: 코퍼스 최소화, tmin: --input 한 개를 트리밍)")
     parser.add_argument("--iterations", type=int, default=1000,
                        help="배치 모드에서 실행할 반복 횟수")
     parser.add_argument("--file", type=str, help="특정 파일만 테스트")
+    parser.add_argument("--sink", type=str, help="sink 이름 (생략 시 report.json 에서 하네스별로 조회)")
+    parser.add_argument("--entry", type=str, help="실행할 export 함수 이름 (생략 시 report.json 의 flow 함수)")
+    parser.add_argument("--jobs", type=int, default=None,
+                       help="배치 모드에서 동시에 퍼징할 하네스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--time-budget", type=float, default=None,
+                       help="배치 모드에서 하네스당 최대 퍼징 시간(초)")
+    parser.add_argument("--workers", type=int, default=1,
+                       help="배치 모드에서 하네스당 worker thread 수")
+    parser.add_argument("--coverage-mode", choices=["precise", "tiered"], default=None,
+                       help="커버리지 수집 방식 (tiered: 배치 단위로 수집하고 못 본 버킷 비트가 남은 곳을 건드렸을 때만 입력별 재실행)")
+    parser.add_argument("--coverage-backend", choices=["inspector", "instrument"], default=None,
+                       help="커버리지 백엔드 (instrument: 하네스 로드 시 블록 카운터를 삽입, inspector 미사용)")
+    parser.add_argument("--no-mocks", action="store_true",
+                       help="child_process/fs/net/http/DB 를 기록용 가짜 대신 실제 모듈로 로드")
+    parser.add_argument("--corpus-root", type=str, default=None,
+                       help="코퍼스 루트 디렉터리 (기본: CORPUS_DIR 또는 coverage/corpus)")
+    parser.add_argument("--run-id", type=str, default=None,
+                       help="코퍼스 네임스페이스 (<루트>/<하네스>/<run id>/). 동시에 도는 실행끼리 겹치지 않게 한다")
+    parser.add_argument("--corpus-format", choices=["files", "pack"], default=None,
+                       help="코퍼스 저장 형식 (files: 입력마다 파일, pack: .pack + .idx 에 모아 씀. 기본: batch=pack, interactive=files)")
+    parser.add_argument("--input", type=str, default=None,
+                       help="tmin 모드에서 줄일 입력 (input_*.txt, crash_*.json 또는 <name>.pack#<n>)")
+    parser.add_argument("--out", type=str, default=None,
+                       help="cmin: 결과 디렉터리 (기본: <코퍼스>/cmin), tmin: 결과 파일 (기본: <입력>.min)")
+    parser.add_argument("--trim-seeds", action="store_true",
+                       help="배치 모드에서 새 경로 입력을 저장하기 전에 트리밍")
+    parser.add_argument("--cmin-threshold", type=int, default=None,
+                       help="배치 모드에서 메모리 시드가 이 개수를 넘으면 최소화 (기본 256, 0 이면 끔)")
+    parser.add_argument("--exec-timeout", type=int, default=None,
+                       help="실행 하나의 데드라인(ms, 기본 2000). 넘긴 입력은 <코퍼스>/hangs 에 저장하고 워커를 다시 띄운다")
+    parser.add_argument("--schedule", choices=["energy", "uniform"], default=None,
+                       help="시드 선택 방식 (energy: 드문 경로/짧고 빠른 입력/최근 성과 가중, uniform: 균등 추첨)")
+    parser.add_argument("--objective", choices=["coverage", "slowness", "sink"], default=None,
+                       help="탐색 목표 (coverage: 새 경로, slowness: 가장 느린 실행을 갱신한 입력도 시드로 삼아 느린 입력 탐색, "
+                            "sink: 리포트 sink 호출 자리에 더 가까이 간 입력을 시드로 삼는 directed 퍼징)")
+    parser.add_argument("--no-cmplog", action="store_true",
+                       help="하네스의 비교 리터럴과 실행 중 includes/startsWith/정규식 피연산자를 변이 사전에 넣지 않는다")
+    parser.add_argument("--stats", action="store_true",
+                       help="하네스마다 <코퍼스>/<하네스>/<run id>/stats.jsonl 에 초마다 통계(exec/s, 지연 시간 백분위)를 남긴다")
+    parser.add_argument("--json", action="store_true",
+                       help="사람용 출력 대신 JSON 결과 한 줄만 출력 (batch: 하네스별 결과, interactive: 페이로드 실행 결과)")
     
     args = parser.parse_args()
 
+    def fail(message):
+        if args.json:
+            print(json.dumps({"type": "result", "mode": args.mode, "ok": False, "error": message}, ensure_ascii=False))
+        else:
+            print(message)
+
     if not TARGET_DIR:
-        print("[ERR] - TARGET_DIR이 설정되지 않았습니다. .env 파일을 확인해주세요.")
+        fail("[ERR] - TARGET_DIR이 설정되지 않았습니다. .env 파일을 확인해주세요.")
         return
 
     cov_checker = CovChecker(TARGET_DIR)
     js_files = cov_checker.js_file_path()
 
     if not js_files:
-        print("[WARN] - 테스트할 JavaScript 파일을 찾을 수 없습니다.")
+        fail("[WARN] - 테스트할 JavaScript 파일을 찾을 수 없습니다.")
         return
 
     if args.file:
         js_files = [f for f in js_files if args.file in f]
         if not js_files:
-            print(f"[WARN] - '{args.file}'과 일치하는 파일을 찾을 수 없습니다.")
+            fail(f"[WARN] - '{args.file}'과 일치하는 파일을 찾을 수 없습니다.")
             return
 
-    print(f"[INFO] - 발견된 JavaScript 파일: {len(js_files)}개")
-    for js_file in js_files:
-        print(f"  - {js_file}")
+    if not args.json:
+        print(f"[INFO] - 발견된 JavaScript 파일: {len(js_files)}개")
+        for js_file in js_files:
+            print(f"  - {js_file}")
 
     if args.mode == "batch":
-        run_batch_fuzzing(js_files, args.iterations)
+        results = run_batch_fuzzing(js_files, args.iterations, sink=args.sink, jobs=args.jobs,
+                                    time_budget=args.time_budget, workers=args.workers, coverage_mode=args.coverage_mode,
+                                    coverage_backend=args.coverage_backend, entry=args.entry, mocks=not args.no_mocks,
+                                    verbose=not args.json, corpus_root=args.corpus_root, run_id=args.run_id,
+                                    corpus_format=args.corpus_format or "pack", trim_seeds=args.trim_seeds,
+                                    cmin_threshold=args.cmin_threshold, schedule=args.schedule,
+                                    exec_timeout=args.exec_timeout, objective=args.objective, stats=args.stats,
+                                    cmplog=not args.no_cmplog)
+        if args.json:
+            print(json.dumps({"type": "result", "mode": "batch", "ok": True, "results": results}, ensure_ascii=False))
+    elif args.mode in ("cmin", "tmin"):
+        if args.mode == "tmin" and not args.input:
+            fail("[ERR] - tmin 모드에는 --input 이 필요합니다.")
+            return
+        report_sinks, report_entries = load_report_sinks(), load_report_entries()
+        results = []
+        for js_file in js_files[:1] if args.mode == "tmin" else js_files:
+            kwargs = dict(sink=args.sink or sink_for_harness(js_file, report_sinks),
+                          entry=args.entry or entry_for_harness(js_file, report_entries),
+                          coverage_backend=args.coverage_backend, mocks=not args.no_mocks,
+                          corpus_root=args.corpus_root, run_id=args.run_id)
+            if args.mode == "cmin":
+                res = minimize_corpus(js_file, out=args.out if len(js_files) == 1 else None, **kwargs)
+            else:
+                res = trim_input(js_file, args.input, out=args.out, **kwargs)
+            results.append(res)
+            if args.json:
+                continue
+            if not res.get("ok"):
+                print(f"[ERR] - {os.path.basename(js_file)}: {res.get('error', 'unknown error')}")
+            elif args.mode == "cmin":
+                print(f"[INFO] - {os.path.basename(js_file)}: {res['kept']}/{res['total']}개 입력 유지 "
+                      f"(튜플 {res['tuples']}개, 중복 {res['duplicates']}개, 크래시 {res['crashed']}개 제외) -> {res['out']}")
+            else:
+                print(f"[INFO] - {os.path.basename(js_file)}: {res['originalLength']} -> {res['length']}자 "
+                      f"({res['behavior']}, 실행 {res['execs']}회) -> {res['out']}")
+        if args.json:
+            print(json.dumps({"type": "result", "mode": args.mode, "ok": all(r.get("ok") for r in results), "results": results},
+                             ensure_ascii=False))
     elif args.mode == "interactive":
-        run_interactive_fuzzing(js_files)
+        run_interactive_fuzzing(js_files, sink=args.sink, coverage_backend=args.coverage_backend,
+                                entry=args.entry, mocks=not args.no_mocks, json_output=args.json, file_hint=args.file,
+                                corpus_root=args.corpus_root, run_id=args.run_id, corpus_format=args.corpus_format)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,225 @@
+import atexit
+import itertools
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+HARNESS_WORKER_JS = os.path.join(os.path.dirname(__file__), "core", "harness_worker.js")
+
+
+class HarnessWorkerError(Exception):
+    """워커가 죽었거나 응답하지 않을 때 발생"""
+
+
+class HarnessTimeout(HarnessWorkerError):
+    """실행 하나가 데드라인을 넘겨 워커를 종료했을 때 발생 (같은 입력을 다시 돌리면 또 멈춘다)"""
+
+
+class HarnessWorker:
+    """하네스 하나를 미리 로드해 둔 상주 node 프로세스 (JSON lines 채널)"""
+
+    def __init__(self, js_file: str, extra_args: Optional[List[str]] = None, node_bin: str = "node",
+                 cwd: Optional[str] = None, startup_timeout: float = 10.0):
+        self.js_file = js_file
+        self.extra_args = list(extra_args or [])
+        self.node_bin = node_bin
+        self.cwd = cwd
+        self.startup_timeout = startup_timeout
+        self.proc: Optional[subprocess.Popen] = None
+        self.execs = 0
+        self._responses: "queue.Queue[dict]" = queue.Queue()
+        self._ids = itertools.count(1)
+
+    def start(self):
+        self.proc = subprocess.Popen(
+            [self.node_bin, HARNESS_WORKER_JS, self.js_file, *self.extra_args],
+            cwd=self.cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        threading.Thread(target=self._reader_loop, daemon=True).start()
+        ready = self._wait_response(self.startup_timeout)
+        if not ready.get("ready"):
+            self.close()
+            raise HarnessWorkerError(f"worker failed to start: {ready.get('error', 'unknown error')}")
+        return self
+
+    def _reader_loop(self):
+        proc = self.proc
+        try:
+            for line in proc.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self._responses.put(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        finally:
+            self._responses.put({"_eof": True})
+
+    def _wait_response(self, timeout: float, error=HarnessWorkerError) -> dict:
+        try:
+            message = self._responses.get(timeout=timeout)
+        except queue.Empty:
+            self.close()
+            raise error(f"worker did not respond within {timeout}s")
+        if message.get("_eof"):
+            self.close()
+            raise HarnessWorkerError("worker exited unexpectedly")
+        return message
+
+    def is_alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def run(self, payload: str, timeout: float = 10.0) -> dict:
+        if not self.is_alive():
+            raise HarnessWorkerError("worker is not running")
+        request_id = next(self._ids)
+        try:
+            self.proc.stdin.write(json.dumps({"id": request_id, "input": payload}) + "\n")
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            self.close()
+            raise HarnessWorkerError(f"worker pipe closed: {e}")
+        deadline = time.time() + timeout
+        while True:
+            message = self._wait_response(max(0.0, deadline - time.time()), error=HarnessTimeout)
+            if message.get("id") == request_id:
+                self.execs += 1
+                return message
+
+    def close(self):
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+class HarnessPool:
+    """의사 하네스별 상주 워커 풀. 죽었거나 멈춘 워커는 폐기하고 새로 띄운다."""
+
+    def __init__(self, workers_per_harness: int = 1, exec_timeout: float = 10.0, node_bin: str = "node",
+                 cwd: Optional[str] = None, max_execs_per_worker: int = 1000):
+        self.workers_per_harness = max(1, workers_per_harness)
+        self.exec_timeout = exec_timeout
+        self.node_bin = node_bin
+        self.cwd = cwd
+        self.max_execs_per_worker = max_execs_per_worker
+        self._lock = threading.Lock()
+        self._idle: Dict[tuple, "queue.Queue[HarnessWorker]"] = {}
+        self._counts: Dict[tuple, int] = {}
+        self._all: List[HarnessWorker] = []
+        atexit.register(self.close)
+
+    def _key(self, js_file: str, extra_args: List[str]) -> tuple:
+        path = os.path.abspath(os.path.join(self.cwd or "", js_file))
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = 0.0
+        # 같은 경로라도 파일이 다시 쓰이면 새 워커를 띄운다
+        return (path, mtime, tuple(extra_args))
+
+    def _acquire(self, key: tuple, js_file: str, extra_args: List[str]) -> HarnessWorker:
+        with self._lock:
+            idle = self._idle.setdefault(key, queue.Queue())
+            try:
+                return idle.get_nowait()
+            except queue.Empty:
+                pass
+            can_spawn = self._counts.get(key, 0) < self.workers_per_harness
+            if can_spawn:
+                self._counts[key] = self._counts.get(key, 0) + 1
+        if can_spawn:
+            worker = HarnessWorker(js_file, extra_args, node_bin=self.node_bin, cwd=self.cwd)
+            try:
+                worker.start()
+            except Exception:
+                self._discard(key, worker)
+                raise
+            with self._lock:
+                self._all.append(worker)
+            return worker
+        try:
+            return idle.get(timeout=self.exec_timeout)
+        except queue.Empty:
+            raise HarnessWorkerError("no idle harness worker available")
+
+    def _discard(self, key: tuple, worker: HarnessWorker):
+        worker.close()
+        with self._lock:
+            self._counts[key] = max(0, self._counts.get(key, 0) - 1)
+            if worker in self._all:
+                self._all.remove(worker)
+
+    def _release(self, key: tuple, worker: HarnessWorker):
+        if not worker.is_alive() or worker.execs >= self.max_execs_per_worker:
+            self._discard(key, worker)
+            return
+        self._idle.setdefault(key, queue.Queue()).put(worker)
+
+    def run(self, js_file: str, payload: str, extra_args: Optional[List[str]] = None,
+            timeout: Optional[float] = None) -> dict:
+        extra_args = list(extra_args or [])
+        key = self._key(js_file, extra_args)
+        worker = self._acquire(key, js_file, extra_args)
+        try:
+            return worker.run(payload, timeout=timeout or self.exec_timeout)
+        except HarnessWorkerError:
+            self._discard(key, worker)
+            raise
+        finally:
+            if worker.proc is not None:
+                self._release(key, worker)
+
+    def run_many(self, js_file: str, payloads: List[str], extra_args: Optional[List[str]] = None,
+                 timeout: Optional[float] = None) -> List[dict]:
+        def _run_one(payload):
+            try:
+                return self.run(js_file, payload, extra_args=extra_args, timeout=timeout)
+            except HarnessWorkerError as e:
+                return {"ok": False, "error": str(e), "hung": isinstance(e, HarnessTimeout)}
+
+        with ThreadPoolExecutor(max_workers=self.workers_per_harness) as executor:
+            return list(executor.map(_run_one, payloads))
+
+    def retire(self, js_file: str, extra_args: Optional[List[str]] = None):
+        """이 하네스/인자 조합의 유휴 워커를 모두 닫는다 (끝난 실행(run)의 워커를 남겨 두지 않는다)."""
+        key = self._key(js_file, list(extra_args or []))
+        workers = []
+        with self._lock:
+            idle = self._idle.pop(key, None)
+            while idle is not None and not idle.empty():
+                workers.append(idle.get_nowait())
+            self._counts[key] = max(0, self._counts.get(key, 0) - len(workers))
+            if not self._counts[key]:
+                del self._counts[key]
+            self._all = [w for w in self._all if w not in workers]
+        for worker in workers:
+            worker.close()
+
+    def close(self):
+        with self._lock:
+            workers, self._all = self._all, []
+            self._idle.clear()
+            self._counts.clear()
+        for worker in workers:
+            worker.close()
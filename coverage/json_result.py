@@ -0,0 +1,23 @@
+import json
+from typing import Optional
+
+# coverage/core/fuzzer_interface.js --json 이 마지막에 한 줄로 내보내는 결과 메시지의 type
+RESULT_TYPE = "result"
+
+
+def parse_json_result(stdout: Optional[str]) -> Optional[dict]:
+    """fuzzer_interface.js --json 출력에서 마지막 result 줄을 찾는다 (없으면 None).
+
+    fuzzer_runner 와 mutator_ai 의 SandboxExecutor 가 같이 쓴다.
+    """
+    for line in reversed((stdout or "").splitlines()):
+        line = line.strip()
+        if not line.startswith("{"):
+            continue
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(message, dict) and message.get("type") == RESULT_TYPE:
+            return message
+    return None
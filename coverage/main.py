@@ -4,6 +4,7 @@ import argparse
 import sys
 from dotenv import load_dotenv
 from coverage.coverage_module import CovChecker
+from coverage.fuzzer_runner import run_batch_fuzzing
 
 load_dotenv()
 
@@ -11,21 +12,6 @@ TARGET_DIR = os.getenv("TARGET_DIR")
 FUZZER_JS = os.path.join(os.path.dirname(__file__), "coverage", "core", "fuzzer_interface.js")
 MUTATOR_PY = os.path.join(os.path.dirname(__file__), "coverage", "core", "mutator.py")
 
-def run_batch_fuzzing(js_files, max_iterations=1000):
-    for js_file in js_files:
-        print(f"Batch fuzzing {js_file}")
-
-        seed_file = None
-        seed_path = os.path.join(os.path.dirname(js_file), "seed.txt")
-        if os.path.exists(seed_path):
-            seed_file = seed_path
-
-        args = ["node", FUZZER_JS, js_file, MUTATOR_PY, "--batch", str(max_iterations)]
-        if seed_file:
-            args.append(seed_file)
-
-        subprocess.run(args)
-
 def run_interactive_fuzzing(js_files):
     if len(js_files) > 1:
         print("[INFO] - 대화형 모드에서는 한 번에 하나의 파일만 테스트할 수 있습니다.")
@@ -67,6 +53,10 @@ def main():
     parser.add_argument("--iterations", type=int, default=1000,
                        help="배치 모드에서 실행할 반복 횟수")
     parser.add_argument("--file", type=str, help="특정 파일만 테스트")
+    parser.add_argument("--jobs", type=int, default=None,
+                       help="배치 모드에서 동시에 퍼징할 하네스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--time-budget", type=float, default=None,
+                       help="배치 모드에서 하네스당 최대 퍼징 시간(초)")
     
     args = parser.parse_args()
 
@@ -92,7 +82,7 @@ def main():
         print(f"  - {js_file}")
 
     if args.mode == "batch":
-        run_batch_fuzzing(js_files, args.iterations)
+        run_batch_fuzzing(js_files, args.iterations, jobs=args.jobs, time_budget=args.time_budget)
     elif args.mode == "interactive":
         run_interactive_fuzzing(js_files)
 
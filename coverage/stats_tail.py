@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+from coverage.corpus_index import Checkpoint
+
+# coverage/core/fuzzer_interface.js --stats-file 이 하네스 코퍼스 디렉터리에 남기는 통계 파일 이름 (fuzzer_runner --stats)
+STATS_NAME = "stats.jsonl"
+# 캠페인이 끝났음을 뜻하는 stage (stopped: 재시작 제한 등으로 반복을 다 돌기 전에 멈춤)
+FINAL_STAGES = ("completed", "stopped")
+
+
+class StatsTail:
+    """fuzzer_interface.js --stats-file 이 초마다 덧붙이는 FuzzingStats JSON 줄을 따라 읽는다.
+
+    CorpusIndex 처럼 (inode, offset) checkpoint 이후의 완성된 줄만 읽으므로 퍼징 중에도 읽을 수 있고,
+    파일이 새로 만들어지면(inode 가 바뀌면) 처음부터 다시 읽는다.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.checkpoint = Checkpoint(0, 0)
+        self.last: Optional[Dict] = None
+
+    def read_new(self) -> List[Dict]:
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return []
+        with f:
+            inode = os.fstat(f.fileno()).st_ino
+            offset = self.checkpoint.offset if self.checkpoint.inode == inode else 0
+            f.seek(offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        self.checkpoint = Checkpoint(inode, offset + end)
+        rows = []
+        for line in data[:end].splitlines():
+            try:
+                row = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(row, dict):
+                rows.append(row)
+        if rows:
+            self.last = rows[-1]
+        return rows
+
+    def latest(self) -> Optional[Dict]:
+        self.read_new()
+        return self.last
+
+    def follow(self, poll: float = 0.5, stop: Optional[Callable[[], bool]] = None) -> Iterator[Dict]:
+        """새 줄을 기다리며 하나씩 돌려준다. stage 가 completed/stopped 인 줄을 넘기면 끝난다."""
+        while True:
+            for row in self.read_new():
+                yield row
+                if row.get("currentStage") in FINAL_STAGES:
+                    return
+            if stop and stop():
+                return
+            time.sleep(poll)
+
+
+def format_stats(row: Dict) -> str:
+    """통계 한 줄을 사람용 한 줄 요약으로 바꾼다 (지연 시간은 ms)."""
+    latency = row.get("latency") or {}
+
+    def ms(stage: str, key: str) -> str:
+        value = (latency.get(stage) or {}).get(key)
+        return f"{value / 1000:.2f}" if isinstance(value, (int, float)) else "-"
+
+    target_ms = (latency.get("target") or {}).get("totalMs") or 0
+    coverage_ms = (latency.get("coverage") or {}).get("totalMs") or 0
+    ratio = f"{coverage_ms / target_ms:.2f}x" if target_ms else "-"
+    tts = row.get("timeToSinkMs")
+    tts = f"{tts / 1000:.1f}s" if isinstance(tts, (int, float)) else "-"
+    distance = row.get("closestDistance")
+    return (f"[{row.get('runtime', '--:--:--')}] execs={row.get('totalExecs', 0)} "
+            f"exec/s={row.get('execsPerSec', 0):.1f} paths={row.get('paths', 0)} crashes={row.get('uniqueCrashes', 0)} "
+            f"hangs={row.get('hangs', 0)} target p50/p95/p99={ms('target', 'p50')}/{ms('target', 'p95')}/{ms('target', 'p99')}ms "
+            f"coverage p99={ms('coverage', 'p99')}ms mutation p99={ms('mutation', 'p99')}ms cov/target={ratio} "
+            f"time-to-sink={tts} sink-distance={distance if distance is not None else '-'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fuzzer_interface.js --stats-file 통계 보기")
+    parser.add_argument("path", help="통계 파일 (예: <코퍼스>/<하네스>/<run id>/stats.jsonl)")
+    parser.add_argument("--follow", "-f", action="store_true", help="퍼징이 끝날 때까지 새 줄을 계속 출력")
+    parser.add_argument("--json", action="store_true", help="요약 대신 통계 JSON 줄을 그대로 출력")
+    args = parser.parse_args()
+
+    tail = StatsTail(args.path)
+    if args.follow:
+        rows = tail.follow()
+    else:
+        latest = tail.latest()
+        if not latest:
+            print(f"[WARN] - 통계가 없습니다: {args.path}")
+            return
+        rows = [latest]
+    for row in rows:
+        print(json.dumps(row, ensure_ascii=False) if args.json else format_stats(row), flush=True)
+
+
+if __name__ == "__main__":
+    main()
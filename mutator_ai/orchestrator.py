@@ -3,9 +3,10 @@ import json
 import os
 import re
 import pathlib
-import glob
+import uuid
 from typing import Dict, Any, List, Optional
 
+from coverage.corpus_index import CorpusIndex, corpus_namespace
 from .data_structures import VulnerabilityContext, AttackResult, AttackAttempt
 from .llm_interface import LLMInterface
 from .payload_generator import PayloadGenerator
@@ -306,15 +307,15 @@ Rules:
             return False
         return bool(re.search(r"(args?|list|array|items|values|options|commands|parameters)", name, re.IGNORECASE))
 
-    def _cleanup_corpus(self):
-        corpus_dir_name = os.getenv("CORPUS_DIR", "coverage/corpus")
-        corpus_dir = pathlib.Path(corpus_dir_name)
-        if corpus_dir.exists():
-            for f in corpus_dir.glob("crash_*.json"):
-                try:
-                    f.unlink()
-                except OSError as e:
-                    print(f"Error removing file {f}: {e}")
+    @staticmethod
+    def _new_run_id() -> str:
+        # 시뮬레이션마다 새 코퍼스 네임스페이스를 쓰므로 다른 리포트의 결과를 지우거나 섞지 않는다
+        return f"{datetime.datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:8]}"
+
+    def _corpus_index(self, pseudo_path: Optional[str], run_id: str) -> Optional[CorpusIndex]:
+        if not pseudo_path:
+            return None
+        return CorpusIndex(corpus_namespace(self.sandbox_executor.corpus_root, pseudo_path, run_id))
 
     @staticmethod
     def _normalize_coverage(value: Any) -> float:
@@ -325,10 +326,31 @@ Rules:
         except (TypeError, ValueError):
             return 0.0
 
+    def _judge_attempt(self, coverage_result: Dict[str, Any]) -> tuple[bool, str]:
+        # 퍼저의 sink 오라클 판정이 있으면 그것을 따른다 (sink 에 도달한 인자를 계열별 술어로 검사한 결과)
+        verdict = coverage_result.get("verdict")
+        if verdict:
+            if verdict.get("exploited"):
+                return True, f"Sink oracle: {verdict.get('reason', 'exploit pattern reached the sink')}"
+            if verdict.get("reached"):
+                return False, f"Sink oracle: {verdict.get('reason', 'sink reached without an exploit pattern')}"
+            return False, f"Sink oracle: payload did not reach the sink '{verdict.get('sink') or 'unknown'}'."
+
+        # 판정이 없으면 (mocks 비활성 등) 예전처럼 stderr 와 이번 실행의 크래시 기록으로 판단한다
+        stderr = (coverage_result.get("stderr") or "").strip()
+        if stderr:
+            return False, f"Execution failed with stderr: {stderr}"
+        crashes = coverage_result.get("crashes") or []
+        if crashes:
+            crash = crashes[-1]
+            bucket = f" (crash bucket {crash['bucket']}, {crash.get('hits', 1)} hits)" if crash.get("bucket") else ""
+            return False, f"Fuzzer reported a crash in function '{crash.get('func', 'unknown')}': {crash.get('message', 'unknown')}{bucket}"
+        return True, "Execution successful with no stderr and no new crashes."
+
     def run_attack_simulation(self, libspear_json: Dict[str, Any], out_path: Optional[str] = None) -> AttackResult:
-        self._cleanup_corpus()
         context = self._parse_libspear_input(libspear_json)
         pseudo_path = self._save_pseudocode_file(context)
+        run_id = self._new_run_id()
 
         result = AttackResult(vulnerability_context=context, status="PENDING")
         last_attempt = None
@@ -338,32 +360,10 @@ Rules:
             print(f"\n--- ATTEMPT {i+1}/{self.max_retries} ---")
             payload = self.payload_generator.generate(context, last_attempt, coverage_rate=last_coverage)
             
-            crash_files_before = set(glob.glob("coverage/corpus/crash_*.json"))
-
-            sim_result = self.sandbox_executor.execute(payload, context, pseudo_path=pseudo_path)
-            
-            crash_files_after = set(glob.glob("coverage/corpus/crash_*.json"))
-            new_crash_files = crash_files_after - crash_files_before
+            sim_result = self.sandbox_executor.execute(payload, context, pseudo_path=pseudo_path, run_id=run_id)
 
             coverage_result = sim_result.get("coverage_result", {})
-            stderr = coverage_result.get("stderr", "").strip()
-            
-            is_successful = not stderr and not new_crash_files
-            analysis_reason = "Execution successful with no stderr and no new crashes."
-
-            if stderr:
-                analysis_reason = f"Execution failed with stderr: {stderr}"
-            elif new_crash_files:
-                try:
-                    latest_crash_file = max(new_crash_files, key=os.path.getctime)
-                    with open(latest_crash_file, 'r') as f:
-                        crash_data = json.load(f)
-                    crash_info = crash_data.get("crashInfo", {})
-                    func_name = crash_info.get("func", "unknown")
-                    error_message = crash_info.get("message", "unknown")
-                    analysis_reason = f"Fuzzer reported a crash in function '{func_name}': {error_message}"
-                except Exception as e:
-                    analysis_reason = f"Fuzzer reported a crash, but could not read details: {e}"
+            is_successful, analysis_reason = self._judge_attempt(coverage_result)
 
             last_coverage = self._normalize_coverage(coverage_result.get("coverage_percent"))
 
@@ -391,13 +391,15 @@ Rules:
             result.status = "FAILED_MAX_RETRIES"
             print("\n--- Attack Simulation FAILED after max retries ---")
 
+        self.sandbox_executor.finish_run(pseudo_path, context, run_id)
         self.save_report(result, out_path=out_path)
         return result
 
     async def run_interactive_simulation(self, libspear_json: Dict[str, Any], out_path: Optional[str] = None) -> AttackResult:
-        self._cleanup_corpus()
         context = self._parse_libspear_input(libspear_json)
         pseudo_path = self._save_pseudocode_file(context)
+        run_id = self._new_run_id()
+        corpus_index = self._corpus_index(pseudo_path, run_id)
 
         result = AttackResult(vulnerability_context=context, status="PENDING")
         last_attempt = None
@@ -412,36 +414,21 @@ Rules:
 
             payload = self.payload_generator.generate(context, last_attempt, coverage_rate=current_coverage_percent)
 
-            crash_files_before = set(glob.glob("coverage/corpus/crash_*.json"))
-            corpus_files_before = set(glob.glob("coverage/corpus/*.js"))
-
-            sim_result = self.sandbox_executor.execute(payload, context, pseudo_path=pseudo_path)
-
-            crash_files_after = set(glob.glob("coverage/corpus/crash_*.json"))
-            new_crash_files = crash_files_after - crash_files_before
-            
-            corpus_files_after = set(glob.glob("coverage/corpus/*.js"))
-            new_corpus_files = corpus_files_after - corpus_files_before
+            checkpoint = corpus_index.checkpoint() if corpus_index else None
+            sim_result = self.sandbox_executor.execute(payload, context, pseudo_path=pseudo_path, run_id=run_id)
 
+            # 새 코퍼스/크래시는 디렉터리를 훑지 않고 이번 실행 네임스페이스의 매니페스트에서 이번 시도 이후 항목만 읽는다
             coverage_result = sim_result.get("coverage_result", {})
-            stderr = coverage_result.get("stderr", "").strip()
-            
-            is_successful = not stderr and not new_crash_files
-            analysis_reason = "Execution successful with no stderr and no new crashes."
-
-            if stderr:
-                analysis_reason = f"Execution failed with stderr: {stderr}"
-            elif new_crash_files:
-                try:
-                    latest_crash_file = max(new_crash_files, key=os.path.getctime)
-                    with open(latest_crash_file, 'r') as f:
-                        crash_data = json.load(f)
-                    crash_info = crash_data.get("crashInfo", {})
-                    func_name = crash_info.get("func", "unknown")
-                    error_message = crash_info.get("message", "unknown")
-                    analysis_reason = f"Fuzzer reported a crash in function '{func_name}': {error_message}"
-                except Exception as e:
-                    analysis_reason = f"Fuzzer reported a crash, but could not read details: {e}"
+            new_entries = []
+            if corpus_index:
+                new_entries, _ = corpus_index.entries_since(checkpoint, kinds=("new-path", "crash"))
+            if new_entries:
+                new_crash_files = [e["path"] for e in new_entries if e.get("kind") == "crash" and e.get("path")]
+                new_corpus_files = [e["path"] for e in new_entries if e.get("kind") == "new-path" and e.get("path")]
+            else:
+                new_crash_files = [c.get("file") for c in coverage_result.get("crashes") or [] if c.get("file")]
+                new_corpus_files = list(coverage_result.get("new_corpus") or [])
+            is_successful, analysis_reason = self._judge_attempt(coverage_result)
 
             current_coverage_percent = self._normalize_coverage(coverage_result.get("coverage_percent"))
             max_coverage = max(max_coverage, current_coverage_percent)
@@ -476,10 +463,11 @@ Rules:
         if result.status == "PENDING":
             result.status = "UNKNOWN_REASON"
 
+        self.sandbox_executor.finish_run(pseudo_path, context, run_id)
         self.save_report(result, out_path=out_path)
         return result
 
-    async def _decide_next_step(self, current_result: AttackResult, max_coverage: float, new_corpus_files: set, new_crash_files: set) -> bool:
+    async def _decide_next_step(self, current_result: AttackResult, max_coverage: float, new_corpus_files: List[str], new_crash_files: List[str]) -> bool:
         print("\n--- AI Decision Point ---")
         last_attempt = current_result.attempts[-1]
         attempt_coverage = self._normalize_coverage(last_attempt.coverage_percent)
@@ -493,7 +481,7 @@ Rules:
         - Reason: {last_attempt.analysis_reason}
         - Current Coverage: {attempt_coverage:.2f}%
         - Max Coverage Achieved: {max_coverage:.2f}%
-        - New Corpus Files Found: {len(new_corpus_files)} ({list(new_corpus_files)})
+        - New Corpus Files Found: {len(new_corpus_files)} ({new_corpus_files})
         - New Crashes Found: {len(new_crash_files)}
         """
 
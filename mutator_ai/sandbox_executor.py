@@ -1,24 +1,49 @@
 import json
+import os
 import subprocess
 import re
 import time
-from typing import Optional
+from typing import Optional, List
 from pathlib import Path
 
+from coverage.corpus_index import DEFAULT_CORPUS_DIR, corpus_namespace, prune_runs, record_hang
+from coverage.json_result import parse_json_result
+from coverage.harness_pool import HarnessPool, HarnessTimeout, HarnessWorkerError
 from .data_structures import VulnerabilityContext
 from .llm_interface import LLMInterface
 
+# CORPUS_KEEP_RUNS 가 없을 때 하네스마다 남기는 실행 네임스페이스 수
+DEFAULT_KEEP_RUNS = 5
+
+
 class SandboxExecutor:
-    def __init__(self, llm_interface: LLMInterface, coverage_cmd: Optional[list] = None, coverage_timeout: int = 10):
+    def __init__(self, llm_interface: LLMInterface, coverage_cmd: Optional[list] = None, coverage_timeout: int = 10,
+                 use_worker_pool: bool = True, workers_per_harness: int = 1, coverage_backend: str = "inspector",
+                 use_mocks: bool = True, corpus_root: Optional[str] = None, keep_runs: Optional[int] = None):
         self.llm = llm_interface
         # fuzzer_runner를 모듈로 실행하도록 변경
         self.base_coverage_cmd = coverage_cmd or ["python3", "-m", "coverage.fuzzer_runner", "--mode", "interactive"]
         self.coverage_timeout = coverage_timeout
+        # "instrument" 면 inspector 대신 로드 시 계측한 블록 카운터로 커버리지를 잰다
+        self.coverage_backend = coverage_backend
+        # False 면 하네스가 실제 child_process/fs/net/http/DB 모듈을 그대로 쓴다
+        self.use_mocks = use_mocks
+        # 하네스는 <corpus_root>/<하네스 이름>/<run_id>/ 에 코퍼스를 쓴다 (run_id 는 execute 마다 받는다)
+        self.corpus_root = os.path.abspath(corpus_root or os.getenv("CORPUS_DIR") or DEFAULT_CORPUS_DIR)
+        # 하네스마다 남길 최근 실행 네임스페이스 수 (finish_run 이 그보다 오래된 것을 지운다, 0 이면 지우지 않음)
+        self.keep_runs = keep_runs if keep_runs is not None else int(os.getenv("CORPUS_KEEP_RUNS", DEFAULT_KEEP_RUNS))
 
         current_file_dir = Path(__file__).resolve().parent
         parent_dir = current_file_dir.parent
         self.default_coverage_cwd = str(parent_dir)
 
+        # 하네스를 미리 로드해 둔 상주 워커 풀 (시도마다 프로세스 3단계를 거치지 않음)
+        self.worker_pool = HarnessPool(
+            workers_per_harness=workers_per_harness,
+            exec_timeout=coverage_timeout,
+            cwd=self.default_coverage_cwd,
+        ) if use_worker_pool else None
+
     def _create_prompt(self, payload: str, context: VulnerabilityContext) -> str:
         return f"""
 You are a security expert and penetration testing simulator.
@@ -59,10 +84,24 @@ Provide your response as a single JSON object with two keys: "simulated_code" an
         except Exception:
             return None
 
-    def _run_coverage_process(self, payload: str, pseudo_path: Optional[str] = None, cwd: Optional[str] = None) -> dict:
+    def _run_coverage_process(self, payload: str, pseudo_path: Optional[str] = None, cwd: Optional[str] = None,
+                              sink: Optional[str] = None, entry: Optional[str] = None, run_id: Optional[str] = None) -> dict:
         cmd = self.base_coverage_cmd[:]
         if pseudo_path:
             cmd.extend(["--file", pseudo_path])
+        if sink:
+            cmd.extend(["--sink", sink])
+        entry = self._entry_name(entry)
+        if entry:
+            cmd.extend(["--entry", entry])
+        if self.coverage_backend != "inspector":
+            cmd.extend(["--coverage-backend", self.coverage_backend])
+        if not self.use_mocks:
+            cmd.append("--no-mocks")
+        cmd.extend(self._corpus_args(run_id))
+
+        # 사람용 요약을 정규식으로 긁지 않고 fuzzer_runner --json 의 결과 한 줄을 그대로 쓴다
+        cmd.append("--json")
 
         try:
             proc = subprocess.run(
@@ -75,53 +114,151 @@ Provide your response as a single JSON object with two keys: "simulated_code" an
                 cwd=cwd,
                 shell=False,
             )
-            stdout = proc.stdout or ""
-            stderr = proc.stderr or ""
-            coverage_pct = None
-            coverage_max = None
-
-            m_current = re.search(r"Current\s+cov\s*:\s*([0-9]+(?:\.[0-9]+)?)\s*%", stdout, re.IGNORECASE)
-            if m_current:
-                try:
-                    coverage_pct = float(m_current.group(1))
-                except Exception:
-                    coverage_pct = None
-
-            m_max = re.search(r"Max\s+coverage\s*:\s*([0-9]+(?:\.[0-9]+)?)\s*%", stdout, re.IGNORECASE)
-            if m_max:
-                try:
-                    coverage_max = float(m_max.group(1))
-                except Exception:
-                    coverage_max = None
-
-            return {
-                "returncode": proc.returncode,
-                "stdout": stdout,
-                "stderr": stderr,
-                "coverage_percent": coverage_pct,
-                "coverage_max": coverage_max,
-                "timestamp": time.time(),
-            }
+            message = parse_json_result(proc.stdout)
+            if message is None:
+                detail = (proc.stderr or proc.stdout or "no result").strip()[-500:]
+                message = {"ok": False, "error": f"no JSON result from fuzzer_runner: {detail}"}
+            result = self._result_to_coverage(message)
+            if result["returncode"] is not None:
+                result["returncode"] = proc.returncode
+            return result
         except subprocess.TimeoutExpired:
+            return self._hang_result(payload, pseudo_path, run_id, f"coverage run timed out after {self.coverage_timeout}s")
+        except Exception as e:
             return {
                 "returncode": None,
                 "stdout": "",
-                "stderr": f"Error: coverage run timed out after {self.coverage_timeout}s",
+                "stderr": f"Error running coverage: {e}",   
                 "coverage_percent": None,
                 "coverage_max": None,
                 "timestamp": time.time(),
             }
-        except Exception as e:
+
+    @staticmethod
+    def _entry_name(function_name: Optional[str]) -> Optional[str]:
+        # ":program" / "unknown_function" 같은 값은 진입 함수로 쓰지 않는다
+        if not function_name or function_name == "unknown_function":
+            return None
+        return function_name if re.match(r"^[A-Za-z_$][\w$.]*$", function_name) else None
+
+    def _corpus_args(self, run_id: Optional[str] = None) -> List[str]:
+        args = ["--corpus-root", self.corpus_root]
+        if run_id:
+            args.extend(["--run-id", run_id])
+        return args
+
+    def _worker_extra_args(self, sink: Optional[str], entry: Optional[str] = None, run_id: Optional[str] = None) -> List[str]:
+        args = ["--sink", sink] if sink else []
+        entry = self._entry_name(entry)
+        if entry:
+            args.extend(["--entry", entry])
+        if self.coverage_backend != "inspector":
+            args.extend(["--coverage-backend", self.coverage_backend])
+        if not self.use_mocks:
+            args.append("--no-mocks")
+        # run_id 가 다르면 워커도 따로 띄워 코퍼스 디렉터리를 공유하지 않는다
+        args.extend(self._corpus_args(run_id))
+        return args
+
+    def _result_to_coverage(self, res: dict) -> dict:
+        """harness_worker 응답이나 fuzzer_interface --json 결과(같은 필드)를 coverage_result 형식으로 바꾼다."""
+        if not res.get("ok"):
+            stderr = f"Error running coverage: {res.get('error', 'unknown error')}"
+            if res.get("stderr"):
+                stderr = f"{stderr}\n{res['stderr']}"
             return {
                 "returncode": None,
-                "stdout": "",
-                "stderr": f"Error running coverage: {e}",   
+                "stdout": res.get("stdout") or "",
+                "stderr": stderr,
                 "coverage_percent": None,
                 "coverage_max": None,
+                "new_corpus": [],
+                "crashes": [],
                 "timestamp": time.time(),
             }
+        coverage_pct = res.get("coverage")
+        coverage_max = res.get("coverageMax")
+        # 기존 fuzzer_interface 출력과 같은 형식의 요약을 실행 로그로 남긴다
+        summary = "\n".join([
+            "Fuzzing completed!",
+            f"Total executions: {res.get('totalExecs', 0)}",
+            f"Unique crashes: {res.get('uniqueCrashes', 0)}",
+            f"Current cov    : {float(coverage_pct or 0):.2f}%",
+            f"Max coverage   : {float(coverage_max or 0):.2f}%",
+        ])
+        stdout = res.get("stdout") or ""
+        return {
+            "returncode": 0,
+            "stdout": f"{stdout}\n\n{summary}" if stdout else summary,
+            "stderr": res.get("stderr") or "",
+            "coverage_percent": coverage_pct,
+            "coverage_max": coverage_max,
+            "exec_ms": res.get("execMs"),
+            "sink_calls": res.get("sinkCalls") or [],
+            "verdict": res.get("verdict"),
+            "new_corpus": res.get("newCorpus") or [],
+            "crashes": res.get("crashes") or [],
+            "timestamp": time.time(),
+        }
+
+    def _hang_result(self, payload: str, pseudo_path: Optional[str], run_id: Optional[str], error: str) -> dict:
+        """데드라인을 넘긴 실행: 입력을 hang 코퍼스에 남기고 커버리지 없는 결과를 돌려준다."""
+        hang_file = None
+        if pseudo_path:
+            try:
+                hang_file, _ = record_hang(corpus_namespace(self.corpus_root, pseudo_path, run_id), pseudo_path, payload,
+                                           timeout_ms=self.coverage_timeout * 1000)
+            except OSError:
+                hang_file = None
+        return {
+            "returncode": None,
+            "stdout": "",
+            "stderr": f"Error: {error}",
+            "coverage_percent": None,
+            "coverage_max": None,
+            "hang": hang_file,
+            "timestamp": time.time(),
+        }
+
+    def _run_in_pool(self, payload: str, pseudo_path: str, sink: Optional[str] = None,
+                     entry: Optional[str] = None, run_id: Optional[str] = None) -> Optional[dict]:
+        try:
+            res = self.worker_pool.run(pseudo_path, payload, extra_args=self._worker_extra_args(sink, entry, run_id))
+        except HarnessTimeout as e:
+            # 멈춘 워커는 이미 종료됐다. fuzzer_runner 로 다시 돌리면 한 번 더 멈추므로 hang 으로 남기고 끝낸다
+            return self._hang_result(payload, pseudo_path, run_id, str(e))
+        except HarnessWorkerError as e:
+            print(f"Harness worker failed, falling back to fuzzer_runner: {e}")
+            return None
+        return self._result_to_coverage(res)
+
+    def run_payloads(self, payloads: List[str], pseudo_path: str, sink: Optional[str] = None,
+                     entry: Optional[str] = None, run_id: Optional[str] = None) -> List[dict]:
+        """여러 후보 페이로드를 워커 풀에서 동시에 실행하고 커버리지 결과를 순서대로 반환"""
+        if not self.worker_pool:
+            return [self._run_coverage_process(p, pseudo_path=pseudo_path, cwd=self.default_coverage_cwd, sink=sink, entry=entry,
+                                               run_id=run_id)
+                    for p in payloads]
+        results = self.worker_pool.run_many(pseudo_path, payloads, extra_args=self._worker_extra_args(sink, entry, run_id))
+        return [self._hang_result(payload, pseudo_path, run_id, res.get("error", "timeout")) if res.get("hung")
+                else self._result_to_coverage(res)
+                for payload, res in zip(payloads, results)]
+
+    def finish_run(self, pseudo_path: Optional[str], context: VulnerabilityContext, run_id: Optional[str] = None):
+        """실행(run)이 끝나면 그 run_id 로 띄운 상주 워커를 닫고, 하네스의 오래된 실행 코퍼스를 정리한다."""
+        if self.worker_pool and pseudo_path:
+            self.worker_pool.retire(pseudo_path, self._worker_extra_args(context.sink, context.function_name, run_id))
+        if pseudo_path and run_id and self.keep_runs > 0:
+            removed = prune_runs(self.corpus_root, pseudo_path, self.keep_runs, current=run_id)
+            if removed:
+                print(f"[INFO] - 오래된 코퍼스 실행 {len(removed)}개를 정리했습니다 (최근 {self.keep_runs}개 유지).")
+
+    def close(self):
+        if self.worker_pool:
+            self.worker_pool.close()
 
-    def execute(self, payload: str, context: VulnerabilityContext, pseudo_path: Optional[str] = None, coverage_cwd: Optional[str] = None) -> dict:
+    def execute(self, payload: str, context: VulnerabilityContext, pseudo_path: Optional[str] = None, coverage_cwd: Optional[str] = None,
+                run_id: Optional[str] = None) -> dict:
         print(f"SIMULATING EXECUTION FOR PAYLOAD VIA LLM: '{payload}'")
 
         prompt = self._create_prompt(payload, context)
@@ -138,7 +275,12 @@ Provide your response as a single JSON object with two keys: "simulated_code" an
             else:
                 simulated_execution_log = llm_response.strip()
 
-        coverage_result = self._run_coverage_process(payload, pseudo_path=pseudo_path, cwd=coverage_cwd)
+        coverage_result = None
+        if self.worker_pool and pseudo_path:
+            coverage_result = self._run_in_pool(payload, pseudo_path, sink=context.sink, entry=context.function_name, run_id=run_id)
+        if coverage_result is None:
+            coverage_result = self._run_coverage_process(payload, pseudo_path=pseudo_path, cwd=coverage_cwd, sink=context.sink,
+                                                         entry=context.function_name, run_id=run_id)
 
         real_exec_log = coverage_result.get("stdout", "") or coverage_result.get("stderr", "")
         if not real_exec_log: